@@ -0,0 +1 @@
+"""Benchmarks for the Multi-Agent Debate bot (run as python -m benchmarks.<name>)."""
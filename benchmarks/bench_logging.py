@@ -0,0 +1,98 @@
+"""
+Benchmark logging overhead per debate on the caller (debate) thread.
+
+Replays the log calls one orchestrated debate makes against a stdout
+that blocks for a configurable time per write, for each logging mode.
+
+Usage:
+    python -m benchmarks.bench_logging [--rounds 10] [--debates 20] [--write-delay-ms 0.2]
+"""
+
+import argparse
+import io
+import sys
+import time
+
+from src.utils.logger import configure_logging, setup_logger, shutdown_logging
+
+EVENT = {
+    "type": "app_mention",
+    "user": "U12345678",
+    "text": "<@U87654321> " + "토론 주제 " * 200,
+    "ts": "1234567890.123456",
+    "channel": "C11111111",
+}
+UTTERANCE = "AgentJamal의 주장입니다. " * 40
+
+
+class SlowStream(io.TextIOBase):
+    """Stream that sleeps on every write to simulate a blocked stdout pipe."""
+
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        time.sleep(self.delay_s)
+        self.writes += 1
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def simulate_debate(logger, rounds: int) -> None:
+    """Issue the log calls of one debate (mention + per-turn logs)."""
+    logger.info(
+        "Received mention | channel: %s | ts: %s | user: %s",
+        EVENT["channel"], EVENT["ts"], EVENT["user"]
+    )
+    logger.debug("Mention payload: %s", EVENT)
+    for round_num in range(1, rounds + 1):
+        logger.info("[Round %d] Starting debate round in thread: %s", round_num, EVENT["ts"])
+        for speaker in ("jamal", "james", "ryan", "james"):
+            logger.info("[%s] Reusing session: %s", speaker, "session-id")
+            logger.info("[%s] Generating response | user: %s | session: %s", speaker, "thread_1", "session-id")
+            logger.info("[POST] Speaker: %s | Message preview: %.50s...", speaker, UTTERANCE)
+            logger.info("[POST] Message sent by bot: %s", speaker)
+
+
+def run_mode(name: str, json_format: bool, async_mode: bool, args) -> float:
+    """Return mean caller-thread milliseconds per debate for a logging mode."""
+    stream = SlowStream(args.write_delay_ms / 1000)
+    original_stdout = sys.stdout
+    sys.stdout = stream
+    try:
+        configure_logging(json_format=json_format, async_mode=async_mode)
+        logger = setup_logger("benchmarks.logging", "INFO")
+        start = time.perf_counter()
+        for _ in range(args.debates):
+            simulate_debate(logger, args.rounds)
+        elapsed = time.perf_counter() - start
+        shutdown_logging()
+    finally:
+        sys.stdout = original_stdout
+        configure_logging()
+
+    per_debate_ms = elapsed / args.debates * 1000
+    print(f"{name:<12} {per_debate_ms:>10.2f} ms/debate   ({stream.writes} lines written)")
+    return per_debate_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Logging overhead per debate")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--debates", type=int, default=20)
+    parser.add_argument("--write-delay-ms", type=float, default=0.2,
+                        help="Simulated stdout latency per write")
+    args = parser.parse_args()
+
+    print(f"{args.debates} debates x {args.rounds} rounds, stdout write delay {args.write_delay_ms} ms")
+    run_mode("sync text", False, False, args)
+    run_mode("sync json", True, False, args)
+    run_mode("async text", False, True, args)
+    run_mode("async json", True, True, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark transcript writes and full-text search over many stored debates.
+
+Fills a temporary TranscriptStore with synthetic debates through the
+background writer, then times searches for rare, common and multi-word
+queries.
+
+Usage:
+    python -m benchmarks.bench_search [--debates 20000] [--rounds 3] [--queries 50]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.load_test import percentile
+from src.orchestrator.transcripts import TranscriptStore
+from src.orchestrator.utterances import Utterance
+
+TOPICS = ["원격 근무", "기본소득", "인공지능 규제", "주 4일제", "원자력 발전", "전기차 보조금", "사교육", "탄소세"]
+WORDS = [
+    "생산성", "비용", "효율", "형평성", "안전", "혁신", "규제", "세금", "고용", "교육", "환경", "성장",
+    "복지", "데이터", "투명성", "책임", "시장", "정부", "기업", "시민", "장기적", "단기적", "위험", "기회"
+]
+SPEAKERS = [("proposal", "jamal"), ("summary", "james"), ("rebuttal", "ryan"), ("check", "james")]
+
+QUERIES = {
+    "rare": lambda rng: f"주제{rng.randrange(1000)}",
+    "common": lambda rng: rng.choice(WORDS),
+    "two words": lambda rng: f"{rng.choice(TOPICS).split()[0]} {rng.choice(WORDS)}",
+}
+
+
+def utterance(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) + rng.choice(["은", "는", "이", "가", "을", "를", ""]) for _ in range(60))
+
+
+def populate(store: TranscriptStore, args, rng: random.Random) -> float:
+    """Write synthetic debates; return seconds until all are on disk."""
+    start = time.perf_counter()
+    for i in range(args.debates):
+        thread_ts = f"{1700000000 + i}.000100"
+        store.start_debate(thread_ts, f"C{i % 20:03d}", f"{rng.choice(TOPICS)} 주제{i % 1000}")
+        for round_num in range(1, args.rounds + 1):
+            for node, speaker in SPEAKERS:
+                store.append(thread_ts, Utterance(round_num, speaker, utterance(rng), node))
+        store.finish_debate(thread_ts, "concluded", args.rounds)
+    store.flush()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Transcript store write and search latency")
+    parser.add_argument("--debates", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=50, help="Searches per query kind")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "transcripts.db")
+        store = TranscriptStore(path)
+        write_s = populate(store, args, rng)
+        rows = args.debates * (args.rounds * len(SPEAKERS) + 1)
+        print(f"{args.debates} debates, {rows} rows written in {write_s:.1f} s ({rows / write_s:,.0f} rows/s)")
+        print(f"Database size: {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+
+        for kind, make_query in QUERIES.items():
+            times = []
+            for _ in range(args.queries):
+                query = make_query(rng)
+                start = time.perf_counter()
+                store.search(query, limit=5)
+                times.append((time.perf_counter() - start) * 1000)
+            print(f"search {kind:<10} p50 {percentile(times, 50):7.2f} ms | p95 {percentile(times, 95):7.2f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
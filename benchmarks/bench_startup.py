@@ -0,0 +1,90 @@
+"""
+Benchmark cold-start cost: import time per module and ADKAgent init cost.
+
+Each measurement runs in a fresh interpreter so module caches don't
+hide import cost.
+
+Usage:
+    python -m benchmarks.bench_startup [--repeat 3] [--json startup.json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+IMPORTS = [
+    "src.config",
+    "src.utils.logger",
+    "slack_sdk",
+    "slack_bolt",
+    "src.bot.slack_handler",
+    "src.llm.adk_agent",
+    "src.orchestrator",
+    "google.adk.runners",
+    "src.agents.jamal.agent",
+]
+
+IMPORT_SNIPPET = """
+import json, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{"ms": (time.perf_counter() - start) * 1000}}))
+"""
+
+INIT_SNIPPET = """
+import json, time
+from src.llm.adk_agent import ADKAgent
+start = time.perf_counter()
+agents = [ADKAgent(api_key="bench-key", role=r, lazy={lazy}) for r in ("proposer", "opposer", "mediator")]
+construct_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+for agent in agents:
+    agent.warm_up()
+warm_up_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"construct_ms": construct_ms, "warm_up_ms": warm_up_ms}}))
+"""
+
+
+def _run(snippet: str) -> Dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", snippet], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _median(samples: List[Dict[str, float]], key: str) -> float:
+    return statistics.median(sample[key] for sample in samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup import and init cost")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    report: Dict[str, Dict[str, float]] = {"imports_ms": {}, "init_ms": {}}
+
+    print("Cold import time (median ms, fresh interpreter):")
+    for module in IMPORTS:
+        samples = [_run(IMPORT_SNIPPET.format(module=module)) for _ in range(args.repeat)]
+        report["imports_ms"][module] = _median(samples, "ms")
+        print(f"  {module:<28} {report['imports_ms'][module]:>8.1f}")
+
+    print("ADKAgent x3 (median ms):")
+    for mode, lazy in (("eager", False), ("lazy", True)):
+        samples = [_run(INIT_SNIPPET.format(lazy=lazy)) for _ in range(args.repeat)]
+        construct = _median(samples, "construct_ms")
+        warm_up = _median(samples, "warm_up_ms")
+        report["init_ms"][mode] = {"construct": construct, "warm_up": warm_up}
+        print(f"  {mode:<6} construct {construct:>8.1f} | warm_up {warm_up:>8.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
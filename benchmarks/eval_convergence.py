@@ -0,0 +1,143 @@
+"""
+Replay the adaptive round controller over recorded debates.
+
+For every finished debate in a transcript database, finds the round the
+controller would have stopped at and reports the agent calls that would
+have been saved. A stop is counted as a possible change of conclusion
+when the recorded conclusion relies on points first raised after that
+round (more than --late-share of its text is only found in later rounds).
+
+Usage:
+    python -m benchmarks.eval_convergence [--db transcripts/transcripts.db] [--limit 1000] [--verbose]
+"""
+
+import argparse
+from typing import Any, Dict, List
+
+from src.config import Config
+from src.orchestrator.convergence import MEDIATOR, RoundController, round_signals, shingles
+from src.orchestrator.debate_flow import CLASSIC_FLOW, FLOWS
+from src.orchestrator.transcripts import TranscriptStore
+from src.orchestrator.utterances import Utterance
+
+# Outcomes whose later rounds were actually run
+EVALUATED_OUTCOMES = ("concluded", "max_rounds")
+
+
+def replay(debate: Dict[str, Any], controller: RoundController, late_share: float = 0.1) -> Dict[str, Any]:
+    """
+    Where the controller would have stopped one recorded debate.
+
+    Args:
+        debate: TranscriptStore.get_transcript result
+        controller: Controller to evaluate
+        late_share: Share of the conclusion's text from later rounds that
+            counts as a changed conclusion
+
+    Returns:
+        thread_ts, rounds, stop_round (None = no early stop), calls,
+        calls_saved, late_share and changed
+    """
+    utterances = [Utterance.from_dict(row) for row in debate["utterances"]]
+    flow = FLOWS.get(debate.get("flow") or CLASSIC_FLOW.name, CLASSIC_FLOW)
+    signals = round_signals(utterances, {node.id for node in flow.nodes if node.update_instruction})
+
+    # A debate's last round ends it anyway, so only earlier rounds can save calls
+    stop_round = None
+    for i in range(len(signals) - 1):
+        if controller.converged(signals[:i + 1]):
+            stop_round = signals[i].round
+            break
+
+    result = {
+        "thread_ts": debate["thread_ts"],
+        "rounds": signals[-1].round if signals else 0,
+        "stop_round": stop_round,
+        "calls": len(utterances),
+        "calls_saved": 0,
+        "late_share": 0.0,
+        "changed": False
+    }
+    if stop_round is None:
+        return result
+
+    later = [u for u in utterances if u.round > stop_round]
+    # James's closing turn replaces the skipped rounds
+    result["calls_saved"] = max(len(later) - 1, 0)
+
+    conclusion = debate.get("conclusion") or next(
+        (u.text for u in reversed(utterances) if u.speaker == MEDIATOR), ""
+    )
+    conclusion_grams = shingles(conclusion)
+    if conclusion_grams:
+        earlier = shingles("\n".join(u.text for u in utterances if u.round <= stop_round))
+        late = shingles("\n".join(u.text for u in later if u.text != conclusion)) - earlier
+        result["late_share"] = len(conclusion_grams & late) / len(conclusion_grams)
+        result["changed"] = result["late_share"] > late_share
+    return result
+
+
+def evaluate(debates: List[Dict[str, Any]], controller: RoundController, late_share: float = 0.1) -> Dict[str, Any]:
+    """
+    Replay the controller over many debates.
+
+    Returns:
+        Totals (debates, stopped, calls, calls_saved, changed) and per-debate results
+    """
+    results = [replay(debate, controller, late_share) for debate in debates]
+    return {
+        "debates": len(results),
+        "stopped": sum(1 for r in results if r["stop_round"] is not None),
+        "calls": sum(r["calls"] for r in results),
+        "calls_saved": sum(r["calls_saved"] for r in results),
+        "changed": sum(1 for r in results if r["changed"]),
+        "results": results
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calls saved vs. conclusions changed by adaptive rounds")
+    parser.add_argument("--db", default=Config.TRANSCRIPT_DB, help="Transcript database")
+    parser.add_argument("--limit", type=int, default=1000, help="Most recent debates to evaluate")
+    parser.add_argument("--min-rounds", type=int, default=Config.ADAPTIVE_MIN_ROUNDS)
+    parser.add_argument("--novelty-threshold", type=float, default=Config.ADAPTIVE_NOVELTY_THRESHOLD)
+    parser.add_argument("--drift-threshold", type=float, default=Config.ADAPTIVE_DRIFT_THRESHOLD)
+    parser.add_argument("--patience", type=int, default=Config.ADAPTIVE_PATIENCE)
+    parser.add_argument("--late-share", type=float, default=0.1,
+                        help="Conclusion share from later rounds counted as a changed conclusion")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print every stopped debate")
+    args = parser.parse_args()
+
+    controller = RoundController(
+        min_rounds=args.min_rounds,
+        novelty_threshold=args.novelty_threshold,
+        drift_threshold=args.drift_threshold,
+        patience=args.patience
+    )
+    store = TranscriptStore(args.db)
+    try:
+        debates = []
+        for row in store.list_debates(limit=args.limit):
+            if row["outcome"] in EVALUATED_OUTCOMES:
+                debates.append(store.get_transcript(row["thread_ts"]))
+    finally:
+        store.close()
+
+    report = evaluate(debates, controller, args.late_share)
+    if args.verbose:
+        for r in report["results"]:
+            if r["stop_round"] is not None:
+                print(
+                    f"{r['thread_ts']}: stop after round {r['stop_round']}/{r['rounds']}, "
+                    f"{r['calls_saved']} calls saved, late share {r['late_share']:.0%}"
+                    + (" (conclusion changed)" if r["changed"] else "")
+                )
+    saved_pct = report["calls_saved"] / report["calls"] * 100 if report["calls"] else 0.0
+    print(f"Debates evaluated : {report['debates']}")
+    print(f"Stopped early     : {report['stopped']}")
+    print(f"Agent calls saved : {report['calls_saved']} of {report['calls']} ({saved_pct:.1f}%)")
+    print(f"Conclusions changed: {report['changed']} of {report['stopped']} early stops")
+
+
+if __name__ == "__main__":
+    main()
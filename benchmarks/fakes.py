@@ -0,0 +1,190 @@
+"""Local stand-ins for the Slack Web API and the Gemini model used by benchmarks."""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import AsyncGenerator, Dict, Optional
+from urllib.parse import parse_qs
+
+from google.adk import Agent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+
+from src.llm.agent_roles import AGENT_INSTRUCTIONS, AGENT_NAMES
+
+TERMINATION_TEXT = "토론을 종료합니다. 양측 의견을 종합한 결론입니다."
+CHECK_PROMPT_MARKER = "합의가 이루어졌거나"
+
+
+@dataclass
+class LatencyModel:
+    """Latency / error distribution for a fake dependency."""
+
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    def sample_seconds(self, rng: random.Random) -> float:
+        """Draw a latency (normal around mean, clipped at 0)."""
+        if self.mean_ms <= 0 and self.jitter_ms <= 0:
+            return 0.0
+        return max(rng.gauss(self.mean_ms, self.jitter_ms), 0.0) / 1000
+
+    def should_fail(self, rng: random.Random) -> bool:
+        """Draw whether this call fails."""
+        return self.error_rate > 0 and rng.random() < self.error_rate
+
+
+class FakeSlackServer:
+    """
+    Minimal Slack Web API over HTTP on localhost.
+
+    Answers auth.test, chat.postMessage, reactions.add/remove and any other
+    method with {"ok": true}. Latency and errors follow a LatencyModel.
+    """
+
+    def __init__(self, latency: Optional[LatencyModel] = None, seed: int = 0) -> None:
+        self.latency = latency or LatencyModel()
+        self.calls: Dict[str, int] = {}
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._ts_counter = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to WebClient(base_url=...)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def _handle(self, method: str, params: Dict[str, str]) -> Dict:
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            delay = self.latency.sample_seconds(self._rng)
+            fail = self.latency.should_fail(self._rng)
+            self._ts_counter += 1
+            ts = f"{time.time():.0f}.{self._ts_counter:06d}"
+            if fail:
+                self.errors += 1
+        time.sleep(delay)
+
+        if fail:
+            return {"ok": False, "error": "internal_error"}
+        if method == "auth.test":
+            return {"ok": True, "user_id": "UFAKEBOT", "bot_id": "BFAKEBOT", "team_id": "TFAKE"}
+        if method == "chat.postMessage":
+            return {
+                "ok": True,
+                "channel": params.get("channel"),
+                "ts": ts,
+                "message": {"text": params.get("text", ""), "username": "fake-bot", "ts": ts}
+            }
+        return {"ok": True}
+
+    def start(self) -> "FakeSlackServer":
+        """Start serving on a free localhost port."""
+        fake = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Real Slack edge servers don't delay small keep-alive responses
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:
+                method = self.path.rsplit("/", 1)[-1]
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length).decode("utf-8") if length else ""
+                if self.headers.get("Content-Type", "").startswith("application/json"):
+                    params = json.loads(raw or "{}")
+                else:
+                    params = {k: v[0] for k, v in parse_qs(raw).items()}
+
+                body = json.dumps(fake._handle(method, params)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="fake-slack", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+class FakeLlm(BaseLlm):
+    """
+    ADK model that sleeps per a LatencyModel and returns canned text.
+
+    The mediator's termination check concludes once the prompt shows
+    `rounds` completed AgentRyan turns, so debates have a fixed length.
+    """
+
+    latency: LatencyModel = LatencyModel()
+    rounds: int = 3
+    response_chars: int = 400
+    seed: int = 0
+
+    def model_post_init(self, __context) -> None:
+        self._rng = random.Random(self.seed)
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        prompt = ""
+        if llm_request.contents and llm_request.contents[-1].parts:
+            prompt = llm_request.contents[-1].parts[0].text or ""
+
+        await asyncio.sleep(self.latency.sample_seconds(self._rng))
+        if self.latency.should_fail(self._rng):
+            raise RuntimeError("fake model error")
+
+        if CHECK_PROMPT_MARKER in prompt and prompt.count("AgentRyan:") >= self.rounds:
+            text = TERMINATION_TEXT
+        else:
+            text = ("가짜 모델 응답입니다. " * (self.response_chars // 12 + 1))[:self.response_chars]
+
+        prompt_tokens = sum(
+            len(part.text or "") for content in llm_request.contents for part in (content.parts or [])
+        ) // 4
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part.from_text(text=text)]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=len(text) // 4,
+                total_token_count=prompt_tokens + len(text) // 4
+            )
+        )
+
+
+def build_fake_agent(role: str, model: FakeLlm) -> Agent:
+    """
+    Build an ADK agent for a role backed by a fake model (no tools).
+
+    Args:
+        role: Agent role (proposer, opposer, mediator)
+        model: FakeLlm instance
+
+    Returns:
+        ADK Agent
+    """
+    return Agent(
+        name=AGENT_NAMES[role],
+        model=model,
+        instruction=AGENT_INSTRUCTIONS[role],
+        description=f"{AGENT_NAMES[role]} - fake {role} for benchmarks"
+    )
@@ -0,0 +1,251 @@
+"""
+End-to-end load test: SlackBot + DebateOrchestrator + ADKAgent against local fakes.
+
+Mentions are dispatched straight into the Bolt app (as Socket Mode would),
+debates run through the real orchestrator and ADK runners, models are
+FakeLlm instances and all Slack Web API calls go to a local FakeSlackServer.
+
+Usage:
+    python -m benchmarks.load_test --debates 50 --rate 10 --rounds 3 \\
+        --llm-latency-ms 300 --llm-jitter-ms 100 --slack-latency-ms 40 --json run.json
+"""
+
+import argparse
+import json
+import logging
+import random
+import resource
+import threading
+import time
+from typing import Dict, List, Optional
+
+from slack_bolt.request import BoltRequest
+from slack_sdk import WebClient
+
+from benchmarks.fakes import FakeLlm, FakeSlackServer, LatencyModel, build_fake_agent
+from src.bot.message_processor import MessageProcessor
+from src.bot.slack_handler import SlackBot
+from src.llm.adk_agent import ADKAgent
+from src.llm.usage import UsageTracker
+from src.orchestrator import DebateOrchestrator, get_flow
+from src.utils.http_transport import HTTP_REQUESTS, HttpTransport
+from src.utils.tracing import InMemoryExporter, configure_tracing, latency_breakdown
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for empty input)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class ResourceSampler:
+    """Samples thread count in the background; reads peak RSS at the end."""
+
+    def __init__(self, interval_s: float = 0.05) -> None:
+        self.interval_s = interval_s
+        self.peak_threads = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+
+    def start(self) -> "ResourceSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Dict[str, float]:
+        self._stop.set()
+        self._thread.join()
+        # ru_maxrss is KiB on Linux
+        return {
+            "peak_threads": self.peak_threads,
+            "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        }
+
+
+def mention_body(index: int, ts: str) -> Dict:
+    """Build an Events API envelope for an app_mention."""
+    return {
+        "type": "event_callback",
+        "team_id": "TFAKE",
+        "api_app_id": "AFAKE",
+        "event_id": f"Ev{index:08d}",
+        "event_time": int(time.time()),
+        "event": {
+            "type": "app_mention",
+            "user": "UHUMAN",
+            "text": f"<@UFAKEBOT> 토론 주제 #{index}: 원격 근무는 생산성을 높이는가?",
+            "ts": ts,
+            "channel": "CLOADTEST",
+            "event_ts": ts
+        }
+    }
+
+
+def build_pipeline(args, slack: FakeSlackServer):
+    """Wire SlackBot + DebateOrchestrator + ADKAgents against the fakes."""
+    usage_tracker = UsageTracker()
+    llm_latency = LatencyModel(args.llm_latency_ms, args.llm_jitter_ms, args.llm_error_rate)
+
+    agents = {}
+    for seed, role in enumerate(("proposer", "opposer", "mediator")):
+        model = FakeLlm(model="fake-llm", latency=llm_latency, rounds=args.rounds, seed=args.seed + seed)
+        agents[role] = ADKAgent(
+            api_key="fake-key",
+            role=role,
+            usage_tracker=usage_tracker,
+            root_agent=build_fake_agent(role, model)
+        )
+
+    # Shared keep-alive pool (as in production) unless --no-pool
+    transport = None if args.no_pool else HttpTransport()
+
+    def _client() -> WebClient:
+        if transport is not None:
+            return transport.slack_client(token="xoxb-fake", base_url=slack.base_url)
+        return WebClient(token="xoxb-fake", base_url=slack.base_url)
+
+    orchestrator = DebateOrchestrator(
+        jamal_client=_client(),
+        ryan_client=_client(),
+        james_client=_client(),
+        jamal_agent=agents["proposer"],
+        ryan_agent=agents["opposer"],
+        james_agent=agents["mediator"],
+        max_rounds=args.rounds + 2,
+        usage_tracker=usage_tracker,
+        flow=get_flow(args.flow)
+    )
+    bot = SlackBot(
+        message_processor=MessageProcessor(agents["proposer"]),
+        debate_orchestrator=orchestrator,
+        client=_client()
+    )
+    return bot, usage_tracker
+
+
+def run(args) -> Dict:
+    """Run one load test and return the report."""
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    exporter = InMemoryExporter()
+    configure_tracing(exporter)
+    slack = FakeSlackServer(
+        LatencyModel(args.slack_latency_ms, args.slack_jitter_ms, args.slack_error_rate), seed=args.seed
+    ).start()
+    rng = random.Random(args.seed)
+
+    try:
+        bot, usage_tracker = build_pipeline(args, slack)
+        connections_before = {c: HTTP_REQUESTS.get(pool="slack", connection=c) for c in ("new", "reused")}
+        sampler = ResourceSampler().start()
+
+        ack_ms: List[float] = []
+        start = time.perf_counter()
+        for i in range(args.debates):
+            ts = f"{int(time.time())}.{i:06d}"
+            dispatch_start = time.perf_counter()
+            bot.app.dispatch(BoltRequest(body=mention_body(i, ts), mode="socket_mode"))
+            ack_ms.append((time.perf_counter() - dispatch_start) * 1000)
+            if args.rate > 0:
+                time.sleep(rng.expovariate(args.rate))
+
+        deadline = time.monotonic() + args.timeout
+        while len(exporter.get_spans("debate")) < args.debates and time.monotonic() < deadline:
+            time.sleep(0.05)
+        wall_s = time.perf_counter() - start
+        resources = sampler.stop()
+        slack_connections = {
+            c: int(HTTP_REQUESTS.get(pool="slack", connection=c) - before)
+            for c, before in connections_before.items()
+        }
+    finally:
+        slack.stop()
+        configure_tracing(InMemoryExporter())
+        logging.disable(logging.NOTSET)
+
+    spans = [span.to_dict() for span in exporter.spans]
+    debate_ms = [span["duration_ms"] for span in spans if span["name"] == "debate"]
+    completed = len(debate_ms)
+    usage = usage_tracker.snapshot()["channels"].get("CLOADTEST", {})
+
+    return {
+        "config": vars(args),
+        "completed_debates": completed,
+        "wall_seconds": wall_s,
+        "debates_per_minute": completed / wall_s * 60 if wall_s else 0.0,
+        "debate_latency_ms": {
+            "p50": percentile(debate_ms, 50),
+            "p95": percentile(debate_ms, 95),
+            "p99": percentile(debate_ms, 99),
+            "max": max(debate_ms) if debate_ms else 0.0
+        },
+        "ack_latency_ms": {"p50": percentile(ack_ms, 50), "p95": percentile(ack_ms, 95)},
+        "stages": latency_breakdown(spans),
+        "slack_calls": dict(slack.calls),
+        "slack_errors": slack.errors,
+        "slack_connections": slack_connections,
+        "tokens": usage,
+        **resources
+    }
+
+
+def print_report(report: Dict) -> None:
+    """Print a human-readable summary."""
+    print(f"Completed debates : {report['completed_debates']}/{report['config']['debates']}")
+    print(f"Wall time         : {report['wall_seconds']:.2f} s")
+    print(f"Throughput        : {report['debates_per_minute']:.1f} debates/min")
+    lat = report["debate_latency_ms"]
+    print(f"Debate latency    : p50 {lat['p50']:.0f} ms | p95 {lat['p95']:.0f} ms | p99 {lat['p99']:.0f} ms")
+    ack = report["ack_latency_ms"]
+    print(f"Mention ack       : p50 {ack['p50']:.1f} ms | p95 {ack['p95']:.1f} ms")
+    print(f"Peak threads      : {report['peak_threads']}")
+    print(f"Max RSS           : {report['max_rss_mb']:.1f} MB")
+    print(f"Slack calls       : {report['slack_calls']} (errors: {report['slack_errors']})")
+    conns = report["slack_connections"]
+    if report["config"]["no_pool"]:
+        print("Slack connections : not pooled (one per request)")
+    else:
+        print(f"Slack connections : {conns['new']} opened, {conns['reused']} requests on reused connections")
+    print("Stage breakdown (ms):")
+    for name, stats in sorted(report["stages"].items()):
+        print(f"  {name:<24} n={stats['count']:<6} p50={stats['p50_ms']:<9.1f} p95={stats['p95_ms']:.1f}")
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="End-to-end debate load test with local fakes")
+    parser.add_argument("--debates", type=int, default=20, help="Number of mentions to send")
+    parser.add_argument("--rate", type=float, default=5.0, help="Mean mentions/second (0 = all at once)")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds before the fake mediator concludes")
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0)
+    parser.add_argument("--llm-jitter-ms", type=float, default=50.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--slack-latency-ms", type=float, default=30.0)
+    parser.add_argument("--slack-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--slack-error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds to wait for debates to finish")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--flow", default="classic", help="Debate flow (classic, panel)")
+    parser.add_argument("--no-pool", action="store_true", help="Use per-request urllib Slack clients")
+    parser.add_argument("--json", help="Write the report to this file for run-to-run comparison")
+    parser.add_argument("--verbose", action="store_true", help="Keep INFO logs")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    report = run(args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Offline batch runner: debate a list of topics without Slack, results as JSONL.
+
+Usage:
+    python -m src.batch_debate topics.txt --output results.jsonl --concurrency 8
+
+Each non-empty line of the topics file (``-`` = stdin) is one debate;
+lines starting with ``#`` are ignored. Results are written one JSON
+object per line as each debate finishes (not in input order), so long
+batches can be followed with ``tail -f``. Throughput is printed to
+stderr at the end.
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+from src.config import Config
+from src.llm.usage import UsageTracker
+from src.orchestrator import DebateOrchestrator
+from src.orchestrator.factory import build_http_transport, build_orchestrator, build_usage_tracker
+from src.utils.logger import configure_logging, setup_logger, shutdown_logging
+
+logger = setup_logger(__name__, Config.LOG_LEVEL)
+
+BATCH_CHANNEL = "batch"
+BATCH_USER = "batch"
+
+
+class TranscriptSink:
+    """
+    Collects what the orchestrator would have posted to Slack, per thread.
+
+    client(speaker) returns a stand-in for that agent's WebClient.
+    """
+
+    def __init__(self) -> None:
+        self._transcripts: Dict[str, List[Dict[str, str]]] = {}
+        self._ts = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def client(self, speaker: str) -> "SinkClient":
+        """Build a client that records posts as `speaker`."""
+        return SinkClient(self, speaker)
+
+    def record(self, thread_ts: str, speaker: str, text: str) -> str:
+        """
+        Append a post to a thread's transcript.
+
+        Returns:
+            A unique message ts
+        """
+        with self._lock:
+            self._transcripts.setdefault(thread_ts, []).append({"speaker": speaker, "text": text})
+            return f"sink.{next(self._ts):06d}"
+
+    def pop(self, thread_ts: str) -> List[Dict[str, str]]:
+        """Remove and return a thread's transcript."""
+        with self._lock:
+            return self._transcripts.pop(thread_ts, [])
+
+
+class SinkClient:
+    """Implements the one WebClient call the orchestrator makes, without Slack."""
+
+    def __init__(self, sink: TranscriptSink, speaker: str) -> None:
+        self.sink = sink
+        self.speaker = speaker
+
+    def chat_postMessage(self, channel: str, text: str, thread_ts: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        ts = self.sink.record(thread_ts or channel, self.speaker, text)
+        return {"ok": True, "channel": channel, "ts": ts, "message": {"username": self.speaker, "text": text}}
+
+
+def read_topics(lines: Iterable[str]) -> List[str]:
+    """Return non-empty, non-comment lines, stripped."""
+    topics = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            topics.append(line)
+    return topics
+
+
+def run_batch(
+    orchestrator: DebateOrchestrator,
+    sink: TranscriptSink,
+    topics: List[str],
+    out: TextIO,
+    concurrency: int = 4,
+    usage_tracker: Optional[UsageTracker] = None
+) -> Dict[str, Any]:
+    """
+    Run one debate per topic, at most `concurrency` at a time.
+
+    Args:
+        orchestrator: Orchestrator whose clients post to `sink`
+        sink: TranscriptSink collecting the debates' messages
+        topics: Debate topics
+        out: Stream receiving one JSON result per line
+        concurrency: Max debates running at once
+        usage_tracker: Tracker shared with the agents (adds tokens to results)
+
+    Returns:
+        Summary: debates, outcomes, wall_seconds, debates_per_minute, tokens
+    """
+    outcomes: Dict[str, int] = {}
+    total_tokens = 0
+    start = time.perf_counter()
+
+    def _run_one(index: int, topic: str) -> Dict[str, Any]:
+        thread_ts = f"batch-{index:06d}"
+        debate_start = time.perf_counter()
+        outcome = orchestrator.run_debate(BATCH_CHANNEL, thread_ts, topic, BATCH_USER)
+        result = {
+            "index": index,
+            "topic": topic,
+            "outcome": outcome,
+            "duration_s": round(time.perf_counter() - debate_start, 3),
+            "messages": sink.pop(thread_ts)
+        }
+        if usage_tracker is not None:
+            result["usage"] = usage_tracker.get_debate_usage(thread_ts).to_dict()
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="batch-debate") as pool:
+        futures = [pool.submit(_run_one, index, topic) for index, topic in enumerate(topics)]
+        for future in as_completed(futures):
+            result = future.result()
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+            outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+            total_tokens += result.get("usage", {}).get("total_tokens", 0)
+
+    wall_s = time.perf_counter() - start
+    return {
+        "debates": len(topics),
+        "outcomes": outcomes,
+        "wall_seconds": wall_s,
+        "debates_per_minute": len(topics) / wall_s * 60 if wall_s else 0.0,
+        "tokens": total_tokens
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Run debates over a list of topics without Slack")
+    parser.add_argument("topics", help="File with one topic per line (- = stdin)")
+    parser.add_argument("--output", "-o", default="-", help="JSONL output file (- = stdout)")
+    parser.add_argument("--concurrency", "-c", type=int, default=4, help="Max debates running at once")
+    parser.add_argument("--max-rounds", type=int, default=Config.DEBATE_MAX_ROUNDS)
+    parser.add_argument("--flow", default=Config.DEBATE_FLOW, help="Debate flow (classic, panel)")
+    args = parser.parse_args(argv)
+
+    configure_logging(json_format=Config.LOG_FORMAT == "json")
+    try:
+        if not Config.GOOGLE_GENAI_API_KEY and Config.CASSETTE_MODE != "replay":
+            logger.error("GOOGLE_GENAI_API_KEY (or CASSETTE_MODE=replay) is required")
+            return 1
+
+        if args.topics == "-":
+            topics = read_topics(sys.stdin)
+        else:
+            with open(args.topics, encoding="utf-8") as f:
+                topics = read_topics(f)
+
+        usage_tracker = build_usage_tracker()
+        http_transport = build_http_transport()
+        sink = TranscriptSink()
+        orchestrator = build_orchestrator(
+            sink.client("jamal"), sink.client("ryan"), sink.client("james"),
+            usage_tracker=usage_tracker,
+            http_transport=http_transport,
+            max_rounds=args.max_rounds,
+            flow=args.flow
+        )
+
+        out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+        try:
+            summary = run_batch(orchestrator, sink, topics, out, args.concurrency, usage_tracker)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+            if http_transport is not None:
+                http_transport.close()
+
+        print(
+            f"Debates    : {summary['debates']} {summary['outcomes']}\n"
+            f"Wall time  : {summary['wall_seconds']:.2f} s (concurrency {args.concurrency})\n"
+            f"Throughput : {summary['debates_per_minute']:.1f} debates/min\n"
+            f"Tokens     : {summary['tokens']:,}",
+            file=sys.stderr
+        )
+        return 0
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Per-thread debounce of rapid-fire mentions."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+
+logger = setup_logger(__name__)
+
+MENTIONS_COALESCED = REGISTRY.counter(
+    "slack_mentions_coalesced_total", "Mentions merged into a pending mention from the same user and thread"
+)
+MENTION_BATCH_SIZE = REGISTRY.histogram(
+    "slack_mention_batch_size", "Mentions handled together after the debounce window", buckets=(1, 2, 3, 4, 5, 8)
+)
+
+
+class _Batch:
+    __slots__ = ("items", "first_at", "generation", "timer")
+
+    def __init__(self, item: Any) -> None:
+        self.items: List[Any] = [item]
+        self.first_at = time.monotonic()
+        self.generation = 0
+        self.timer: Optional[threading.Timer] = None
+
+
+class MentionDebouncer:
+    """
+    Holds mentions for a short window and hands each key's mentions over together.
+
+    Every new mention for a key restarts its window, so a burst of
+    messages is handled once, window_ms after the last of them; a burst
+    never waits more than max_wait_ms after its first mention. The
+    handler runs on a timer thread.
+    """
+
+    def __init__(
+        self,
+        window_ms: int,
+        handler: Callable[[List[Any]], None],
+        max_wait_ms: Optional[int] = None
+    ) -> None:
+        """
+        Initialize MentionDebouncer.
+
+        Args:
+            window_ms: Quiet time after the last mention before handling
+            handler: Called with a key's mentions, oldest first
+            max_wait_ms: Longest a first mention waits (default 3 × window_ms)
+        """
+        self.window_s = window_ms / 1000
+        self.max_wait_s = (max_wait_ms if max_wait_ms is not None else 3 * window_ms) / 1000
+        self.handler = handler
+        self._batches: Dict[Hashable, _Batch] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: Hashable, item: Any) -> bool:
+        """
+        Add a mention to its key's pending batch (starting one if needed).
+
+        Args:
+            key: Batch key (e.g., channel, thread and user)
+            item: What the handler receives for this mention
+
+        Returns:
+            True if the mention started a new batch, False if it was merged
+        """
+        with self._lock:
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _Batch(item)
+                delay = self.window_s
+            else:
+                batch.items.append(item)
+                batch.timer.cancel()
+                MENTIONS_COALESCED.inc()
+                delay = min(self.window_s, max(batch.first_at + self.max_wait_s - time.monotonic(), 0.0))
+            batch.generation += 1
+            batch.timer = threading.Timer(delay, self._flush, args=(key, batch.generation))
+            batch.timer.daemon = True
+            batch.timer.start()
+            return len(batch.items) == 1
+
+    def discard(self, key: Hashable) -> bool:
+        """
+        Drop a key's pending mentions without handling them.
+
+        Returns:
+            True if there was a pending batch
+        """
+        with self._lock:
+            batch = self._batches.pop(key, None)
+        if batch is None:
+            return False
+        batch.timer.cancel()
+        return True
+
+    def keys(self) -> List[Hashable]:
+        """Keys with mentions waiting."""
+        with self._lock:
+            return list(self._batches)
+
+    def flush(self) -> int:
+        """
+        Handle every pending batch now, on the calling thread (e.g., at shutdown).
+
+        Returns:
+            Number of batches handled
+        """
+        with self._lock:
+            batches = list(self._batches.values())
+            self._batches.clear()
+        for batch in batches:
+            batch.timer.cancel()
+            self._handle(batch)
+        return len(batches)
+
+    def _flush(self, key: Hashable, generation: int) -> None:
+        with self._lock:
+            batch = self._batches.get(key)
+            # A newer mention re-armed the window (or the batch was flushed/discarded)
+            if batch is None or batch.generation != generation:
+                return
+            del self._batches[key]
+        self._handle(batch)
+
+    def _handle(self, batch: _Batch) -> None:
+        MENTION_BATCH_SIZE.observe(len(batch.items))
+        try:
+            self.handler(batch.items)
+        except Exception as e:
+            logger.error("Error handling debounced mentions: %s", e, exc_info=True)
@@ -1,12 +1,21 @@
 """Message processing logic."""
 
 import re
+import time
 from typing import Optional, Dict
 from src.utils.logger import setup_logger
 from src.config import Config
+from src.utils.metrics import REGISTRY
 
 logger = setup_logger(__name__, Config.LOG_LEVEL)
 
+PROCESS_SECONDS = REGISTRY.histogram(
+    "message_process_duration_seconds", "Latency of MessageProcessor.process_message"
+)
+PROCESS_ERRORS = REGISTRY.counter(
+    "message_process_errors_total", "Failed MessageProcessor.process_message calls"
+)
+
 
 class MessageProcessor:
     """Process incoming Slack messages."""
@@ -27,7 +36,7 @@ class MessageProcessor:
         if tool_handlers and self._is_adk_agent():
             logger.warning("tool_handlers are ignored when using ADKAgent - tools are managed internally")
 
-        logger.info(f"MessageProcessor initialized with {len(self.tool_handlers)} tool handlers")
+        logger.info("MessageProcessor initialized with %d tool handlers", len(self.tool_handlers))
 
     def _is_adk_agent(self) -> bool:
         """
@@ -89,11 +98,15 @@ class MessageProcessor:
         Returns:
             Response text
         """
+        start = time.perf_counter()
         try:
             # Clean up message text (remove bot mention)
             cleaned_text = self._clean_message_text(text)
 
-            logger.info(f"Processing message from user {user} in channel {channel}, thread {thread_ts}: {cleaned_text}")
+            logger.info(
+                "Processing message from user %s in channel %s, thread %s: %s",
+                user, channel, thread_ts, cleaned_text
+            )
 
             # Generate response based on client type, passing session info for ADKAgent
             response = self._generate_response(
@@ -106,9 +119,13 @@ class MessageProcessor:
             return response
 
         except Exception as e:
-            logger.error(f"Error processing message: {e}", exc_info=True)
+            PROCESS_ERRORS.inc()
+            logger.error("Error processing message: %s", e, exc_info=True)
             return f"죄송합니다. 메시지 처리 중 오류가 발생했습니다: {str(e)}"
 
+        finally:
+            PROCESS_SECONDS.observe(time.perf_counter() - start)
+
     def _clean_message_text(self, text: str) -> str:
         """
         Clean message text by removing bot mentions.
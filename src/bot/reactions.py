@@ -0,0 +1,145 @@
+"""Background, coalescing status reactions on user messages."""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+
+logger = setup_logger(__name__)
+
+REACTION_CALLS = REGISTRY.counter(
+    "slack_reaction_calls_total", "Slack reaction API calls made by the reaction queue", ["method", "result"]
+)
+REACTIONS_SUPERSEDED = REGISTRY.counter(
+    "slack_reactions_superseded_total", "Status reactions replaced before they were sent (never reached Slack)"
+)
+
+# Errors meaning Slack already shows the state we wanted
+_ALREADY_DONE = {"already_reacted", "no_reaction"}
+
+
+class ReactionQueue:
+    """
+    Keeps one status reaction per message (e.g., ⏳ then ✅) in sync on a background thread.
+
+    Callers only record which reaction a message should show and return
+    immediately. A single worker then brings Slack in line, oldest message
+    first: it removes the reaction it added before and adds the new one.
+    A status replaced before the worker got to it is never sent, so a
+    quick ⏳ → ✅ costs one reactions.add instead of add, remove, add.
+    """
+
+    def __init__(self, applied_capacity: int = 1024) -> None:
+        """
+        Initialize ReactionQueue and start its worker thread.
+
+        Args:
+            applied_capacity: Messages whose current reaction is remembered
+                (older ones are forgotten and never have a reaction removed)
+        """
+        self.applied_capacity = applied_capacity
+        # (channel, ts) -> (client, wanted reaction or None), oldest first
+        self._pending: "OrderedDict[Tuple[str, str], Tuple[WebClient, Optional[str]]]" = OrderedDict()
+        # (channel, ts) -> reaction the worker added last (worker thread only)
+        self._applied: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="slack-reactions", daemon=True)
+        self._worker.start()
+
+    def set(self, client: WebClient, channel: str, ts: str, name: Optional[str]) -> None:
+        """
+        Make a message show `name` as its status reaction (None removes it).
+
+        Args:
+            client: Slack client to call with
+            channel: Channel of the message
+            ts: Message timestamp
+            name: Reaction name without colons, or None
+        """
+        key = (channel, ts)
+        with self._cond:
+            if self._closed:
+                logger.warning("Reaction queue closed; dropping :%s: on %s", name, ts)
+                return
+            if key in self._pending:
+                REACTIONS_SUPERSEDED.inc()
+            self._pending[key] = (client, name)
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every reaction set so far was sent.
+
+        Returns:
+            True if done within the timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Send what is pending, then stop the worker thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                key, (client, name) = self._pending.popitem(last=False)
+                self._busy = True
+            try:
+                self._apply(key, client, name)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _apply(self, key: Tuple[str, str], client: WebClient, name: Optional[str]) -> None:
+        channel, ts = key
+        current = self._applied.pop(key, None)
+        if current == name:
+            if current is not None:
+                self._remember(key, current)
+            return
+        if current is not None and self._call(client.reactions_remove, "remove", channel, ts, current):
+            current = None
+        if name is not None and self._call(client.reactions_add, "add", channel, ts, name):
+            current = name
+        if current is not None:
+            self._remember(key, current)
+
+    def _remember(self, key: Hashable, name: str) -> None:
+        self._applied[key] = name
+        while len(self._applied) > self.applied_capacity:
+            self._applied.popitem(last=False)
+
+    @staticmethod
+    def _call(method, kind: str, channel: str, ts: str, name: str) -> bool:
+        """Call reactions.add/remove; True if Slack now matches (including already-done errors)."""
+        try:
+            method(channel=channel, timestamp=ts, name=name)
+            REACTION_CALLS.inc(method=kind, result="ok")
+            return True
+        except SlackApiError as e:
+            if e.response.get("error") in _ALREADY_DONE:
+                REACTION_CALLS.inc(method=kind, result="ok")
+                return True
+            REACTION_CALLS.inc(method=kind, result="error")
+            logger.warning("Failed to %s reaction :%s: on %s: %s", kind, name, ts, e)
+        except Exception as e:
+            REACTION_CALLS.inc(method=kind, result="error")
+            logger.warning("Failed to %s reaction :%s: on %s: %s", kind, name, ts, e)
+        return False
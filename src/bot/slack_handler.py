@@ -1,38 +1,165 @@
 """Slack bot event handler."""
 
-from typing import Optional
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
-from slack_sdk.errors import SlackApiError
+from slack_sdk import WebClient
 
+from src.bot.debounce import MentionDebouncer
+from src.bot.reactions import ReactionQueue
 from src.config import Config
 from src.utils.logger import setup_logger
+from src.utils.mentions import MENTION_PATTERN
+from src.utils.metrics import REGISTRY, SLACK_POST_SECONDS
+from src.utils.tracing import get_tracer
 
 logger = setup_logger(__name__, Config.LOG_LEVEL)
 
+MENTIONS = REGISTRY.counter("slack_mentions_total", "App mentions received", ["mode"])
+MENTIONS_IGNORED = REGISTRY.counter(
+    "slack_mentions_ignored_total", "Mentions ignored because a debate is active in the thread"
+)
+MENTIONS_IN_PROGRESS = REGISTRY.gauge(
+    "slack_mentions_in_progress", "Mentions currently being handled by listener threads"
+)
+CANCEL_REQUESTS = REGISTRY.counter(
+    "slack_cancel_requests_total", "Cancel commands that stopped a running debate", ["source"]
+)
+SEARCH_REQUESTS = REGISTRY.counter(
+    "slack_search_requests_total", "Debate searches requested", ["source"]
+)
+
+# Reacting with one of these on the mention or any debate message cancels the debate
+CANCEL_REACTIONS = {"octagonal_sign", "no_entry", "x"}
+# A thread reply (or mention) consisting of one of these words cancels the debate
+CANCEL_WORDS = {"stop", "cancel", "중지", "중단", "그만", "멈춰"}
+
+# "@AgentJamal 검색 원격 근무" (or "search ...") searches past debates instead of starting one
+_SEARCH_PATTERN = re.compile(r"^(?:검색|search)\s+(.+)$", re.IGNORECASE | re.DOTALL)
+SEARCH_RESULT_LIMIT = 5
+
+
+def is_cancel_command(text: str) -> bool:
+    """
+    Check whether a message is a cancel command.
+
+    Args:
+        text: Message text (user mentions are ignored)
+
+    Returns:
+        True if the remaining text is one of CANCEL_WORDS
+    """
+    words = MENTION_PATTERN.sub("", text or "").strip().strip(".!").lower()
+    return words in CANCEL_WORDS
+
+
+def parse_search_command(text: str) -> Optional[str]:
+    """
+    Extract the query from a search mention.
+
+    Args:
+        text: Message text (user mentions are ignored)
+
+    Returns:
+        Search query, or None if the message is not a search command
+    """
+    match = _SEARCH_PATTERN.match(MENTION_PATTERN.sub("", text or "").strip())
+    return match.group(1).strip() if match else None
+
+
+def combine_mention_texts(events: List[Dict[str, Any]]) -> str:
+    """
+    Join a burst of mentions into one message.
+
+    Args:
+        events: Mention events, oldest first
+
+    Returns:
+        The first text as is, then each follow-up without its user mentions
+    """
+    texts = [events[0].get("text", "")]
+    for event in events[1:]:
+        follow_up = MENTION_PATTERN.sub("", event.get("text", "")).strip()
+        if follow_up:
+            texts.append(follow_up)
+    return "\n".join(texts)
+
+
+def format_search_results(query: str, hits: List[Dict[str, Any]], elapsed_ms: float) -> str:
+    """
+    Render search hits as a Slack message.
+
+    Args:
+        query: The user's query
+        hits: Results of TranscriptStore.search
+        elapsed_ms: Search time
+
+    Returns:
+        Message text (mrkdwn)
+    """
+    if not hits:
+        return f"🔎 '{query}'에 해당하는 토론을 찾지 못했습니다."
+
+    lines = [f"🔎 '{query}' 검색 결과 {len(hits)}건 ({elapsed_ms:.0f}ms)"]
+    for rank, hit in enumerate(hits, 1):
+        started = datetime.fromtimestamp(hit["started_at"]).strftime("%Y-%m-%d")
+        link = f"https://slack.com/archives/{hit['channel']}/p{hit['thread_ts'].replace('.', '')}"
+        topic = MENTION_PATTERN.sub("", hit["topic"]).strip()[:80]
+        lines.append(f"{rank}. <{link}|{topic}> · {started} · {hit.get('outcome') or '진행 중'}")
+        if hit.get("snippet"):
+            lines.append(f"> {' '.join(hit['snippet'].split())}")
+    return "\n".join(lines)
+
 
 class SlackBot:
     """Slack bot handler with Socket Mode."""
 
-    def __init__(self, message_processor, debate_orchestrator=None):
+    def __init__(
+        self,
+        message_processor,
+        debate_orchestrator=None,
+        client: Optional[WebClient] = None,
+        transcript_store=None,
+        debounce_ms: int = 0,
+        reactions: Optional[ReactionQueue] = None
+    ):
         """
         Initialize Slack bot.
 
         Args:
             message_processor: Message processing handler (for backward compatibility)
             debate_orchestrator: Optional DebateOrchestrator for multi-agent debates
+            client: Optional preconfigured WebClient for the Bolt app
+                (e.g., pointed at a local fake Slack API in benchmarks)
+            transcript_store: Optional TranscriptStore that search commands query
+            debounce_ms: Mentions from the same user in the same thread within
+                this window become one debate topic or request (0 = handle each)
+            reactions: Queue sending status reactions in the background
+                (default: a new ReactionQueue)
         """
-        # Use Jamal's token for Socket Mode connection (Orchestrator mode)
-        # Falls back to legacy SLACK_BOT_TOKEN for backward compatibility
-        bot_token = Config.SLACK_BOT_TOKEN_JAMAL or Config.SLACK_BOT_TOKEN
-        self.app = App(token=bot_token)
+        if client is not None:
+            self.app = App(client=client)
+        else:
+            # Use Jamal's token for Socket Mode connection (Orchestrator mode)
+            # Falls back to legacy SLACK_BOT_TOKEN for backward compatibility
+            bot_token = Config.SLACK_BOT_TOKEN_JAMAL or Config.SLACK_BOT_TOKEN
+            self.app = App(token=bot_token)
         self.message_processor = message_processor
         self.debate_orchestrator = debate_orchestrator
+        self.transcript_store = transcript_store
+        self.handler: Optional[SocketModeHandler] = None
+        self._stopped = threading.Event()
+        self.reactions = reactions or ReactionQueue()
+        self._debouncer = MentionDebouncer(debounce_ms, self._respond) if debounce_ms > 0 else None
 
         # Register event listeners
         self._register_listeners()
 
-        logger.info(f"SlackBot initialized successfully (Orchestrator mode: {debate_orchestrator is not None})")
+        logger.info("SlackBot initialized successfully (Orchestrator mode: %s)", debate_orchestrator is not None)
 
     def _register_listeners(self):
         """Register Slack event listeners."""
@@ -47,33 +174,152 @@ class SlackBot:
                 say: Function to send messages
                 client: Slack client
             """
-            try:
-                logger.info(f"Received mention: {event}")
+            with get_tracer().start_span(
+                "slack.handle_mention",
+                attributes={"channel": event.get("channel"), "thread_ts": event.get("thread_ts") or event.get("ts")},
+                new_trace=True
+            ) as span:
+                MENTIONS_IN_PROGRESS.inc()
+                try:
+                    logger.info(
+                        "Received mention | channel: %s | ts: %s | user: %s",
+                        event.get("channel"), event.get("ts"), event.get("user")
+                    )
+                    logger.debug("Mention payload: %s", event)
 
-                # Extract basic info
-                text = event.get("text", "")
-                user = event.get("user")
-                channel = event.get("channel")
-                thread_ts = event.get("thread_ts") or event.get("ts")
+                    # Extract basic info
+                    text = event.get("text", "")
+                    user = event.get("user")
+                    channel = event.get("channel")
+                    thread_ts = event.get("thread_ts") or event.get("ts")
 
-                # Check if this is an orchestrator-managed debate
-                if self.debate_orchestrator:
-                    # Filter out mentions during active debates
-                    if self.debate_orchestrator.is_debate_active(thread_ts):
-                        logger.info(f"Ignoring mention in active debate thread: {thread_ts}")
+                    # Check if this is an orchestrator-managed debate
+                    mode = "orchestrator" if self.debate_orchestrator else "legacy"
+                    span.set_attribute("mode", mode)
+                    MENTIONS.inc(mode=mode)
+
+                    # A cancel word while follow-up messages are awaited drops them all
+                    if (
+                        self._debouncer is not None and is_cancel_command(text)
+                        and self._debouncer.discard((channel, thread_ts, user))
+                    ):
+                        logger.info("Dropped pending mentions in thread %s on cancel by %s", thread_ts, user)
+                        return
+
+                    if self.debate_orchestrator:
+                        # Filter out mentions during active debates (except cancel commands)
+                        if self.debate_orchestrator.is_debate_active(thread_ts):
+                            if is_cancel_command(text):
+                                self._cancel(thread_ts, "mention", user)
+                                return
+                            MENTIONS_IGNORED.inc()
+                            logger.info("Ignoring mention in active debate thread: %s", thread_ts)
+                            return
+
+                        query = parse_search_command(text)
+                        if query is not None and self.transcript_store is not None:
+                            say(text=self._search(query, channel, "mention"), thread_ts=thread_ts)
+                            return
+
+                    if self._debouncer is not None:
+                        # Wait for follow-up messages; they are handled together
+                        self._debouncer.submit((channel, thread_ts, user), (event, say, client))
                         return
+                    self._respond([(event, say, client)])
 
-                    # Any bot mention starts a debate (orchestrator mode)
-                    logger.info(f"Starting orchestrated debate in thread: {thread_ts}")
-                    # Add reaction to show we received it
+                except Exception as e:
+                    logger.error("Error handling mention: %s", e, exc_info=True)
+                    # Send error message to user
                     try:
-                        client.reactions_add(
-                            channel=channel,
-                            timestamp=event["ts"],
-                            name="speech_balloon"
+                        say(
+                            text=f"죄송합니다. 메시지 처리 중 오류가 발생했습니다: {str(e)}",
+                            thread_ts=event.get("thread_ts") or event.get("ts")
                         )
-                    except SlackApiError as e:
-                        logger.warning(f"Failed to add reaction: {e}")
+                    except Exception as inner_e:
+                        logger.error("Failed to send error message: %s", inner_e)
+
+                finally:
+                    MENTIONS_IN_PROGRESS.dec()
+
+        @self.app.command("/debate-search")
+        def handle_search_command(ack, command, respond):
+            """
+            Reply (only to the caller) with past debates matching the text.
+
+            Args:
+                ack: Acknowledge function (must be called within 3 s)
+                command: Slash command payload
+                respond: Sends an ephemeral reply via the response URL
+            """
+            ack()
+            if self.transcript_store is None:
+                respond(text="토론 기록 저장이 꺼져 있어 검색할 수 없습니다.")
+                return
+            query = command.get("text", "").strip()
+            if not query:
+                respond(text="사용법: /debate-search <검색어>")
+                return
+            respond(text=self._search(query, command.get("channel_id"), "command"))
+
+        @self.app.event("reaction_added")
+        def handle_reaction(event):
+            """
+            Cancel a debate when a cancel reaction is added to its messages.
+
+            Args:
+                event: Slack reaction_added event
+            """
+            item = event.get("item", {})
+            if (
+                not self.debate_orchestrator
+                or event.get("reaction") not in CANCEL_REACTIONS
+                or item.get("type") != "message"
+            ):
+                return
+            self._cancel(item.get("ts"), "reaction", event.get("user"))
+
+        @self.app.event("message")
+        def handle_message(event):
+            """
+            Cancel a debate when someone replies a cancel word in its thread.
+
+            Args:
+                event: Slack message event
+            """
+            if (
+                not self.debate_orchestrator
+                or event.get("bot_id")
+                or event.get("subtype")
+                or not event.get("thread_ts")
+            ):
+                return
+            if is_cancel_command(event.get("text", "")):
+                self._cancel(event["thread_ts"], "message", event.get("user"))
+
+    def _respond(self, mentions: List[Tuple[Dict[str, Any], Callable, WebClient]]) -> None:
+        """
+        Start a debate on (or answer) one or more mentions from one user in one thread.
+
+        Args:
+            mentions: (event, say, client) per mention, oldest first; the
+                texts are joined into one topic or request and reactions go
+                on the first mention
+        """
+        event, say, client = mentions[0]
+        text = combine_mention_texts([mention[0] for mention in mentions])
+        user = event.get("user")
+        channel = event.get("channel")
+        thread_ts = event.get("thread_ts") or event.get("ts")
+
+        with get_tracer().start_span(
+            "slack.respond", attributes={"thread_ts": thread_ts, "mentions": len(mentions)}
+        ):
+            try:
+                if self.debate_orchestrator:
+                    # Any other bot mention starts a debate (orchestrator mode)
+                    logger.info("Starting orchestrated debate in thread: %s", thread_ts)
+                    # Add reaction to show we received it (sent in the background)
+                    self.reactions.set(client, channel, event["ts"], "speech_balloon")
 
                     # Start debate asynchronously
                     self.debate_orchestrator.start_debate(
@@ -85,60 +331,142 @@ class SlackBot:
                     return
 
                 # Fallback to regular message processor (backward compatibility)
-                # Add loading reaction
-                try:
-                    client.reactions_add(
-                        channel=event["channel"],
-                        timestamp=event["ts"],
-                        name="hourglass_flowing_sand"
-                    )
-                except SlackApiError as e:
-                    logger.warning(f"Failed to add reaction: {e}")
+                # Add loading reaction (sent in the background)
+                self.reactions.set(client, channel, event["ts"], "hourglass_flowing_sand")
 
                 # Process message
-                response = self.message_processor.process_message(
-                    text=text,
-                    user=user,
-                    channel=channel,
-                    thread_ts=thread_ts
-                )
+                with get_tracer().start_span("message.process", attributes={"text_length": len(text)}):
+                    response = self.message_processor.process_message(
+                        text=text,
+                        user=user,
+                        channel=channel,
+                        thread_ts=thread_ts
+                    )
 
                 # Send response in thread
-                say(
-                    text=response,
-                    thread_ts=thread_ts
-                )
-
-                # Remove loading reaction and add checkmark
-                try:
-                    client.reactions_remove(
-                        channel=event["channel"],
-                        timestamp=event["ts"],
-                        name="hourglass_flowing_sand"
-                    )
-                    client.reactions_add(
-                        channel=event["channel"],
-                        timestamp=event["ts"],
-                        name="white_check_mark"
+                with get_tracer().start_span(
+                    "slack.say", attributes={"text_length": len(response)}
+                ), SLACK_POST_SECONDS.time(speaker="legacy"):
+                    say(
+                        text=response,
+                        thread_ts=thread_ts
                     )
-                except SlackApiError as e:
-                    logger.warning(f"Failed to update reaction: {e}")
 
-                logger.info(f"Successfully processed mention from user {user}")
+                # Replace the loading reaction with a checkmark (skips ⏳ if it wasn't sent yet)
+                self.reactions.set(client, channel, event["ts"], "white_check_mark")
+
+                logger.info("Successfully processed %d mention(s) from user %s", len(mentions), user)
 
             except Exception as e:
-                logger.error(f"Error handling mention: {e}", exc_info=True)
+                logger.error("Error handling mention: %s", e, exc_info=True)
                 # Send error message to user
                 try:
                     say(
                         text=f"죄송합니다. 메시지 처리 중 오류가 발생했습니다: {str(e)}",
-                        thread_ts=event.get("thread_ts") or event.get("ts")
+                        thread_ts=thread_ts
                     )
                 except Exception as inner_e:
-                    logger.error(f"Failed to send error message: {inner_e}")
+                    logger.error("Failed to send error message: %s", inner_e)
+
+    def _search(self, query: str, channel: Optional[str], source: str) -> str:
+        """
+        Search stored debates and format the reply.
 
-    def start(self):
-        """Start the Slack bot with Socket Mode."""
+        Args:
+            query: Search text
+            channel: Channel the command came from (results are limited
+                to it unless SEARCH_ALL_CHANNELS is set)
+            source: "mention" or "command"
+
+        Returns:
+            Reply text
+        """
+        SEARCH_REQUESTS.inc(source=source)
+        start = time.perf_counter()
+        with get_tracer().start_span("slack.search", attributes={"source": source}):
+            hits = self.transcript_store.search(
+                query,
+                limit=SEARCH_RESULT_LIMIT,
+                channel=None if Config.SEARCH_ALL_CHANNELS else channel
+            )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info("Debate search via %s | hits: %d | %.1f ms", source, len(hits), elapsed_ms)
+        return format_search_results(query, hits, elapsed_ms)
+
+    def _cancel(self, ts: str, source: str, user: Optional[str]) -> bool:
+        """
+        Route a cancel command to the orchestrator.
+
+        Args:
+            ts: Thread ts or ts of a message in the debate
+            source: "mention", "reaction" or "message"
+            user: User who asked to cancel
+
+        Returns:
+            True if a running debate was cancelled
+        """
+        cancelled = self.debate_orchestrator.cancel_debate(ts, reason=f"{source} by {user}")
+        if cancelled:
+            CANCEL_REQUESTS.inc(source=source)
+            logger.info("Debate cancelled via %s by user %s (ts: %s)", source, user, ts)
+        return cancelled
+
+    def start(self, on_connected: Optional[Callable[[], None]] = None):
+        """
+        Start the Slack bot with Socket Mode.
+
+        Blocks the calling thread after the connection is established,
+        until stop() is called.
+
+        Args:
+            on_connected: Optional callback run in a background thread once
+                the Socket Mode connection is open (e.g., agent warm-up)
+        """
         logger.info("Starting Slack bot in Socket Mode...")
-        handler = SocketModeHandler(self.app, Config.SLACK_APP_TOKEN)
-        handler.start()
+        self.handler = SocketModeHandler(self.app, Config.SLACK_APP_TOKEN)
+        self.handler.connect()
+        logger.info("Socket Mode connection established")
+
+        if on_connected:
+            threading.Thread(target=on_connected, name="post-connect", daemon=True).start()
+
+        self._stopped.wait()
+
+    def stop(self) -> None:
+        """
+        Unblock start(); the caller then runs close().
+
+        Only sets an event, so it is safe to call from a signal handler and
+        more than once.
+        """
+        self._stopped.set()
+
+    def close(self) -> None:
+        """
+        Close the Socket Mode connection (no new events) and settle pending work.
+
+        Pending debounced mentions are handed to the orchestrator (which is
+        put into draining mode first, so they are checkpointed rather than
+        run) or, in legacy mode, dropped; queued status reactions are sent.
+        Blocks on Slack calls, so run it on the normal shutdown path, not in
+        a signal handler.
+        """
+        self._stopped.set()
+        if self.handler is not None:
+            try:
+                self.handler.close()
+            except Exception as e:
+                logger.warning("Error closing Socket Mode handler: %s", e)
+            self.handler = None
+        if self._debouncer is not None:
+            if self.debate_orchestrator:
+                # Drain first so the flushed mentions are checkpointed for the next process, not run
+                self.debate_orchestrator.begin_drain()
+                self._debouncer.flush()
+            else:
+                for key in self._debouncer.keys():
+                    self._debouncer.discard(key)
+                    logger.warning("Dropped pending mentions at shutdown (thread: %s)", key[1])
+        # Pending status reactions are sent before the process exits
+        self.reactions.close(timeout=2.0)
+        logger.info("Slack bot stopped accepting events")
@@ -0,0 +1,104 @@
+"""Boot-time warm-up of Slack clients and agents."""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from slack_sdk import WebClient
+
+from src.llm.adk_agent import ADKAgent
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+from src.utils.tracing import get_tracer
+
+logger = setup_logger(__name__)
+
+BOT_READY = REGISTRY.gauge("bot_ready", "1 once boot-time warm-up has finished")
+WARMUP_SECONDS = REGISTRY.gauge(
+    "warmup_duration_seconds", "Time spent in each warm-up step", ["step"]
+)
+
+
+class WarmUp:
+    """
+    Primes connections and agents before the first mention arrives.
+
+    Steps:
+        1. auth.test on every Slack client (opens the connection and
+           resolves each bot's user ID)
+        2. Build each agent's runner (ADKAgent.warm_up)
+        3. Fetch model metadata through each agent's genai client
+
+    Failures are logged and do not block readiness; the first request
+    then pays the remaining cold-start cost instead.
+    """
+
+    def __init__(
+        self,
+        slack_clients: Dict[str, WebClient],
+        agents: List[ADKAgent],
+        prime_model: bool = True
+    ) -> None:
+        """
+        Initialize WarmUp.
+
+        Args:
+            slack_clients: Name -> WebClient (e.g., {"jamal": ..., "ryan": ...})
+            agents: Agents to build and prime
+            prime_model: Also open a connection to the model API
+        """
+        self.slack_clients = slack_clients
+        self.agents = agents
+        self.prime_model = prime_model
+
+        self.ready = threading.Event()
+        self.bot_user_ids: Dict[str, str] = {}
+        self.timings: Dict[str, float] = {}
+
+    def _timed(self, step: str, func) -> None:
+        start = time.perf_counter()
+        with get_tracer().start_span("warmup.step", attributes={"step": step}):
+            try:
+                func()
+            except Exception as e:
+                logger.warning("Warm-up step '%s' failed: %s", step, e)
+        elapsed = time.perf_counter() - start
+        self.timings[step] = elapsed
+        WARMUP_SECONDS.set(elapsed, step=step)
+
+    def _resolve_bot(self, name: str, client: WebClient) -> None:
+        response = client.auth_test()
+        self.bot_user_ids[name] = response.get("user_id")
+
+    def run(self) -> Dict[str, float]:
+        """
+        Run all warm-up steps, then mark the bot ready.
+
+        Returns:
+            Seconds spent per step
+        """
+        start = time.perf_counter()
+        with get_tracer().start_span("warmup", new_trace=True):
+            for name, client in self.slack_clients.items():
+                self._timed(f"slack.{name}", lambda n=name, c=client: self._resolve_bot(n, c))
+
+            for agent in self.agents:
+                self._timed(f"agent.{agent.agent_name}", agent.warm_up)
+                if self.prime_model:
+                    self._timed(f"model.{agent.agent_name}", agent.prime_model)
+
+        self.ready.set()
+        BOT_READY.set(1)
+        logger.info(
+            "Warm-up complete in %.0f ms, bot is ready | bot users: %s",
+            (time.perf_counter() - start) * 1000, self.bot_user_ids
+        )
+        return self.timings
+
+    def is_ready(self) -> bool:
+        """True once warm-up has finished."""
+        return self.ready.is_set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until warm-up has finished (or timeout)."""
+        return self.ready.wait(timeout)
@@ -22,6 +22,10 @@ class Config:
     # Socket Mode token (typically from one of the bot apps, e.g., Jamal)
     SLACK_APP_TOKEN = os.getenv("SLACK_APP_TOKEN")
 
+    # Mentions from the same user in the same thread within this many ms are
+    # handled as one message (one debate topic or one reply); 0 = each alone
+    MENTION_DEBOUNCE_MS = int(os.getenv("MENTION_DEBOUNCE_MS", "0"))
+
     # Google Generative AI API Key (for ADK Agent)
     # Primary key is GOOGLE_GENAI_API_KEY, falls back to GEMINI_API_KEY for backward compatibility
     GOOGLE_GENAI_API_KEY = os.getenv("GOOGLE_GENAI_API_KEY") or os.getenv("GEMINI_API_KEY")
@@ -33,9 +37,132 @@ class Config:
     # Bot Configuration
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+    # Structured logging
+    # "text" (default) or "json" (one JSON object per line)
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+    # Write logs from a background QueueListener thread instead of the caller
+    LOG_ASYNC = os.getenv("LOG_ASYNC", "false").lower() == "true"
+    # Cap on rendered message length (0 = unlimited)
+    LOG_MAX_LENGTH = int(os.getenv("LOG_MAX_LENGTH", "2000"))
+    # Per-logger keep-rate for sub-WARNING records, e.g. "src.llm.adk_agent=0.1"
+    LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "")
+
     # Session Management
     SESSION_TTL_HOURS = int(os.getenv("SESSION_TTL_HOURS", "24"))
 
+    # Startup
+    # Build agents (and import google.adk) on first use or in a background
+    # warm-up thread after the Socket Mode connection opens
+    LAZY_INIT = os.getenv("LAZY_INIT", "false").lower() == "true"
+
+    # Warm up Slack connections (auth.test) and the model client after
+    # connecting; readiness is reported only once warm
+    WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "false").lower() == "true"
+
+    # HTTP transport
+    # Shared keep-alive connection pool for all Slack clients and the model client
+    HTTP_POOLING = os.getenv("HTTP_POOLING", "true").lower() == "true"
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+    # Used only if the h2 package is installed (pip install httpx[http2])
+    HTTP2 = os.getenv("HTTP2", "true").lower() == "true"
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+
+    # Tracing
+    # Span exporter: "none", "memory" or "jsonl"
+    TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "none")
+    TRACE_FILE = os.getenv("TRACE_FILE", "traces.jsonl")
+
+    # Metrics
+    # Port for the Prometheus /metrics endpoint (0 = disabled)
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+
+    # Record/replay of model calls for offline benchmarks
+    # "record", "replay" or empty (live calls only)
+    CASSETTE_MODE = os.getenv("CASSETTE_MODE", "")
+    CASSETTE_DIR = os.getenv("CASSETTE_DIR", "cassettes")
+    # Replay timing scale (1.0 = original timing, 0 = no delay)
+    CASSETTE_REPLAY_SPEED = float(os.getenv("CASSETTE_REPLAY_SPEED", "1.0"))
+
+    # Graceful shutdown
+    # Seconds to wait on SIGTERM/Ctrl-C for in-flight debate turns to finish
+    SHUTDOWN_TIMEOUT = float(os.getenv("SHUTDOWN_TIMEOUT", "60"))
+
+    # Debate checkpoints
+    # Save debate state after every turn and resume unfinished debates on startup
+    CHECKPOINT_ENABLED = os.getenv("CHECKPOINT_ENABLED", "true").lower() == "true"
+    CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", "checkpoints")
+    # Checkpoints idle longer than this are discarded instead of resumed (0 = never)
+    CHECKPOINT_MAX_AGE_HOURS = float(os.getenv("CHECKPOINT_MAX_AGE_HOURS", "24"))
+
+    # Debate transcripts
+    # Append every utterance to a local SQLite store (written off the hot path)
+    TRANSCRIPTS_ENABLED = os.getenv("TRANSCRIPTS_ENABLED", "true").lower() == "true"
+    TRANSCRIPT_DB = os.getenv("TRANSCRIPT_DB", "transcripts/transcripts.db")
+    # Let search commands return debates from every channel (default: only the current one)
+    SEARCH_ALL_CHANNELS = os.getenv("SEARCH_ALL_CHANNELS", "false").lower() == "true"
+    # Add conclusions of similar past debates to the context before round 1
+    # (needs TRANSCRIPTS_ENABLED; channel scope follows SEARCH_ALL_CHANNELS)
+    RETRIEVAL_ENABLED = os.getenv("RETRIEVAL_ENABLED", "true").lower() == "true"
+    RETRIEVAL_TOP_K = int(os.getenv("RETRIEVAL_TOP_K", "3"))
+    RETRIEVAL_TOKEN_BUDGET = int(os.getenv("RETRIEVAL_TOKEN_BUDGET", "600"))
+
+    # Search cache
+    # Share google_search results between the three agents of a debate so
+    # later turns build on them instead of searching again
+    SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    # Seconds results stay usable by other debates (0 = only the debate that ran the search)
+    SEARCH_CACHE_TTL_S = float(os.getenv("SEARCH_CACHE_TTL_S", "0"))
+    # Max estimated tokens of cached results added to one prompt
+    SEARCH_CACHE_TOKEN_BUDGET = int(os.getenv("SEARCH_CACHE_TOKEN_BUDGET", "500"))
+    # Research step: search the topic once before round 1 (RESEARCH_MAX_QUERIES
+    # concurrent searches) and give all agents the same fact sheet
+    RESEARCH_ENABLED = os.getenv("RESEARCH_ENABLED", "false").lower() == "true"
+    RESEARCH_MAX_QUERIES = int(os.getenv("RESEARCH_MAX_QUERIES", "4"))
+    RESEARCH_TOKEN_BUDGET = int(os.getenv("RESEARCH_TOKEN_BUDGET", "700"))
+    # Searches still running after this many seconds are left out of the fact sheet
+    RESEARCH_TIMEOUT_S = float(os.getenv("RESEARCH_TIMEOUT_S", "20"))
+
+    # Debate flow
+    # Turn graph for each round: "classic" (Jamal → James → Ryan → James) or
+    # "panel" (James asks, Jamal and Ryan answer in parallel, James checks)
+    DEBATE_FLOW = os.getenv("DEBATE_FLOW", "classic")
+    # James updates its previous summary with the new turns instead of
+    # re-summarizing the whole debate every round
+    INCREMENTAL_SUMMARY = os.getenv("INCREMENTAL_SUMMARY", "true").lower() == "true"
+    # Rounds before a debate is ended without a conclusion
+    DEBATE_MAX_ROUNDS = int(os.getenv("DEBATE_MAX_ROUNDS", "10"))
+
+    # Adaptive rounds
+    # End a debate early (James concludes) once, after MIN_ROUNDS, PATIENCE
+    # rounds in a row bring less than NOVELTY_THRESHOLD new text and the
+    # running summary changes less than DRIFT_THRESHOLD
+    ADAPTIVE_ROUNDS = os.getenv("ADAPTIVE_ROUNDS", "false").lower() == "true"
+    ADAPTIVE_MIN_ROUNDS = int(os.getenv("ADAPTIVE_MIN_ROUNDS", "3"))
+    ADAPTIVE_NOVELTY_THRESHOLD = float(os.getenv("ADAPTIVE_NOVELTY_THRESHOLD", "0.25"))
+    ADAPTIVE_DRIFT_THRESHOLD = float(os.getenv("ADAPTIVE_DRIFT_THRESHOLD", "0.35"))
+    ADAPTIVE_PATIENCE = int(os.getenv("ADAPTIVE_PATIENCE", "1"))
+    # Don't start a round that would take the debate past this many seconds
+    # or this estimated cost (0 = unlimited)
+    DEBATE_TIME_BUDGET_S = float(os.getenv("DEBATE_TIME_BUDGET_S", "0"))
+    DEBATE_COST_BUDGET = float(os.getenv("DEBATE_COST_BUDGET", "0"))
+
+    # Prompt budget
+    # Max prompt tokens per agent call (local estimate, calibrated against the
+    # counts the model reports); the oldest turns are shortened, then dropped (0 = unlimited)
+    PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "16000"))
+
+    # Token Accounting
+    # Max total tokens per debate (0 = unlimited)
+    DEBATE_TOKEN_BUDGET = int(os.getenv("DEBATE_TOKEN_BUDGET", "0"))
+    # Prices per 1M tokens, used for cost estimates in usage logs
+    INPUT_COST_PER_MTOK = float(os.getenv("INPUT_COST_PER_MTOK", "0.10"))
+    OUTPUT_COST_PER_MTOK = float(os.getenv("OUTPUT_COST_PER_MTOK", "0.40"))
+    CACHED_COST_PER_MTOK = float(os.getenv("CACHED_COST_PER_MTOK", "0.025"))
+
     @classmethod
     def validate(cls) -> bool:
         """
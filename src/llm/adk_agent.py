@@ -1,17 +1,47 @@
 """ADK Agent client for Google Agent Development Kit."""
 
 import os
-import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError
 from datetime import datetime
 from importlib import import_module
-from google.adk.runners import InMemoryRunner
-from google.genai import types
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.llm.agent_roles import AGENT_NAMES
+from src.llm.cassette import CASSETTE_MODES, Cassette
+from src.llm.search_cache import SearchCache, SearchResult
+from src.llm.tokens import TokenCalibration, estimate_tokens
+from src.llm.usage import TokenUsage, UsageTracker
+from src.utils.cancellation import CancellationToken, OperationCancelled
+from src.utils.event_loop import get_background_loop
+from src.utils.http_transport import HttpTransport
 from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+from src.utils.tracing import get_tracer
+
+if TYPE_CHECKING:
+    from google.adk.runners import InMemoryRunner
 
 logger = setup_logger(__name__)
 
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "llm_call_duration_seconds", "Latency of generate_response per agent role", ["role"]
+)
+LLM_CALL_ERRORS = REGISTRY.counter(
+    "llm_call_errors_total", "Failed generate_response calls per agent role", ["role"]
+)
+LLM_CALLS_CANCELLED = REGISTRY.counter(
+    "llm_call_cancelled_total", "generate_response calls aborted by cancellation per agent role", ["role"]
+)
+LLM_PROMPT_TOKEN_RATIO = REGISTRY.histogram(
+    "llm_prompt_token_estimate_ratio", "Reported / locally estimated prompt tokens per model call", ["role"],
+    buckets=(0.5, 0.75, 0.9, 1.0, 1.1, 1.25, 1.5, 2.0, 3.0, 5.0)
+)
+ADK_SESSIONS = REGISTRY.gauge(
+    "adk_sessions", "ADK sessions created per agent", ["agent"]
+)
+
 
 class ADKAgent:
     """
@@ -25,7 +55,16 @@ class ADKAgent:
         self,
         api_key: str,
         role: str = "proposer",
-        model: str = "gemini-2.0-flash"
+        model: str = "gemini-2.0-flash",
+        usage_tracker: Optional[UsageTracker] = None,
+        root_agent: Optional[Any] = None,
+        lazy: bool = False,
+        cassette_mode: Optional[str] = None,
+        cassette_dir: str = "cassettes",
+        replay_speed: float = 1.0,
+        http_transport: Optional[HttpTransport] = None,
+        search_cache: Optional[SearchCache] = None,
+        token_calibration: Optional[TokenCalibration] = None
     ) -> None:
         """
         Initialize ADK Agent with specific role.
@@ -36,6 +75,23 @@ class ADKAgent:
             api_key: Google API key for authentication
             role: Agent role (proposer, opposer, mediator)
             model: Model name to use (default: gemini-2.0-flash)
+            usage_tracker: Optional UsageTracker that receives per-turn token usage
+            root_agent: Prebuilt ADK agent to use instead of the file-based
+                agent for this role (e.g., a fake model in benchmarks)
+            lazy: Defer importing the agent module (and google.adk) and
+                building the runner until first use or warm_up()
+            cassette_mode: "record" to save each run's event stream to disk,
+                "replay" to serve saved runs instead of calling the model,
+                or None (default) for live calls only
+            cassette_dir: Directory holding cassette recordings
+            replay_speed: Replay timing scale (1.0 = original, 0 = no delay)
+            http_transport: Shared HTTP transport; when given, the Gemini
+                model's genai client sends requests over its pooled async client
+            search_cache: Search cache shared with the other agents; searches
+                this agent runs are recorded in it, and results found by the
+                others in the same debate are added to this agent's prompts
+            token_calibration: Receives the estimated and reported prompt
+                tokens of every single-call turn
         """
         valid_roles = ["proposer", "opposer", "mediator"]
         if role not in valid_roles:
@@ -43,33 +99,140 @@ class ADKAgent:
                 f"Invalid role: {role}. Must be one of {valid_roles}"
             )
 
+        if cassette_mode and cassette_mode not in CASSETTE_MODES:
+            raise ValueError(
+                f"Invalid cassette_mode: {cassette_mode}. Must be one of {list(CASSETTE_MODES)}"
+            )
+
         self.role = role
         self.agent_name = AGENT_NAMES[role]
+        self.usage_tracker = usage_tracker
+
+        # Token usage of the most recent generate_response call
+        self.last_usage = TokenUsage()
+
+        # Record/replay of run_async event streams (keyed by role + prompt hash)
+        self.cassette_mode = cassette_mode or None
+        self.cassette = Cassette(cassette_dir) if self.cassette_mode else None
+        self.replay_speed = replay_speed
+        self.http_transport = http_transport
+        self.search_cache = search_cache
+        self.token_calibration = token_calibration
 
         # Set environment variables for local ADK authentication (not Vertex AI)
         os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "FALSE"
         os.environ["GOOGLE_API_KEY"] = api_key
 
-        # Load agent from file system (file-based agents for proper app_name inference)
-        # Map role to agent module path
-        agent_module_map = {
-            "proposer": "src.agents.jamal.agent",
-            "opposer": "src.agents.ryan.agent",
-            "mediator": "src.agents.james.agent"
-        }
+        self._agent = root_agent
+        self._runner: Optional["InMemoryRunner"] = None
+        self._init_lock = threading.Lock()
+
+        if not lazy:
+            self._ensure_initialized()
+
+        logger.info("%s initialized with role: %s%s", self.agent_name, role, " (lazy)" if lazy else "")
+
+    @property
+    def agent(self) -> Any:
+        """ADK root agent for this role (built on first access in lazy mode)."""
+        self._ensure_initialized()
+        return self._agent
+
+    @property
+    def runner(self) -> "InMemoryRunner":
+        """InMemoryRunner for this agent (built on first access in lazy mode)."""
+        self._ensure_initialized()
+        return self._runner
+
+    @property
+    def is_initialized(self) -> bool:
+        """True once the agent module is loaded and the runner built."""
+        return self._runner is not None
+
+    def _ensure_initialized(self) -> None:
+        """Load the agent module and build the runner once (thread-safe)."""
+        if self._runner is not None:
+            return
+
+        with self._init_lock:
+            if self._runner is not None:
+                return
+
+            from google.adk.runners import InMemoryRunner
+
+            with get_tracer().start_span("adk.init", attributes={"agent": self.agent_name}):
+                if self._agent is None:
+                    # Load agent from file system (file-based agents for proper app_name inference)
+                    # Map role to agent module path
+                    agent_module_map = {
+                        "proposer": "src.agents.jamal.agent",
+                        "opposer": "src.agents.ryan.agent",
+                        "mediator": "src.agents.james.agent"
+                    }
+
+                    module_path = agent_module_map[self.role]
+                    agent_module = import_module(module_path)
+                    self._agent = agent_module.root_agent
+
+                if self.http_transport is not None:
+                    self._attach_transport()
+
+                # Create InMemoryRunner with INDEPENDENT app_name per agent
+                # Each agent maintains its own session pool
+                self._runner = InMemoryRunner(
+                    agent=self._agent,
+                    app_name=f"debate_{self.agent_name.lower()}"
+                )
 
-        module_path = agent_module_map[role]
-        agent_module = import_module(module_path)
-        self.agent = agent_module.root_agent
+    def _attach_transport(self) -> None:
+        """Point the Gemini model's genai client at the shared HTTP pool."""
+        from google.adk.models import Gemini
 
-        # Create InMemoryRunner with INDEPENDENT app_name per agent
-        # Each agent maintains its own session pool
-        self.runner: InMemoryRunner = InMemoryRunner(
-            agent=self.agent,
-            app_name=f"debate_{self.agent_name.lower()}"
-        )
+        model = getattr(self._agent, "canonical_model", None)
+        if not isinstance(model, Gemini) or model.client is not None or model.client_kwargs:
+            # Fakes and explicitly configured clients are left alone
+            return
+        model.client_kwargs = {"http_options": self.http_transport.genai_http_options()}
+
+    def warm_up(self) -> float:
+        """
+        Build the agent and runner now instead of on the first request.
 
-        logger.info(f"{self.agent_name} initialized with role: {role}")
+        Returns:
+            Seconds spent initializing (0 if already initialized)
+        """
+        if self.is_initialized:
+            return 0.0
+
+        start = time.perf_counter()
+        self._ensure_initialized()
+        elapsed = time.perf_counter() - start
+        logger.info("[%s] Warm-up complete in %.0f ms", self.agent_name, elapsed * 1000)
+        return elapsed
+
+    def prime_model(self) -> bool:
+        """
+        Open a connection to the model API without generating tokens.
+
+        Fetches model metadata through the same genai client the runner
+        uses. Models without a genai client (e.g., fakes) are skipped.
+
+        Returns:
+            True if a request was made, False if skipped or failed
+        """
+        async def _prime() -> bool:
+            model = getattr(self.agent, "canonical_model", None)
+            api_client = getattr(model, "api_client", None) if model is not None else None
+            if api_client is None:
+                return False
+            await api_client.aio.models.get(model=model.model)
+            return True
+
+        try:
+            return get_background_loop().run(_prime())
+        except Exception as e:
+            logger.warning("[%s] Model priming failed: %s", self.agent_name, e)
+            return False
 
     async def _get_or_create_session(self, thread_ts: str, user_id: str) -> str:
         """
@@ -85,41 +248,49 @@ class ADKAgent:
         """
         app_name = f"debate_{self.agent_name.lower()}"
 
-        # Try to find existing session for this user
-        try:
-            sessions = await self.runner.session_service.list_sessions(
-                app_name=app_name,
-                user_id=user_id
-            )
+        with get_tracer().start_span(
+            "adk.session_lookup",
+            attributes={"agent": self.agent_name, "thread_ts": thread_ts}
+        ) as span:
+            # Try to find existing session for this user
+            try:
+                sessions = await self.runner.session_service.list_sessions(
+                    app_name=app_name,
+                    user_id=user_id
+                )
 
-            if sessions:
-                session_id = sessions[0].id
-                logger.info(f"[{self.agent_name}] Reusing session: {session_id}")
-                return session_id
+                if sessions:
+                    session_id = sessions[0].id
+                    span.set_attribute("created", False)
+                    logger.info("[%s] Reusing session: %s", self.agent_name, session_id)
+                    return session_id
 
-        except Exception as e:
-            logger.warning(f"[{self.agent_name}] Error listing sessions: {e}")
+            except Exception as e:
+                logger.warning("[%s] Error listing sessions: %s", self.agent_name, e)
 
-        # Create new session
-        try:
-            session = await self.runner.session_service.create_session(
-                app_name=app_name,
-                user_id=user_id,
-                state={}  # Initial empty state
-            )
-            logger.info(f"[{self.agent_name}] Created new session: {session.id}")
-            return session.id
+            # Create new session
+            try:
+                session = await self.runner.session_service.create_session(
+                    app_name=app_name,
+                    user_id=user_id,
+                    state={}  # Initial empty state
+                )
+                span.set_attribute("created", True)
+                ADK_SESSIONS.inc(agent=self.agent_name)
+                logger.info("[%s] Created new session: %s", self.agent_name, session.id)
+                return session.id
 
-        except Exception as e:
-            logger.error(f"[{self.agent_name}] Error creating session: {e}", exc_info=True)
-            raise
+            except Exception as e:
+                logger.error("[%s] Error creating session: %s", self.agent_name, e, exc_info=True)
+                raise
 
     def generate_response(
         self,
         text: str,
         channel: str = "default",
         thread_ts: str = None,
-        user: str = "slack_user"
+        user: str = "slack_user",
+        cancel_token: Optional[CancellationToken] = None
     ) -> str:
         """
         Generate a response for the given text.
@@ -132,11 +303,36 @@ class ADKAgent:
             channel: Slack channel ID (default: "default")
             thread_ts: Slack thread timestamp (default: None)
             user: Slack user ID (default: "slack_user")
+            cancel_token: Optional token; cancelling it aborts the in-flight
+                runner.run_async iteration immediately
 
         Returns:
             Generated response text
+
+        Raises:
+            OperationCancelled: If cancel_token was cancelled before or during the call
         """
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
+        usage = TokenUsage()
+        recorded_chunks = []
+        recorded_grounding: List[SearchResult] = []
+        # Set once the model (or cassette) produced a full response
+        completed = [False]
+
+        # Results the other agents already found in this debate
+        prompt = text
+        shown_queries: List[Tuple[str, ...]] = []
+        if self.search_cache is not None and thread_ts is not None:
+            cached, shown_queries = self.search_cache.render_unseen(thread_ts, self.agent_name)
+            if cached:
+                prompt = f"{cached}\n\n{text}"
+        estimated_tokens = estimate_tokens(prompt)
+
         async def _get_response() -> str:
+            from google.genai import types
+
             response_text = ""
 
             try:
@@ -153,31 +349,177 @@ class ADKAgent:
                 session_id = await self._get_or_create_session(thread_ts_key, user_id)
 
                 logger.info(
-                    f"[{self.agent_name}] Generating response | "
-                    f"user: {user_id} | session: {session_id}"
+                    "[%s] Generating response | user: %s | session: %s",
+                    self.agent_name, user_id, session_id
                 )
 
                 # Send message and collect response
                 # session_id is required parameter
+                chunks = []
+                grounding = []
+                last_event_at = time.perf_counter()
                 async for event in self.runner.run_async(
                     user_id=user_id,
                     session_id=session_id,
                     new_message=types.Content(
                         role="user",
-                        parts=[types.Part.from_text(text=text)]
+                        parts=[types.Part.from_text(text=prompt)]
                     )
                 ):
+                    # Accumulate token usage (one final event per model call)
+                    usage_metadata = getattr(event, 'usage_metadata', None)
+                    if usage_metadata and not getattr(event, 'partial', False):
+                        usage.add(TokenUsage.from_usage_metadata(usage_metadata))
+
+                    # Share the searches google_search ran for this turn
+                    grounding_metadata = getattr(event, 'grounding_metadata', None)
+                    if grounding_metadata and not getattr(event, 'partial', False):
+                        grounded = SearchResult.from_grounding_metadata(grounding_metadata)
+                        if grounded is not None:
+                            grounding.append(grounded)
+                            if self.search_cache is not None and thread_ts is not None:
+                                self.search_cache.record_result(thread_ts, grounded, reader=self.agent_name)
+
                     # Extract text from event content
+                    event_text = ""
                     if hasattr(event, 'content') and event.content:
-                        for part in event.content.parts:
+                        for part in event.content.parts or []:
                             if hasattr(part, 'text') and part.text:
-                                response_text += part.text
+                                event_text += part.text
+                    response_text += event_text
+
+                    if self.cassette_mode == "record":
+                        now = time.perf_counter()
+                        chunks.append({"text": event_text, "delay_s": now - last_event_at})
+                        last_event_at = now
+
+                # Only completed runs are recorded
+                recorded_chunks.extend(chunks)
+                recorded_grounding.extend(grounding)
+                completed[0] = True
 
             except Exception as e:
-                logger.error(f"[{self.agent_name}] Error generating response: {e}", exc_info=True)
+                LLM_CALL_ERRORS.inc(role=self.role)
+                logger.error("[%s] Error generating response: %s", self.agent_name, e, exc_info=True)
                 return f"Error generating response: {str(e)}"
 
             return response_text if response_text else "No response generated"
 
-        # Run async function in sync context
-        return asyncio.run(_get_response())
+        # Run on the shared background loop so the genai client (bound to
+        # that loop) keeps its connections between calls
+        with get_tracer().start_span(
+            "llm.generate",
+            attributes={"agent": self.agent_name, "role": self.role, "prompt_length": len(text)}
+        ) as span:
+            with LLM_CALL_SECONDS.time(role=self.role):
+                if self.cassette_mode == "replay":
+                    recording = self.cassette.load(self.role, prompt)
+                    response = self._replay_response(prompt, recording, usage, cancel_token, thread_ts)
+                    completed[0] = recording is not None
+                else:
+                    response = self._run_cancellable(_get_response(), cancel_token)
+            span.set_attribute("response_length", len(response))
+            span.set_attribute("total_tokens", usage.total_tokens)
+
+        if completed[0] and shown_queries:
+            self.search_cache.mark_shown(thread_ts, self.agent_name, shown_queries)
+
+        # Keyed on the prompt actually sent, search results included
+        if recorded_chunks:
+            try:
+                self.cassette.save(
+                    self.role, prompt, recorded_chunks, usage,
+                    grounding=[result.to_dict() for result in recorded_grounding]
+                )
+            except OSError as e:
+                logger.warning("[%s] Failed to save cassette recording: %s", self.agent_name, e)
+
+        # Turns with tool round trips resend the prompt, so only single calls calibrate
+        if usage.calls == 1 and usage.prompt_tokens:
+            LLM_PROMPT_TOKEN_RATIO.observe(usage.prompt_tokens / max(estimated_tokens, 1), role=self.role)
+            if self.token_calibration is not None:
+                self.token_calibration.record(estimated_tokens, usage.prompt_tokens)
+
+        self.last_usage = usage
+        if self.usage_tracker and usage.calls:
+            self.usage_tracker.record(
+                agent_name=self.agent_name,
+                usage=usage,
+                channel=channel,
+                thread_ts=thread_ts
+            )
+
+        return response
+
+    def _run_cancellable(self, coro, cancel_token: Optional[CancellationToken]) -> str:
+        """
+        Run a coroutine on the background loop, aborting it on cancel.
+
+        Args:
+            coro: Coroutine to run
+            cancel_token: Optional cancellation token
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            OperationCancelled: If the token was cancelled before the coroutine finished
+        """
+        future = get_background_loop().submit(coro)
+        if cancel_token is None:
+            return future.result()
+
+        cancel_token.add_callback(future.cancel)
+        try:
+            return future.result()
+        except CancelledError:
+            LLM_CALLS_CANCELLED.inc(role=self.role)
+            logger.info("[%s] Generation cancelled: %s", self.agent_name, cancel_token.reason)
+            raise OperationCancelled(cancel_token.reason or "cancelled") from None
+        finally:
+            cancel_token.remove_callback(future.cancel)
+
+    def _replay_response(
+        self,
+        text: str,
+        recording: Optional[Dict[str, Any]],
+        usage: TokenUsage,
+        cancel_token: Optional[CancellationToken] = None,
+        thread_ts: Optional[str] = None
+    ) -> str:
+        """
+        Serve a response from the cassette instead of calling the model.
+
+        The searches recorded with the response go into the search cache as
+        a live run would put them, so later prompts match their recordings.
+
+        Args:
+            text: Prompt text sent (recordings are keyed by role + prompt hash)
+            recording: Recording loaded for the prompt, or None
+            usage: TokenUsage to fill with the recorded usage
+            cancel_token: Optional token, checked before each replayed chunk
+            thread_ts: Debate the recorded searches are cached for
+
+        Returns:
+            Recorded response text, or an error string if nothing was recorded
+
+        Raises:
+            OperationCancelled: If cancel_token was cancelled during the replay
+        """
+        if recording is None:
+            LLM_CALL_ERRORS.inc(role=self.role)
+            key = Cassette.key(self.role, text)
+            logger.warning("[%s] No cassette recording for key: %s", self.agent_name, key)
+            return f"Error generating response: no cassette recording for {key}"
+
+        try:
+            response_text = Cassette.replay(recording, self.replay_speed, cancel_token)
+        except OperationCancelled:
+            LLM_CALLS_CANCELLED.inc(role=self.role)
+            logger.info("[%s] Replay cancelled: %s", self.agent_name, cancel_token.reason)
+            raise
+        usage.add(Cassette.recorded_usage(recording))
+        if self.search_cache is not None and thread_ts is not None:
+            for data in recording.get("grounding", []):
+                self.search_cache.record_result(thread_ts, SearchResult.from_dict(data), reader=self.agent_name)
+        return response_text if response_text else "No response generated"
@@ -0,0 +1,140 @@
+"""On-disk cassettes of ADK event streams for record/replay benchmarking."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.llm.usage import TokenUsage
+from src.utils.cancellation import CancellationToken
+
+CASSETTE_MODES = ("record", "replay")
+
+
+class Cassette:
+    """
+    Stores one JSON recording per (role, prompt) in a directory.
+
+    A recording holds the text chunk and inter-event delay of every event
+    from one runner.run_async call, plus the token usage of the run and the
+    searches the model ran during it.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initialize Cassette.
+
+        Args:
+            directory: Directory holding recordings (created on first save)
+        """
+        self.directory = directory
+
+    @staticmethod
+    def key(role: str, prompt: str) -> str:
+        """Return the recording key for a role and prompt."""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:32]
+        return f"{role}-{digest}"
+
+    def _path(self, role: str, prompt: str) -> str:
+        return os.path.join(self.directory, f"{self.key(role, prompt)}.json")
+
+    def load(self, role: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the recording for a role and prompt.
+
+        Returns:
+            Recording dict, or None if nothing was recorded
+        """
+        try:
+            with open(self._path(role, prompt), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(
+        self,
+        role: str,
+        prompt: str,
+        chunks: List[Dict[str, Any]],
+        usage: TokenUsage,
+        grounding: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """
+        Save a recording (atomically replacing any previous one).
+
+        Args:
+            role: Agent role
+            prompt: Prompt text sent to the agent
+            chunks: [{"text": str, "delay_s": float}, ...] in event order
+            usage: Token usage of the run
+            grounding: Searches the model ran (SearchResult.to_dict() each)
+
+        Returns:
+            Path of the written recording
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(role, prompt)
+        recording = {
+            "role": role,
+            "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            "prompt_length": len(prompt),
+            "recorded_at": time.time(),
+            "chunks": chunks,
+            "usage": usage.to_dict(),
+            "grounding": grounding or []
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(recording, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    @staticmethod
+    def replay(
+        recording: Dict[str, Any],
+        speed: float = 1.0,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> str:
+        """
+        Replay a recording, sleeping between chunks as originally timed.
+
+        Args:
+            recording: Recording dict from load()
+            speed: Timing scale (1.0 = original, 2.0 = twice as fast, 0 = no delay)
+            cancel_token: Optional token, checked before each chunk; cancelling
+                it also cuts the current delay short
+
+        Returns:
+            Concatenated response text
+
+        Raises:
+            OperationCancelled: If cancel_token was cancelled before the last chunk
+        """
+        woken = threading.Event()
+        if cancel_token is not None:
+            cancel_token.add_callback(woken.set)
+        try:
+            text = ""
+            for chunk in recording.get("chunks", []):
+                if speed > 0 and chunk.get("delay_s"):
+                    woken.wait(chunk["delay_s"] / speed)
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                text += chunk.get("text", "")
+            return text
+        finally:
+            if cancel_token is not None:
+                cancel_token.remove_callback(woken.set)
+
+    @staticmethod
+    def recorded_usage(recording: Dict[str, Any]) -> TokenUsage:
+        """Return the token usage stored in a recording."""
+        usage = recording.get("usage", {})
+        return TokenUsage(
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            candidate_tokens=usage.get("candidate_tokens", 0),
+            cached_tokens=usage.get("cached_tokens", 0),
+            calls=usage.get("calls", 0)
+        )
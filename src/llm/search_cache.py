@@ -0,0 +1,402 @@
+"""Debate-scoped cache of web search results shared by the three agents."""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.llm.tokens import estimate_tokens, truncate_to_tokens
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+
+logger = setup_logger(__name__)
+
+SEARCH_CACHE_LOOKUPS = REGISTRY.counter(
+    "search_cache_lookups_total", "Search cache lookups by result (hit/global_hit/miss)", ["result"]
+)
+SEARCH_QUERIES = REGISTRY.counter(
+    "search_queries_total",
+    "Searches the model ran during agent turns, by whether the debate had already run them (new/repeat)",
+    ["result"]
+)
+SEARCH_RESULTS_SERVED = REGISTRY.counter(
+    "search_cache_served_total", "Cached search results placed in agent prompts instead of searching again"
+)
+
+SEARCH_HEADER = (
+    "[이 토론에서 이미 검색한 결과]\n"
+    "같은 검색을 반복하지 말고 아래 결과를 근거로 사용하세요. 새로운 정보가 필요할 때만 검색하세요."
+)
+# Entries that would be cut below this many tokens wait for the next turn
+MIN_ENTRY_TOKENS = 30
+MAX_SOURCES = 3
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    Cache key for a search query.
+
+    Case, punctuation and word order are ignored, so "원격 근무 생산성"
+    and "생산성, 원격 근무" share one entry.
+    """
+    return " ".join(sorted(set(_WORD_PATTERN.findall(query.lower()))))
+
+
+@dataclass
+class SearchResult:
+    """Condensed outcome of one search (or one grounded model turn)."""
+
+    queries: Tuple[str, ...]
+    summary: str
+    sources: List[Tuple[str, str]] = field(default_factory=list)  # (title, uri)
+    fetched_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_grounding_metadata(cls, metadata: Any) -> Optional["SearchResult"]:
+        """
+        Build a result from a genai grounding_metadata object.
+
+        The grounded text segments become the summary and the web chunks
+        the sources. Queries share one result because the metadata does
+        not say which query produced which chunk.
+
+        Args:
+            metadata: GroundingMetadata (fields may be None)
+
+        Returns:
+            SearchResult, or None if the model ran no search
+        """
+        queries = [q for q in getattr(metadata, "web_search_queries", None) or [] if q and q.strip()]
+        if not queries:
+            return None
+
+        sources = []
+        for chunk in getattr(metadata, "grounding_chunks", None) or []:
+            web = getattr(chunk, "web", None)
+            if web is not None and getattr(web, "uri", None):
+                source = (getattr(web, "title", None) or web.uri, web.uri)
+                if source not in sources:
+                    sources.append(source)
+
+        segments = []
+        for support in getattr(metadata, "grounding_supports", None) or []:
+            text = getattr(getattr(support, "segment", None), "text", None)
+            if text and text.strip() not in segments:
+                segments.append(text.strip())
+
+        return cls(queries=tuple(queries), summary=" ".join(segments), sources=sources)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form (e.g., for cassette recordings)."""
+        return {
+            "queries": list(self.queries),
+            "summary": self.summary,
+            "sources": [list(source) for source in self.sources],
+            "fetched_at": self.fetched_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SearchResult":
+        """Inverse of to_dict()."""
+        return cls(
+            queries=tuple(data["queries"]),
+            summary=data.get("summary", ""),
+            sources=[tuple(source) for source in data.get("sources", [])],
+            fetched_at=data.get("fetched_at", time.time())
+        )
+
+    @property
+    def label(self) -> str:
+        """The result's queries as one line, for prompts and logs."""
+        return ", ".join(self.queries)
+
+
+class _DebateEntries:
+    """Results cached for one debate and which agents have seen them."""
+
+    def __init__(self) -> None:
+        self.results: "OrderedDict[str, SearchResult]" = OrderedDict()
+        self.shown: Dict[str, Set[Tuple[str, ...]]] = {}  # reader -> result queries
+        self.shared: Set[Tuple[str, ...]] = set()  # result queries already given to every reader
+
+
+class SearchCache:
+    """
+    Thread-safe search result cache shared by the debate agents.
+
+    Results are kept per debate (thread_ts), so a query run by one agent
+    is known to the others for the rest of the debate. With ttl_s > 0
+    results are also shared across debates until they are that old.
+
+    Gemini's google_search tool runs on the model side, so agent turns
+    cannot be answered from the cache directly. Instead each agent's
+    grounding metadata is recorded here and the results it has not seen
+    yet are placed in its next prompt; searches run outside the model
+    (e.g., a research step) go through get_or_search(), which also
+    merges concurrent identical queries into one call.
+    """
+
+    def __init__(
+        self,
+        ttl_s: float = 0.0,
+        max_debates: int = 256,
+        max_entries: int = 64,
+        token_budget: int = 500
+    ) -> None:
+        """
+        Initialize SearchCache.
+
+        Args:
+            ttl_s: Seconds results stay usable by other debates (0 = debate only)
+            max_debates: Debates kept before the least recently used is dropped
+            max_entries: Results kept per debate (and x max_debates globally)
+            token_budget: Max estimated tokens of cached results added to one prompt
+        """
+        self.ttl_s = ttl_s
+        self.max_debates = max_debates
+        self.max_entries = max_entries
+        self.token_budget = token_budget
+
+        self._debates: "OrderedDict[str, _DebateEntries]" = OrderedDict()
+        self._global: "OrderedDict[str, SearchResult]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+
+    def _entries(self, debate_id: str) -> _DebateEntries:
+        """Entries of a debate, created on first use (caller holds the lock)."""
+        entries = self._debates.get(debate_id)
+        if entries is None:
+            entries = self._debates[debate_id] = _DebateEntries()
+            while len(self._debates) > self.max_debates:
+                self._debates.popitem(last=False)
+        else:
+            self._debates.move_to_end(debate_id)
+        return entries
+
+    def _store(self, debate_id: str, key: str, result: SearchResult) -> None:
+        """Add a result under key (caller holds the lock)."""
+        results = self._entries(debate_id).results
+        results[key] = result
+        results.move_to_end(key)
+        while len(results) > self.max_entries:
+            results.popitem(last=False)
+
+        if self.ttl_s > 0:
+            self._global[key] = result
+            self._global.move_to_end(key)
+            while len(self._global) > self.max_entries * self.max_debates:
+                self._global.popitem(last=False)
+
+    def _lookup(self, debate_id: str, key: str) -> Tuple[Optional[SearchResult], str]:
+        """Find a result in the debate, then globally (caller holds the lock)."""
+        entries = self._debates.get(debate_id)
+        if entries is not None and key in entries.results:
+            return entries.results[key], "hit"
+
+        result = self._global.get(key)
+        if result is not None and time.time() - result.fetched_at <= self.ttl_s:
+            self._store(debate_id, key, result)
+            return result, "global_hit"
+        return None, "miss"
+
+    def get(self, debate_id: str, query: str) -> Optional[SearchResult]:
+        """
+        Look up a query for a debate.
+
+        Returns:
+            Cached SearchResult, or None on a miss
+        """
+        with self._lock:
+            result, outcome = self._lookup(debate_id, normalize_query(query))
+        SEARCH_CACHE_LOOKUPS.inc(result=outcome)
+        return result
+
+    def put(self, debate_id: str, result: SearchResult) -> None:
+        """Cache a result under each of its queries."""
+        with self._lock:
+            for query in result.queries:
+                self._store(debate_id, normalize_query(query), result)
+
+    def get_or_search(
+        self,
+        debate_id: str,
+        query: str,
+        search: Callable[[str], SearchResult]
+    ) -> SearchResult:
+        """
+        Return the cached result for a query, running search() on a miss.
+
+        Concurrent calls for the same debate and query wait for the first
+        one instead of searching again. Failed searches are not cached.
+
+        Args:
+            debate_id: Debate (thread_ts) the search belongs to
+            query: Search query
+            search: Function running the search for a query
+
+        Returns:
+            SearchResult for the query
+
+        Raises:
+            Exception: Whatever search() raised
+        """
+        key = normalize_query(query)
+        with self._lock:
+            result, outcome = self._lookup(debate_id, key)
+            pending = self._inflight.get((debate_id, key)) if result is None else None
+            if result is None and pending is None:
+                future = self._inflight[(debate_id, key)] = Future()
+
+        if result is not None:
+            SEARCH_CACHE_LOOKUPS.inc(result=outcome)
+            return result
+        if pending is not None:
+            SEARCH_CACHE_LOOKUPS.inc(result="hit")
+            return pending.result()
+
+        SEARCH_CACHE_LOOKUPS.inc(result="miss")
+        try:
+            result = search(query)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            with self._lock:
+                self._store(debate_id, key, result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop((debate_id, key), None)
+
+    def record_grounding(self, debate_id: str, metadata: Any, reader: Optional[str] = None) -> int:
+        """
+        Cache the searches the model ran during an agent turn.
+
+        Args:
+            debate_id: Debate (thread_ts) of the turn
+            metadata: The model response's grounding_metadata
+            reader: Agent that ran the search (it is not shown the result again)
+
+        Returns:
+            Number of queries the debate had not searched before
+        """
+        result = SearchResult.from_grounding_metadata(metadata)
+        if result is None:
+            return 0
+        return self.record_result(debate_id, result, reader)
+
+    def record_result(self, debate_id: str, result: SearchResult, reader: Optional[str] = None) -> int:
+        """
+        Cache a search an agent ran during its turn (see record_grounding()).
+
+        Cassette replays use this directly with the result stored in the recording.
+
+        Returns:
+            Number of queries the debate had not searched before
+        """
+        new = 0
+        with self._lock:
+            entries = self._entries(debate_id)
+            for query in result.queries:
+                key = normalize_query(query)
+                if key in entries.results:
+                    # Keep the first result so readers are not shown it again
+                    SEARCH_QUERIES.inc(result="repeat")
+                    continue
+                SEARCH_QUERIES.inc(result="new")
+                self._store(debate_id, key, result)
+                new += 1
+            if reader is not None:
+                entries.shown.setdefault(reader, set()).add(result.queries)
+
+        logger.debug("Cached grounding for %s: %s (%d new)", debate_id, result.label, new)
+        return new
+
+    def render_unseen(self, debate_id: str, reader: str) -> Tuple[str, List[Tuple[str, ...]]]:
+        """
+        Cached results of a debate the reader has not been shown yet.
+
+        Agents keep their own session history, so each result is placed in
+        a given agent's prompt once; results over the token budget are left
+        for the reader's next turn. Nothing is marked as shown here: call
+        mark_shown() with the returned queries once the prompt was
+        actually delivered, so a failed call shows them again next turn.
+
+        Args:
+            debate_id: Debate (thread_ts)
+            reader: Agent the block is for
+
+        Returns:
+            (block to put before the prompt or "", result queries in the block)
+        """
+        included: List[Tuple[str, ...]] = []
+        with self._lock:
+            entries = self._debates.get(debate_id)
+            if entries is None:
+                return "", included
+            shown = entries.shown.get(reader, set())
+            unseen = []
+            for result in entries.results.values():
+                if result.queries in shown or result.queries in entries.shared:
+                    continue
+                if all(r.queries != result.queries for r in unseen):
+                    unseen.append(result)
+
+            lines = [SEARCH_HEADER]
+            used = estimate_tokens(SEARCH_HEADER)
+            for result in unseen:
+                remaining = self.token_budget - used - 1
+                if remaining < MIN_ENTRY_TOKENS:
+                    break
+                lines.append(truncate_to_tokens(format_result(result), remaining))
+                used += estimate_tokens(lines[-1]) + 1
+                included.append(result.queries)
+
+        if not included:
+            return "", included
+        return "\n".join(lines), included
+
+    def mark_shown(self, debate_id: str, reader: str, queries: List[Tuple[str, ...]]) -> None:
+        """
+        Note that render_unseen() results reached the reader, so they are not repeated.
+
+        Args:
+            debate_id: Debate (thread_ts)
+            reader: Agent that was shown the results
+            queries: Result queries returned by render_unseen()
+        """
+        if not queries:
+            return
+        with self._lock:
+            self._entries(debate_id).shown.setdefault(reader, set()).update(queries)
+        SEARCH_RESULTS_SERVED.inc(len(queries))
+
+    def mark_shared(self, debate_id: str, results: List[SearchResult]) -> None:
+        """
+        Note results every agent already has (e.g., in a fact sheet in the
+        debate context), so render_unseen() does not repeat them.
+        """
+        with self._lock:
+            self._entries(debate_id).shared.update(result.queries for result in results)
+
+    def forget(self, debate_id: str) -> None:
+        """Drop a debate's results (global entries stay until they expire)."""
+        with self._lock:
+            self._debates.pop(debate_id, None)
+
+
+def format_result(result: SearchResult) -> str:
+    """One prompt line for a result: query, summary and source titles."""
+    line = f"- {result.label}"
+    summary = " ".join(result.summary.split())
+    if summary:
+        line += f": {summary}"
+    if result.sources:
+        line += " (출처: " + ", ".join(title for title, _ in result.sources[:MAX_SOURCES]) + ")"
+    return line
@@ -0,0 +1,129 @@
+"""Cheap token-count estimates for budgeting prompt text without calling a tokenizer."""
+
+import math
+import threading
+from typing import Dict, Tuple
+
+# Rough Gemini ratios: ~4 characters per token for Latin text, and about
+# one token per Hangul syllable / CJK character
+CHARS_PER_TOKEN = 4.0
+WIDE_TOKENS_PER_CHAR = 1.0
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate how many tokens a text uses.
+
+    Args:
+        text: Prompt or response text
+
+    Returns:
+        Estimated token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    # Hangul/CJK take 3 bytes in UTF-8 and ASCII 1, so the byte length
+    # counts wide characters without a Python-level loop
+    wide = (len(text.encode("utf-8")) - len(text)) // 2
+    narrow = len(text) - wide
+    return math.ceil(wide * WIDE_TOKENS_PER_CHAR + narrow / CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, ellipsis: str = "…") -> str:
+    """
+    Cut text so its estimate fits in max_tokens.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token allowance
+        ellipsis: Appended when the text was cut
+
+    Returns:
+        The text unchanged if it fits, otherwise its longest fitting prefix plus ellipsis
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle] + ellipsis) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low].rstrip() + ellipsis
+
+
+class TokenCalibration:
+    """
+    Running fit of the prompt token counts the model reports against
+    local estimates for the same prompts.
+
+    The fit is actual ≈ overhead + scale × estimated; overhead absorbs
+    what the estimate never sees (system instruction, tool declarations).
+    Until min_samples calls are recorded estimates are used as-is.
+    """
+
+    def __init__(self, min_samples: int = 20) -> None:
+        """
+        Initialize TokenCalibration.
+
+        Args:
+            min_samples: Recorded calls needed before estimates are adjusted
+        """
+        self.min_samples = min_samples
+        self._n = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, estimated: int, actual: int) -> None:
+        """Add one call's estimated and reported prompt tokens."""
+        if estimated <= 0 or actual <= 0:
+            return
+        with self._lock:
+            self._n += 1
+            self._sum_x += estimated
+            self._sum_y += actual
+            self._sum_xx += estimated * estimated
+            self._sum_xy += estimated * actual
+
+    @property
+    def samples(self) -> int:
+        """Number of recorded calls."""
+        return self._n
+
+    def fit(self) -> Tuple[float, float]:
+        """
+        Least-squares (scale, overhead) of the recorded calls.
+
+        Returns:
+            (1.0, 0.0) before min_samples; a scale-only fit while the
+            estimates are too alike to separate the overhead
+        """
+        with self._lock:
+            n, sum_x, sum_y, sum_xx, sum_xy = self._n, self._sum_x, self._sum_y, self._sum_xx, self._sum_xy
+        if n < max(self.min_samples, 1):
+            return 1.0, 0.0
+
+        variance = n * sum_xx - sum_x * sum_x
+        if variance > 1e-9 * sum_xx * n:
+            scale = (n * sum_xy - sum_x * sum_y) / variance
+            overhead = (sum_y - scale * sum_x) / n
+            if scale > 0 and overhead >= 0:
+                return scale, overhead
+        return sum_y / sum_x, 0.0
+
+    def adjust(self, estimated: int) -> int:
+        """Calibrated prompt tokens for an estimate."""
+        scale, overhead = self.fit()
+        return math.ceil(overhead + scale * estimated)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current fit (for logging / JSON)."""
+        scale, overhead = self.fit()
+        return {"samples": self.samples, "scale": scale, "overhead": overhead}
@@ -0,0 +1,243 @@
+"""Token usage and cost accounting for ADK agent runs."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class TokenUsage:
+    """Token counts reported by the model for one or more calls."""
+
+    prompt_tokens: int = 0
+    candidate_tokens: int = 0
+    cached_tokens: int = 0
+    calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus candidate tokens."""
+        return self.prompt_tokens + self.candidate_tokens
+
+    @classmethod
+    def from_usage_metadata(cls, metadata: Any) -> "TokenUsage":
+        """
+        Build TokenUsage from a genai usage_metadata object.
+
+        Args:
+            metadata: GenerateContentResponseUsageMetadata (fields may be None)
+
+        Returns:
+            TokenUsage for a single model call
+        """
+        return cls(
+            prompt_tokens=getattr(metadata, "prompt_token_count", None) or 0,
+            candidate_tokens=getattr(metadata, "candidates_token_count", None) or 0,
+            cached_tokens=getattr(metadata, "cached_content_token_count", None) or 0,
+            calls=1
+        )
+
+    def add(self, other: "TokenUsage") -> None:
+        """Accumulate another usage record into this one."""
+        self.prompt_tokens += other.prompt_tokens
+        self.candidate_tokens += other.candidate_tokens
+        self.cached_tokens += other.cached_tokens
+        self.calls += other.calls
+
+    def to_dict(self) -> Dict[str, int]:
+        """Return counts as a plain dict (for logging / JSON)."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "candidate_tokens": self.candidate_tokens,
+            "cached_tokens": self.cached_tokens,
+            "total_tokens": self.total_tokens,
+            "calls": self.calls
+        }
+
+
+class UsageTracker:
+    """
+    Thread-safe aggregation of token usage.
+
+    Usage is aggregated per agent, per debate (thread_ts), per channel
+    and per day. Per-turn records are kept for each debate until
+    finish_debate() is called. Debate and channel totals are kept for the
+    most recently active max_debates / max_channels keys, and daily totals
+    for the latest max_days days, so a long-running process stays bounded.
+    """
+
+    def __init__(
+        self,
+        input_cost_per_mtok: float = 0.0,
+        output_cost_per_mtok: float = 0.0,
+        cached_cost_per_mtok: float = 0.0,
+        max_debates: int = 1024,
+        max_channels: int = 1024,
+        max_days: int = 31
+    ) -> None:
+        """
+        Initialize UsageTracker.
+
+        Args:
+            input_cost_per_mtok: Price per 1M uncached prompt tokens
+            output_cost_per_mtok: Price per 1M candidate tokens
+            cached_cost_per_mtok: Price per 1M cached prompt tokens
+            max_debates: Debate totals to keep (least recently used are dropped)
+            max_channels: Channel totals to keep (least recently used are dropped)
+            max_days: Daily totals to keep (oldest days are dropped)
+        """
+        self.input_cost_per_mtok = input_cost_per_mtok
+        self.output_cost_per_mtok = output_cost_per_mtok
+        self.cached_cost_per_mtok = cached_cost_per_mtok
+        self.max_debates = max_debates
+        self.max_channels = max_channels
+        self.max_days = max_days
+
+        self._lock = threading.Lock()
+        self._by_agent: Dict[str, TokenUsage] = {}
+        self._by_debate: "OrderedDict[str, TokenUsage]" = OrderedDict()
+        self._by_channel: "OrderedDict[str, TokenUsage]" = OrderedDict()
+        self._by_day: Dict[str, TokenUsage] = {}
+        self._turns: Dict[str, List[Dict[str, Any]]] = {}
+
+    def record(
+        self,
+        agent_name: str,
+        usage: TokenUsage,
+        channel: Optional[str] = None,
+        thread_ts: Optional[str] = None,
+        day: Optional[str] = None
+    ) -> None:
+        """
+        Record usage of one agent turn.
+
+        Args:
+            agent_name: Agent that made the call (e.g., "AgentJamal")
+            usage: Usage summed over the turn's model calls
+            channel: Slack channel ID, if known
+            thread_ts: Thread timestamp identifying the debate, if known
+            day: ISO date key (default: today)
+        """
+        day = day or date.today().isoformat()
+
+        with self._lock:
+            self._bucket(self._by_agent, agent_name).add(usage)
+            self._bucket(self._by_day, day).add(usage)
+            while len(self._by_day) > self.max_days:
+                del self._by_day[min(self._by_day)]
+            if channel:
+                self._recent_bucket(self._by_channel, channel, self.max_channels).add(usage)
+            if thread_ts:
+                self._recent_bucket(self._by_debate, thread_ts, self.max_debates).add(usage)
+                turn = {"agent": agent_name, "day": day}
+                turn.update(usage.to_dict())
+                self._turns.setdefault(thread_ts, []).append(turn)
+
+    @staticmethod
+    def _bucket(buckets: Dict[str, TokenUsage], key: str) -> TokenUsage:
+        if key not in buckets:
+            buckets[key] = TokenUsage()
+        return buckets[key]
+
+    @staticmethod
+    def _recent_bucket(buckets: "OrderedDict[str, TokenUsage]", key: str, capacity: int) -> TokenUsage:
+        """Bucket for key, marked most recently used; evicts the least recent over capacity."""
+        bucket = buckets.pop(key, None) or TokenUsage()
+        buckets[key] = bucket
+        while len(buckets) > capacity:
+            buckets.popitem(last=False)
+        return bucket
+
+    @staticmethod
+    def _copy(usage: Optional[TokenUsage]) -> TokenUsage:
+        if usage is None:
+            return TokenUsage()
+        return TokenUsage(
+            usage.prompt_tokens, usage.candidate_tokens, usage.cached_tokens, usage.calls
+        )
+
+    def get_agent_usage(self, agent_name: str) -> TokenUsage:
+        """Return total usage for an agent."""
+        with self._lock:
+            return self._copy(self._by_agent.get(agent_name))
+
+    def get_debate_usage(self, thread_ts: str) -> TokenUsage:
+        """Return total usage for a debate thread."""
+        with self._lock:
+            return self._copy(self._by_debate.get(thread_ts))
+
+    def get_channel_usage(self, channel: str) -> TokenUsage:
+        """Return total usage for a channel."""
+        with self._lock:
+            return self._copy(self._by_channel.get(channel))
+
+    def get_daily_usage(self, day: Optional[str] = None) -> TokenUsage:
+        """Return total usage for a day (ISO date, default: today)."""
+        day = day or date.today().isoformat()
+        with self._lock:
+            return self._copy(self._by_day.get(day))
+
+    def get_debate_turns(self, thread_ts: str) -> List[Dict[str, Any]]:
+        """Return per-turn usage records for a debate."""
+        with self._lock:
+            return [dict(turn) for turn in self._turns.get(thread_ts, [])]
+
+    def estimate_cost(self, usage: TokenUsage) -> float:
+        """
+        Estimate cost of a usage record using configured prices.
+
+        Args:
+            usage: Usage to price
+
+        Returns:
+            Estimated cost in the currency of the configured prices
+        """
+        uncached = max(usage.prompt_tokens - usage.cached_tokens, 0)
+        return (
+            uncached * self.input_cost_per_mtok
+            + usage.cached_tokens * self.cached_cost_per_mtok
+            + usage.candidate_tokens * self.output_cost_per_mtok
+        ) / 1_000_000
+
+    def is_over_budget(self, thread_ts: str, token_budget: int) -> bool:
+        """
+        Check whether a debate has exceeded its token allowance.
+
+        Args:
+            thread_ts: Thread timestamp identifying the debate
+            token_budget: Allowed total tokens (0 or less means unlimited)
+
+        Returns:
+            True if the debate's total tokens exceed the budget
+        """
+        if token_budget <= 0:
+            return False
+        return self.get_debate_usage(thread_ts).total_tokens > token_budget
+
+    def finish_debate(self, thread_ts: str) -> List[Dict[str, Any]]:
+        """
+        Drop per-turn records for a finished debate.
+
+        Debate totals are kept for reporting until evicted by newer
+        debates (see max_debates).
+
+        Args:
+            thread_ts: Thread timestamp identifying the debate
+
+        Returns:
+            The per-turn records that were dropped
+        """
+        with self._lock:
+            return self._turns.pop(thread_ts, [])
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Return all aggregates as plain dicts."""
+        with self._lock:
+            return {
+                "agents": {k: v.to_dict() for k, v in self._by_agent.items()},
+                "debates": {k: v.to_dict() for k, v in self._by_debate.items()},
+                "channels": {k: v.to_dict() for k, v in self._by_channel.items()},
+                "days": {k: v.to_dict() for k, v in self._by_day.items()}
+            }
@@ -0,0 +1,99 @@
+"""Standalone Google Search calls through Gemini grounding (outside agent turns)."""
+
+import threading
+from typing import Any, Optional
+
+from src.llm.search_cache import SearchResult
+from src.utils.event_loop import get_background_loop
+from src.utils.http_transport import HttpTransport
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+
+logger = setup_logger(__name__)
+
+WEB_SEARCH_SECONDS = REGISTRY.histogram(
+    "web_search_duration_seconds", "Latency of standalone grounded search calls"
+)
+
+SEARCH_PROMPT = (
+    "다음 검색어로 Google 검색을 하고, 토론 근거로 쓸 수 있는 사실(수치, 연도, 출처 기관)을 "
+    "한국어 3~5문장으로 요약하세요. 의견은 쓰지 마세요.\n검색어: {query}"
+)
+
+
+class GeminiSearch:
+    """
+    Runs one web search per call as a grounded Gemini request.
+
+    The model answers with a short factual summary and the grounding
+    metadata supplies the sources, so the result has the same shape as
+    the searches agents run inside their turns.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.0-flash",
+        http_transport: Optional[HttpTransport] = None,
+        timeout_s: Optional[float] = 30.0
+    ) -> None:
+        """
+        Initialize GeminiSearch.
+
+        Args:
+            api_key: Google API key
+            model: Model used for grounded search
+            http_transport: Shared HTTP transport for the genai client
+            timeout_s: Seconds to wait for one search (None = no limit)
+        """
+        self.api_key = api_key
+        self.model = model
+        self.http_transport = http_transport
+        self.timeout_s = timeout_s
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """genai Client (built on first use)."""
+        with self._client_lock:
+            if self._client is None:
+                from google import genai
+
+                http_options = self.http_transport.genai_http_options() if self.http_transport else None
+                self._client = genai.Client(api_key=self.api_key, http_options=http_options)
+            return self._client
+
+    def __call__(self, query: str) -> SearchResult:
+        """
+        Search the web for a query.
+
+        Args:
+            query: Search query
+
+        Returns:
+            SearchResult with the model's summary and grounding sources
+
+        Raises:
+            Exception: If the request fails or times out
+        """
+        from google.genai import types
+
+        async def _search() -> Any:
+            return await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=SEARCH_PROMPT.format(query=query),
+                config=types.GenerateContentConfig(tools=[types.Tool(google_search=types.GoogleSearch())])
+            )
+
+        with WEB_SEARCH_SECONDS.time():
+            response = get_background_loop().run(_search(), timeout=self.timeout_s)
+
+        candidates = getattr(response, "candidates", None) or []
+        metadata = getattr(candidates[0], "grounding_metadata", None) if candidates else None
+        grounded = SearchResult.from_grounding_metadata(metadata) if metadata else None
+        return SearchResult(
+            queries=(query,),
+            summary=(response.text or "").strip(),
+            sources=grounded.sources if grounded else []
+        )
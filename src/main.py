@@ -2,52 +2,97 @@
 
 import sys
 from src.config import Config
-from src.utils.logger import setup_logger
+from src.utils.logger import configure_logging, parse_sample_rates, setup_logger, shutdown_logging
+from src.utils.metrics import start_metrics_server
+from src.utils.tracing import configure_tracing, create_exporter
 from src.llm.adk_agent import ADKAgent
+from src.orchestrator.factory import build_http_transport
 from src.bot.message_processor import MessageProcessor
 from src.bot.slack_handler import SlackBot
+from src.bot.warmup import WarmUp
 
 logger = setup_logger(__name__, Config.LOG_LEVEL)
 
 
 def main():
     """Main function to start the bot."""
+    configure_logging(
+        json_format=Config.LOG_FORMAT == "json",
+        async_mode=Config.LOG_ASYNC,
+        max_length=Config.LOG_MAX_LENGTH,
+        sample_rates=parse_sample_rates(Config.LOG_SAMPLE_RATES)
+    )
+
+    slack_bot = None
+    http_transport = None
     try:
-        logger.info(f"Starting {Config.AGENT_NAME} ({Config.AGENT_ROLE})...")
+        logger.info("Starting %s (%s)...", Config.AGENT_NAME, Config.AGENT_ROLE)
 
         # Validate configuration
         Config.validate()
         logger.info("Configuration validated successfully")
 
+        # Configure span exporter for latency tracing
+        configure_tracing(create_exporter(Config.TRACE_EXPORTER, Config.TRACE_FILE))
+
+        # Shared keep-alive pool for Slack and model HTTP calls
+        http_transport = build_http_transport()
+
         # Initialize ADKAgent with role
         adk_agent = ADKAgent(
             api_key=Config.GOOGLE_GENAI_API_KEY,
             role=Config.AGENT_ROLE,
-            model="gemini-2.0-flash"
+            model="gemini-2.0-flash",
+            lazy=Config.LAZY_INIT,
+            http_transport=http_transport
         )
-        logger.info(f"{Config.AGENT_NAME} initialized with role: {Config.AGENT_ROLE}")
+        logger.info("%s initialized with role: %s", Config.AGENT_NAME, Config.AGENT_ROLE)
 
         # Initialize MessageProcessor with ADKAgent
         # Note: ADKAgent manages tools internally, no need for tool_handlers
         message_processor = MessageProcessor(adk_agent)
 
         # Initialize SlackBot
-        slack_bot = SlackBot(message_processor)
+        bot_client = None
+        if http_transport is not None:
+            bot_client = http_transport.slack_client(token=Config.SLACK_BOT_TOKEN_JAMAL or Config.SLACK_BOT_TOKEN)
+        slack_bot = SlackBot(message_processor, client=bot_client, debounce_ms=Config.MENTION_DEBOUNCE_MS)
+
+        # Post-connect warm-up (lazy agent build, optional connection priming)
+        warmup = WarmUp(
+            slack_clients={"bot": slack_bot.app.client} if Config.WARMUP_ENABLED else {},
+            agents=[adk_agent],
+            prime_model=Config.WARMUP_ENABLED
+        )
+
+        # Expose Prometheus metrics (and /ready) on a local port if configured
+        if Config.METRICS_PORT:
+            start_metrics_server(Config.METRICS_PORT, Config.METRICS_HOST, ready=warmup.ready)
+            logger.info("Metrics endpoint listening on %s:%s/metrics", Config.METRICS_HOST, Config.METRICS_PORT)
 
         # Start bot
-        logger.info(f"{Config.AGENT_NAME} initialization complete. Starting Socket Mode handler...")
-        slack_bot.start()
+        logger.info("%s initialization complete. Starting Socket Mode handler...", Config.AGENT_NAME)
+        slack_bot.start(on_connected=warmup.run)
 
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         logger.error("Please check your .env file and ensure all required variables are set.")
         sys.exit(1)
     except KeyboardInterrupt:
-        logger.info(f"{Config.AGENT_NAME} stopped by user")
+        logger.info("%s stopped by user", Config.AGENT_NAME)
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         sys.exit(1)
+    finally:
+        # Settle debounced mentions and queued reactions, then release
+        # pooled connections, while logging still works
+        if slack_bot is not None:
+            slack_bot.close()
+        if http_transport is not None:
+            http_transport.close()
+        # Flush records still queued for the background writer
+        shutdown_logging()
 
 
 if __name__ == "__main__":
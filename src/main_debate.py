@@ -1,19 +1,58 @@
 """Main entry point for Multi-Agent Debate Orchestrator."""
 
+import signal
 import sys
 from slack_sdk import WebClient
 from src.config import Config
-from src.utils.logger import setup_logger
-from src.llm.adk_agent import ADKAgent
+from src.utils.logger import configure_logging, parse_sample_rates, setup_logger, shutdown_logging
+from src.utils.metrics import start_metrics_server
+from src.utils.tracing import configure_tracing, create_exporter, get_tracer
 from src.bot.message_processor import MessageProcessor
 from src.bot.slack_handler import SlackBot
-from src.orchestrator import DebateOrchestrator
+from src.bot.warmup import WarmUp
+from src.orchestrator import CheckpointStore, DebateOrchestrator, TranscriptStore
+from src.orchestrator.factory import build_http_transport, build_orchestrator, build_usage_tracker
 
 logger = setup_logger(__name__, Config.LOG_LEVEL)
 
 
+def shutdown(slack_bot: SlackBot, orchestrator: DebateOrchestrator, http_transport=None) -> None:
+    """
+    Drain and stop the bot.
+
+    Stops accepting Slack events, lets in-flight debate turns finish
+    (checkpointing the debates for the next process) within
+    SHUTDOWN_TIMEOUT, then flushes transcripts and traces and closes HTTP
+    connections. Logs are flushed by shutdown_logging() in main().
+
+    Args:
+        slack_bot: Running SlackBot
+        orchestrator: DebateOrchestrator to drain
+        http_transport: Optional shared HTTP transport to close
+    """
+    logger.info("Shutting down: draining in-flight debates...")
+    slack_bot.close()
+    result = orchestrator.shutdown(timeout=Config.SHUTDOWN_TIMEOUT)
+    logger.info(
+        "Shutdown drain finished | drained: %d | unfinished: %d",
+        result["drained"], result["unfinished"]
+    )
+    if orchestrator.transcript_store is not None:
+        orchestrator.transcript_store.close()
+    get_tracer().shutdown()
+    if http_transport is not None:
+        http_transport.close()
+
+
 def main():
     """Main function to start the multi-agent debate orchestrator."""
+    configure_logging(
+        json_format=Config.LOG_FORMAT == "json",
+        async_mode=Config.LOG_ASYNC,
+        max_length=Config.LOG_MAX_LENGTH,
+        sample_rates=parse_sample_rates(Config.LOG_SAMPLE_RATES)
+    )
+
     try:
         logger.info("Starting Multi-Agent Debate Orchestrator...")
 
@@ -21,72 +60,97 @@ def main():
         Config.validate()
         logger.info("Configuration validated successfully")
 
-        # Initialize all three agents
-        logger.info("Initializing AgentJamal (Proposer)...")
-        jamal_agent = ADKAgent(
-            api_key=Config.GOOGLE_GENAI_API_KEY,
-            role="proposer",
-            model="gemini-2.0-flash"
-        )
-
-        logger.info("Initializing AgentRyan (Opposer)...")
-        ryan_agent = ADKAgent(
-            api_key=Config.GOOGLE_GENAI_API_KEY,
-            role="opposer",
-            model="gemini-2.0-flash"
-        )
-
-        logger.info("Initializing AgentJames (Mediator)...")
-        james_agent = ADKAgent(
-            api_key=Config.GOOGLE_GENAI_API_KEY,
-            role="mediator",
-            model="gemini-2.0-flash"
-        )
+        # Configure span exporter for latency tracing
+        configure_tracing(create_exporter(Config.TRACE_EXPORTER, Config.TRACE_FILE))
 
-        logger.info("All agents initialized successfully")
+        # Shared keep-alive pool for Slack and model HTTP calls
+        http_transport = build_http_transport()
 
         # Initialize 3 separate Slack clients for each agent
         # This allows each agent to post messages as their own bot identity
-        jamal_client = WebClient(token=Config.SLACK_BOT_TOKEN_JAMAL)
-        ryan_client = WebClient(token=Config.SLACK_BOT_TOKEN_RYAN)
-        james_client = WebClient(token=Config.SLACK_BOT_TOKEN_JAMES)
+        # With pooling enabled they (and the Bolt app) share one connection pool
+        def _slack_client(token: str) -> WebClient:
+            if http_transport is not None:
+                return http_transport.slack_client(token=token)
+            return WebClient(token=token)
+
+        jamal_client = _slack_client(Config.SLACK_BOT_TOKEN_JAMAL)
+        ryan_client = _slack_client(Config.SLACK_BOT_TOKEN_RYAN)
+        james_client = _slack_client(Config.SLACK_BOT_TOKEN_JAMES)
         logger.info("Slack clients initialized for all 3 agents")
 
-        # Initialize DebateOrchestrator with 3 separate clients
-        orchestrator = DebateOrchestrator(
-            jamal_client=jamal_client,
-            ryan_client=ryan_client,
-            james_client=james_client,
-            jamal_agent=jamal_agent,
-            ryan_agent=ryan_agent,
-            james_agent=james_agent,
-            max_rounds=10
+        # Local transcript store (also backs the debate search command)
+        transcript_store = TranscriptStore(Config.TRANSCRIPT_DB) if Config.TRANSCRIPTS_ENABLED else None
+
+        # Three agents and the DebateOrchestrator posting with their own clients
+        orchestrator = build_orchestrator(
+            jamal_client, ryan_client, james_client,
+            usage_tracker=build_usage_tracker(),
+            http_transport=http_transport,
+            transcript_store=transcript_store,
+            checkpoint_store=CheckpointStore(Config.CHECKPOINT_DIR) if Config.CHECKPOINT_ENABLED else None
         )
+        jamal_agent, ryan_agent, james_agent = orchestrator.jamal, orchestrator.ryan, orchestrator.james
         logger.info("DebateOrchestrator initialized")
 
+        # Continue debates interrupted by the previous shutdown or crash
+        orchestrator.resume_incomplete(max_age_hours=Config.CHECKPOINT_MAX_AGE_HOURS)
+
         # Initialize MessageProcessor (for backward compatibility, uses Jamal as default)
         message_processor = MessageProcessor(jamal_agent)
 
         # Initialize SlackBot with orchestrator
+        # Bolt app uses Jamal's token (Socket Mode connection)
         slack_bot = SlackBot(
             message_processor=message_processor,
-            debate_orchestrator=orchestrator
+            debate_orchestrator=orchestrator,
+            client=_slack_client(Config.SLACK_BOT_TOKEN_JAMAL) if http_transport is not None else None,
+            transcript_store=transcript_store,
+            debounce_ms=Config.MENTION_DEBOUNCE_MS
         )
 
         # Start bot
+        # Post-connect warm-up: builds lazy agents and, if enabled, primes
+        # Slack and model connections before reporting ready
+        warmup = WarmUp(
+            slack_clients={
+                "jamal": jamal_client,
+                "ryan": ryan_client,
+                "james": james_client,
+                "app": slack_bot.app.client
+            } if Config.WARMUP_ENABLED else {},
+            agents=[jamal_agent, ryan_agent, james_agent],
+            prime_model=Config.WARMUP_ENABLED
+        )
+
+        # Expose Prometheus metrics (and /ready) on a local port if configured
+        if Config.METRICS_PORT:
+            start_metrics_server(Config.METRICS_PORT, Config.METRICS_HOST, ready=warmup.ready)
+            logger.info("Metrics endpoint listening on %s:%s/metrics", Config.METRICS_HOST, Config.METRICS_PORT)
+
+        # SIGTERM (e.g., rolling deploy) only unblocks start(); the drain below does the work
+        signal.signal(signal.SIGTERM, lambda signum, frame: slack_bot.stop())
+
         logger.info("Multi-Agent Debate Orchestrator initialization complete. Starting Socket Mode handler...")
-        slack_bot.start()
+        try:
+            slack_bot.start(on_connected=warmup.run)
+        except KeyboardInterrupt:
+            logger.info("Multi-Agent Debate Orchestrator stopped by user")
+        shutdown(slack_bot, orchestrator, http_transport)
 
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         logger.error("Please check your .env file and ensure all required variables are set.")
         sys.exit(1)
     except KeyboardInterrupt:
         logger.info("Multi-Agent Debate Orchestrator stopped by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         sys.exit(1)
+    finally:
+        # Flush records still queued for the background writer
+        shutdown_logging()
 
 
 if __name__ == "__main__":
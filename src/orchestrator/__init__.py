@@ -1,4 +1,26 @@
 """Orchestrator package for managing multi-agent debates."""
+from .checkpoint import CheckpointStore, DebateCheckpoint
+from .convergence import RoundController
+from .debate_flow import DebateFlow, TurnNode, get_flow
 from .debate_orchestrator import DebateOrchestrator
+from .prompt_budget import PromptBudget
+from .research import ResearchPhase
+from .retrieval import PriorDebateRetriever
+from .transcripts import TranscriptStore
+from .utterances import Transcript, Utterance
 
-__all__ = ["DebateOrchestrator"]
+__all__ = [
+    "CheckpointStore",
+    "DebateCheckpoint",
+    "DebateFlow",
+    "DebateOrchestrator",
+    "PriorDebateRetriever",
+    "PromptBudget",
+    "ResearchPhase",
+    "RoundController",
+    "Transcript",
+    "TranscriptStore",
+    "TurnNode",
+    "Utterance",
+    "get_flow",
+]
@@ -0,0 +1,167 @@
+"""Per-turn checkpoints of running debates for crash-safe resume."""
+
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+from src.orchestrator.utterances import Transcript, Utterance
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class DebateCheckpoint:
+    """
+    State of a debate after its last completed turn.
+
+    round and step point at the NEXT turn to run (step is the index of
+    the turn's node in the debate flow), so a fresh debate is round 1, step 0.
+    background holds text retrieved before round 1 (e.g., past debates)
+    and fact_sheet the research step's findings, so a resumed debate sees
+    the same context. summary is the latest running summary (see
+    TurnNode.update_instruction) and summary_upto the number of
+    utterances it covers.
+    """
+
+    channel: str
+    thread_ts: str
+    user_id: str
+    topic: str
+    flow: str = "classic"
+    round: int = 1
+    step: int = 0
+    next_speaker: str = "jamal"
+    background: str = ""
+    fact_sheet: str = ""
+    summary: str = ""
+    summary_upto: int = 0
+    utterances: Transcript = field(default_factory=Transcript)
+    updated_at: float = 0.0
+
+    def __post_init__(self) -> None:
+        # Checkpoint files and callers may pass plain dicts
+        if not isinstance(self.utterances, Transcript):
+            self.utterances = Transcript.from_list(self.utterances)
+
+    def record_turn(self, utterance: Utterance, next_speaker: str, steps_per_round: int) -> None:
+        """
+        Append a finished turn and advance to the next one.
+
+        Args:
+            utterance: The finished turn (of the checkpoint's current round)
+            next_speaker: Speaker key of the next turn
+            steps_per_round: Turns per round
+        """
+        self.utterances.append(utterance)
+        self.skip_turn(next_speaker, steps_per_round)
+
+    def skip_turn(self, next_speaker: str, steps_per_round: int) -> None:
+        """
+        Advance to the next turn without an utterance (condition not met).
+
+        Args:
+            next_speaker: Speaker key of the next turn
+            steps_per_round: Turns per round
+        """
+        self.step += 1
+        if self.step >= steps_per_round:
+            self.round += 1
+            self.step = 0
+        self.next_speaker = next_speaker
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["utterances"] = self.utterances.to_list()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DebateCheckpoint":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+class CheckpointStore:
+    """Stores one JSON checkpoint per debate thread in a directory."""
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initialize CheckpointStore.
+
+        Args:
+            directory: Directory holding checkpoints (created on first save)
+        """
+        self.directory = directory
+
+    def _path(self, thread_ts: str) -> str:
+        safe = re.sub(r"[^\w.-]", "_", thread_ts)
+        return os.path.join(self.directory, f"{safe}.json")
+
+    def save(self, checkpoint: DebateCheckpoint) -> None:
+        """Write a checkpoint (atomically replacing the previous one)."""
+        os.makedirs(self.directory, exist_ok=True)
+        checkpoint.updated_at = time.time()
+        path = self._path(checkpoint.thread_ts)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load(self, thread_ts: str) -> Optional[DebateCheckpoint]:
+        """
+        Load the checkpoint for a thread.
+
+        Returns:
+            DebateCheckpoint, or None if there is none
+        """
+        try:
+            with open(self._path(thread_ts), encoding="utf-8") as f:
+                return DebateCheckpoint.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def delete(self, thread_ts: str) -> None:
+        """Remove the checkpoint for a thread (no-op if missing)."""
+        try:
+            os.remove(self._path(thread_ts))
+        except FileNotFoundError:
+            pass
+
+    def list_incomplete(self, max_age_s: float = 0) -> List[DebateCheckpoint]:
+        """
+        Return checkpoints of debates that did not finish.
+
+        Unreadable files are skipped; checkpoints older than max_age_s are
+        deleted instead of returned.
+
+        Args:
+            max_age_s: Max seconds since the last turn (0 = no limit)
+
+        Returns:
+            Checkpoints, oldest first
+        """
+        if not os.path.isdir(self.directory):
+            return []
+
+        checkpoints = []
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    checkpoint = DebateCheckpoint.from_dict(json.load(f))
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning("Skipping unreadable checkpoint %s: %s", path, e)
+                continue
+
+            if max_age_s and now - checkpoint.updated_at > max_age_s:
+                logger.info("Discarding stale checkpoint for thread: %s", checkpoint.thread_ts)
+                self.delete(checkpoint.thread_ts)
+                continue
+            checkpoints.append(checkpoint)
+
+        return sorted(checkpoints, key=lambda c: c.updated_at)
@@ -0,0 +1,197 @@
+"""Adaptive round control: stop debates whose rounds no longer add anything new."""
+
+import re
+from dataclasses import dataclass
+from typing import Collection, Dict, Iterable, List, Optional, Set
+
+from src.orchestrator.utterances import Utterance
+from src.utils.metrics import REGISTRY
+
+ROUND_NOVELTY = REGISTRY.histogram(
+    "debate_round_novelty", "Share of a round's debater text not seen in earlier rounds",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0)
+)
+ROUNDS_STOPPED = REGISTRY.counter(
+    "debate_adaptive_stop_total", "Debates ended early by the round controller, by reason (converged/time/cost)",
+    ["reason"]
+)
+
+# Character n-grams inside words: Korean particles and endings change the
+# word but keep most of its trigrams, so rephrased points still overlap
+SHINGLE_SIZE = 3
+MEDIATOR = "james"
+
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str, n: int = SHINGLE_SIZE) -> Set[str]:
+    """Character n-grams of each word (shorter words are kept whole)."""
+    grams = set()
+    for word in _WORD.findall(text.lower()):
+        if len(word) <= n:
+            grams.add(word)
+        else:
+            grams.update(word[i:i + n] for i in range(len(word) - n + 1))
+    return grams
+
+
+def novelty(grams: Set[str], seen: Set[str]) -> float:
+    """Share of grams not in seen (0.0 for empty text)."""
+    if not grams:
+        return 0.0
+    return len(grams - seen) / len(grams)
+
+
+def drift(previous: str, current: str) -> float:
+    """1 - Jaccard similarity of two texts' shingles (0.0 = same wording)."""
+    a, b = shingles(previous), shingles(current)
+    if not a and not b:
+        return 0.0
+    return 1.0 - len(a & b) / len(a | b)
+
+
+@dataclass
+class RoundSignal:
+    """Novelty of one finished round."""
+
+    round: int
+    # Share of the debaters' text (Jamal, Ryan) not seen in earlier rounds
+    novelty: float
+    # Change of the running summary since the previous round (None without one)
+    drift: Optional[float] = None
+
+
+def round_signals(utterances: Iterable[Utterance], summary_nodes: Collection[str] = ()) -> List[RoundSignal]:
+    """
+    Novelty and summary drift of every round in a transcript.
+
+    Args:
+        utterances: Finished turns, oldest first
+        summary_nodes: Flow node IDs whose turns are running summaries
+
+    Returns:
+        One signal per round, in round order
+    """
+    rounds: Dict[int, List[str]] = {}
+    summaries: Dict[int, str] = {}
+    for utterance in utterances:
+        if utterance.node in summary_nodes:
+            summaries[utterance.round] = utterance.text
+        elif utterance.speaker != MEDIATOR:
+            rounds.setdefault(utterance.round, []).append(utterance.text)
+        else:
+            rounds.setdefault(utterance.round, [])
+
+    signals = []
+    seen: Set[str] = set()
+    for round_num in sorted(rounds):
+        grams = shingles("\n".join(rounds[round_num]))
+        previous_summary = summaries.get(round_num - 1)
+        summary = summaries.get(round_num)
+        signals.append(RoundSignal(
+            round_num,
+            1.0 if not seen else novelty(grams, seen),
+            drift(previous_summary, summary) if previous_summary is not None and summary is not None else None
+        ))
+        seen |= grams
+    return signals
+
+
+class RoundController:
+    """
+    Decides when a debate should stop before max_rounds.
+
+    A debate has converged when, after min_rounds, the last `patience`
+    rounds each brought little new debater text (novelty below
+    novelty_threshold) and the running summary barely changed (drift
+    below drift_threshold, when the flow has a summary turn). Separately,
+    a round is not started when the debate's elapsed time or estimated
+    cost, projected one more round ahead, would go over its budget.
+    """
+
+    def __init__(
+        self,
+        min_rounds: int = 3,
+        novelty_threshold: float = 0.25,
+        drift_threshold: float = 0.35,
+        patience: int = 1,
+        max_seconds: float = 0,
+        max_cost: float = 0
+    ) -> None:
+        """
+        Initialize RoundController.
+
+        Args:
+            min_rounds: Rounds always run before convergence is considered
+            novelty_threshold: Rounds below this novelty count as repetitive
+            drift_threshold: Summaries changing less than this count as stable
+            patience: Consecutive repetitive rounds needed to stop
+            max_seconds: Wall-clock budget per debate (0 = unlimited)
+            max_cost: Estimated cost budget per debate (0 = unlimited)
+        """
+        self.min_rounds = min_rounds
+        self.novelty_threshold = novelty_threshold
+        self.drift_threshold = drift_threshold
+        self.patience = max(patience, 1)
+        self.max_seconds = max_seconds
+        self.max_cost = max_cost
+
+    def is_repetitive(self, signal: RoundSignal) -> bool:
+        """Whether a round added too little to be worth another."""
+        if signal.novelty >= self.novelty_threshold:
+            return False
+        return signal.drift is None or signal.drift < self.drift_threshold
+
+    def converged(self, signals: List[RoundSignal]) -> bool:
+        """
+        Whether the debate should stop after the last round in signals.
+
+        Args:
+            signals: Signals from round_signals (finished rounds only)
+
+        Returns:
+            True if the last `patience` rounds were all repetitive
+        """
+        if not signals or signals[-1].round < self.min_rounds or len(signals) < self.patience:
+            return False
+        return all(self.is_repetitive(signal) for signal in signals[-self.patience:])
+
+    def check(self, utterances: Iterable[Utterance], summary_nodes: Collection[str] = ()) -> bool:
+        """
+        Whether a debate converged, from its transcript.
+
+        Args:
+            utterances: Finished turns, oldest first
+            summary_nodes: Flow node IDs whose turns are running summaries
+
+        Returns:
+            True if the debate should stop
+        """
+        signals = round_signals(utterances, summary_nodes)
+        if signals:
+            ROUND_NOVELTY.observe(signals[-1].novelty)
+        return self.converged(signals)
+
+    def over_budget(self, rounds_done: int, elapsed_s: float, cost: float) -> Optional[str]:
+        """
+        Whether another round would go over the time or cost budget.
+
+        The next round is assumed to take as long and cost as much as the
+        average round so far, so the first round always runs.
+
+        Args:
+            rounds_done: Rounds finished in this debate
+            elapsed_s: Seconds since the debate started
+            cost: Estimated cost so far
+
+        Returns:
+            "time", "cost" or None
+        """
+        if not rounds_done:
+            return None
+        share = (rounds_done + 1) / rounds_done
+        if self.max_seconds > 0 and elapsed_s * share > self.max_seconds:
+            return "time"
+        if self.max_cost > 0 and cost * share > self.max_cost:
+            return "cost"
+        return None
@@ -0,0 +1,166 @@
+"""Declarative turn graphs describing one debate round."""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+SPEAKERS = ("jamal", "ryan", "james")
+
+SUMMARY_INSTRUCTION = "위 내용을 요약하고 AgentRyan에게 전달해주세요."
+SUMMARY_UPDATE_INSTRUCTION = (
+    "이전 요약에 그 뒤의 새 발언을 반영해 토론 전체의 요약을 갱신하고 AgentRyan에게 전달해주세요."
+)
+CHECK_INSTRUCTION = (
+    "합의가 이루어졌거나 논의가 반복되면 '토론을 종료합니다'로 시작하는 최종 결론을 작성하세요. "
+    "그렇지 않으면 AgentJamal에게 추가 의견을 요청하세요."
+)
+QUESTION_INSTRUCTION = (
+    "지금까지의 논의에서 가장 중요한 쟁점 하나를 골라 AgentJamal과 AgentRyan에게 질문하세요."
+)
+CLOSING_INSTRUCTION = (
+    "최근 라운드에서 새로운 논점이 더 나오지 않았습니다. 지금까지의 논의를 정리해 "
+    "'토론을 종료합니다'로 시작하는 최종 결론을 작성하세요."
+)
+# Precedes the previous summary in incremental-mode prompts
+PREVIOUS_SUMMARY_HEADER = "[이전 요약 - 이후의 새 발언만 아래에 이어집니다]"
+ANSWER_INSTRUCTION = "AgentJames의 질문에 당신의 입장에서 답하세요."
+
+
+@dataclass
+class RoundState:
+    """What edge conditions can look at: the round number and this round's responses."""
+
+    round: int
+    responses: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class TurnNode:
+    """
+    One agent turn in a round.
+
+    Attributes:
+        id: Unique node ID within the flow
+        speaker: Agent that speaks ("jamal", "ryan" or "james")
+        instruction: Text appended to the context for this turn (None = context only)
+        mention: Mention appended to the post for the next speaker (visual only)
+        after: IDs of nodes whose output this turn needs (edges); nodes
+            without edges to each other may run concurrently
+        when: Optional edge condition; the turn is skipped if it returns False
+        checks_termination: The response may end the debate (mediator check)
+        update_instruction: Makes the response a running summary. In
+            incremental mode the turn then gets its previous response plus
+            only the turns since, with this instruction instead of
+            `instruction`, so its prompt stops growing with the debate
+    """
+
+    id: str
+    speaker: str
+    instruction: Optional[str] = None
+    mention: Optional[str] = None
+    after: Tuple[str, ...] = ()
+    when: Optional[Callable[[RoundState], bool]] = None
+    checks_termination: bool = False
+    update_instruction: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DebateFlow:
+    """
+    A round as a graph of turns, repeated until termination or max rounds.
+
+    Nodes run in declaration order, which must be a topological order of
+    the `after` edges. Consecutive nodes with no edges between them form a
+    parallel group: they see the same context, run concurrently, and are
+    posted in declaration order.
+    """
+
+    name: str
+    nodes: Tuple[TurnNode, ...]
+
+    def __post_init__(self) -> None:
+        seen = set()
+        for node in self.nodes:
+            if node.id in seen:
+                raise ValueError(f"Flow {self.name}: duplicate node id '{node.id}'")
+            if node.speaker not in SPEAKERS:
+                raise ValueError(f"Flow {self.name}: unknown speaker '{node.speaker}' in node '{node.id}'")
+            for dependency in node.after:
+                if dependency not in seen:
+                    raise ValueError(
+                        f"Flow {self.name}: node '{node.id}' depends on '{dependency}', "
+                        "which must be declared before it"
+                    )
+            seen.add(node.id)
+        if not self.nodes:
+            raise ValueError(f"Flow {self.name}: needs at least one node")
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def parallel_group(self, start: int) -> List[int]:
+        """
+        Indexes of the nodes that can run together starting at `start`.
+
+        Args:
+            start: Index of the first node of the group
+
+        Returns:
+            [start, ...] up to (excluding) the first node that depends on
+            a node already in the group
+        """
+        group = [start]
+        group_ids = {self.nodes[start].id}
+        for index in range(start + 1, len(self.nodes)):
+            node = self.nodes[index]
+            if group_ids.intersection(node.after):
+                break
+            group.append(index)
+            group_ids.add(node.id)
+        return group
+
+
+# Jamal → James (summary) → Ryan → James (check/continue)
+CLASSIC_FLOW = DebateFlow(
+    name="classic",
+    nodes=(
+        TurnNode("proposal", "jamal", mention="@AgentJames"),
+        TurnNode(
+            "summary", "james", SUMMARY_INSTRUCTION, "@AgentRyan",
+            after=("proposal",), update_instruction=SUMMARY_UPDATE_INSTRUCTION
+        ),
+        TurnNode("rebuttal", "ryan", mention="@AgentJames", after=("summary",)),
+        TurnNode(
+            "check", "james", CHECK_INSTRUCTION, "@AgentJamal",
+            after=("rebuttal",), checks_termination=True
+        ),
+    )
+)
+
+# James asks → Jamal and Ryan answer concurrently → James (check/continue)
+PANEL_FLOW = DebateFlow(
+    name="panel",
+    nodes=(
+        TurnNode("question", "james", QUESTION_INSTRUCTION, "@AgentJamal @AgentRyan"),
+        TurnNode("proposer_answer", "jamal", ANSWER_INSTRUCTION, after=("question",)),
+        TurnNode("opposer_answer", "ryan", ANSWER_INSTRUCTION, "@AgentJames", after=("question",)),
+        TurnNode(
+            "check", "james", CHECK_INSTRUCTION, "@AgentJamal @AgentRyan",
+            after=("proposer_answer", "opposer_answer"), checks_termination=True
+        ),
+    )
+)
+
+FLOWS = {flow.name: flow for flow in (CLASSIC_FLOW, PANEL_FLOW)}
+
+
+def get_flow(name: str) -> DebateFlow:
+    """
+    Look up a built-in flow by name.
+
+    Raises:
+        ValueError: If no flow has that name
+    """
+    try:
+        return FLOWS[name]
+    except KeyError:
+        raise ValueError(f"Unknown debate flow: {name}. Must be one of {sorted(FLOWS)}") from None
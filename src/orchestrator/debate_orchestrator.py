@@ -1,13 +1,52 @@
 """Debate Orchestrator for managing multi-agent debate flow."""
 
 import threading
-from typing import Dict, Optional
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
 from slack_sdk import WebClient
 from src.llm.adk_agent import ADKAgent
+from src.llm.search_cache import SearchCache
+from src.llm.usage import UsageTracker
+from src.orchestrator.checkpoint import CheckpointStore, DebateCheckpoint
+from src.orchestrator.convergence import ROUNDS_STOPPED, RoundController
+from src.orchestrator.debate_flow import (
+    CLASSIC_FLOW,
+    CLOSING_INSTRUCTION,
+    FLOWS,
+    PREVIOUS_SUMMARY_HEADER,
+    DebateFlow,
+    RoundState,
+    TurnNode,
+)
+from src.orchestrator.prompt_budget import PromptBudget
+from src.orchestrator.research import ResearchPhase
+from src.orchestrator.retrieval import PriorDebateRetriever
+from src.orchestrator.transcripts import TranscriptStore
+from src.orchestrator.utterances import Utterance
+from src.utils.cancellation import CancellationToken, OperationCancelled
 from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY, SLACK_POST_ERRORS, SLACK_POST_SECONDS
+from src.utils.threads import submit_daemon
+from src.utils.tracing import get_tracer
 
 logger = setup_logger(__name__)
 
+ACTIVE_DEBATES = REGISTRY.gauge("debate_active", "Debates currently running")
+DEBATES_STARTED = REGISTRY.counter("debate_started_total", "Debates started")
+DEBATES_RESUMED = REGISTRY.counter("debate_resumed_total", "Debates resumed from a checkpoint")
+DEBATES_PAUSED = REGISTRY.counter(
+    "debate_paused_total", "Debates checkpointed and paused (or deferred) during shutdown drain"
+)
+DEBATE_ROUNDS = REGISTRY.histogram(
+    "debate_rounds", "Rounds per finished debate", buckets=(1, 2, 3, 4, 5, 6, 8, 10, 15, 20)
+)
+DEBATES_CANCELLED = REGISTRY.counter("debate_cancelled_total", "Debates cancelled by a user")
+CANCEL_LATENCY_SECONDS = REGISTRY.histogram(
+    "debate_cancel_latency_seconds", "Time from a cancel request until the debate stopped",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
 
 class DebateOrchestrator:
     """
@@ -30,7 +69,18 @@ class DebateOrchestrator:
         jamal_agent: ADKAgent,
         ryan_agent: ADKAgent,
         james_agent: ADKAgent,
-        max_rounds: int = 10
+        max_rounds: int = 10,
+        usage_tracker: Optional[UsageTracker] = None,
+        token_budget: int = 0,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        flow: Optional[DebateFlow] = None,
+        transcript_store: Optional[TranscriptStore] = None,
+        retriever: Optional[PriorDebateRetriever] = None,
+        research: Optional[ResearchPhase] = None,
+        prompt_budget: Optional[PromptBudget] = None,
+        incremental_summary: bool = False,
+        round_controller: Optional[RoundController] = None,
+        search_cache: Optional[SearchCache] = None
     ) -> None:
         """
         Initialize DebateOrchestrator.
@@ -43,6 +93,27 @@ class DebateOrchestrator:
             ryan_agent: Opposer agent (AgentRyan)
             james_agent: Mediator agent (AgentJames)
             max_rounds: Maximum debate rounds before forced termination
+            usage_tracker: Optional UsageTracker shared with the agents
+            token_budget: Max total tokens per debate (0 = unlimited)
+            checkpoint_store: Optional store for per-turn checkpoints, so
+                debates interrupted by a restart can be resumed
+            flow: Turn graph for each round (default: CLASSIC_FLOW,
+                Jamal → James → Ryan → James)
+            transcript_store: Optional store every utterance is appended to
+            retriever: Optional retriever that adds relevant past debates
+                to the context before round 1
+            research: Optional research step that searches once before
+                round 1 and gives all agents the same fact sheet
+            prompt_budget: Optional per-call prompt budget; oversized
+                prompts have their oldest turns compacted or dropped
+            incremental_summary: Summary turns (nodes with an
+                update_instruction) get their previous summary plus only
+                the new turns instead of the whole transcript
+            round_controller: Optional controller that ends debates whose
+                rounds stopped adding new points (James then concludes) and
+                stops before a round that would exceed its time or cost budget
+            search_cache: Optional search cache shared by the agents; a
+                debate's results are dropped once it ends
         """
         # Map each agent to their corresponding Slack client
         self.clients = {
@@ -55,6 +126,25 @@ class DebateOrchestrator:
         self.ryan = ryan_agent
         self.james = james_agent
         self.max_rounds = max_rounds
+        self.usage_tracker = usage_tracker
+        self.token_budget = token_budget
+        self.checkpoint_store = checkpoint_store
+        self.flow = flow or CLASSIC_FLOW
+        self.transcript_store = transcript_store
+        self.retriever = retriever
+        self.research = research
+        self.prompt_budget = prompt_budget
+        self.incremental_summary = incremental_summary
+        self.round_controller = round_controller
+        self.search_cache = search_cache
+
+        # Shutdown drain: set once shutdown() starts; debate threads by thread_ts
+        self._draining = threading.Event()
+        self._threads: Dict[str, threading.Thread] = {}
+
+        # User cancellation: token per running debate, posted message ts -> thread_ts
+        self._cancel_tokens: Dict[str, CancellationToken] = {}
+        self._message_threads: Dict[str, str] = {}
 
         logger.info("DebateOrchestrator initialized with 3 separate bot clients")
 
@@ -68,8 +158,9 @@ class DebateOrchestrator:
         """
         Start orchestrated debate in background thread.
 
-        Flow: Jamal → James (summary) → Ryan → James (check/continue)
-        James decides termination based on consensus or repetition.
+        Each round runs the orchestrator's flow (default: Jamal → James
+        (summary) → Ryan → James (check/continue)). James decides
+        termination based on consensus or repetition.
 
         Args:
             channel: Slack channel ID
@@ -77,160 +168,610 @@ class DebateOrchestrator:
             initial_message: User's initial message to debate
             user_id: User ID who triggered debate
         """
-        # Mark debate as active
+        checkpoint = DebateCheckpoint(
+            channel=channel,
+            thread_ts=thread_ts,
+            user_id=user_id,
+            topic=initial_message,
+            flow=self.flow.name
+        )
+
+        if self.is_draining:
+            self._defer_debate(checkpoint)
+            return
+
+        if self._launch(checkpoint):
+            DEBATES_STARTED.inc()
+
+    @property
+    def is_draining(self) -> bool:
+        """True once shutdown() has started; new debates are no longer run."""
+        return self._draining.is_set()
+
+    def begin_drain(self) -> None:
+        """Stop running new debates; start_debate() checkpoints them for the next process instead."""
+        self._draining.set()
+
+    def shutdown(self, timeout: float = 30.0) -> Dict[str, int]:
+        """
+        Drain in-flight debates before the process exits.
+
+        Stops new debates, lets each running debate finish its current
+        turn, then (with a checkpoint store) checkpoints and pauses it so
+        the next process resumes it. Without a store, debates keep running
+        until they end or the deadline passes.
+
+        Args:
+            timeout: Seconds to wait for debate threads to stop
+
+        Returns:
+            {"drained": threads that stopped, "unfinished": threads still running}
+        """
+        self.begin_drain()
+        with self._lock:
+            threads = list(self._threads.values())
+        logger.info("Draining %d in-flight debate(s) (timeout: %.0fs)", len(threads), timeout)
+
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+
+        unfinished = sum(1 for thread in threads if thread.is_alive())
+        if unfinished:
+            logger.warning("%d debate(s) still running at shutdown deadline", unfinished)
+        else:
+            logger.info("All in-flight debates drained")
+        return {"drained": len(threads) - unfinished, "unfinished": unfinished}
+
+    def cancel_debate(self, ts: str, reason: str = "") -> bool:
+        """
+        Cancel a running debate, aborting the in-flight model call.
+
+        Args:
+            ts: Thread timestamp of the debate, or the ts of any message
+                the debate posted (e.g., the message a user reacted to)
+            reason: Free-form reason for logs (e.g., "reaction by U123")
+
+        Returns:
+            True if a running debate was cancelled
+        """
+        with self._lock:
+            thread_ts = ts if ts in self._cancel_tokens else self._message_threads.get(ts)
+            token = self._cancel_tokens.get(thread_ts) if thread_ts else None
+
+        if token is None or not token.cancel(reason):
+            return False
+
+        logger.info("Cancel requested for debate in thread: %s (%s)", thread_ts, reason or "no reason")
+        return True
+
+    def _defer_debate(self, checkpoint: DebateCheckpoint) -> None:
+        """Save a debate requested during drain so the next process starts it."""
+        if not self.checkpoint_store:
+            logger.warning("Rejecting debate during shutdown in thread: %s", checkpoint.thread_ts)
+            self._post_message(
+                channel=checkpoint.channel,
+                thread_ts=checkpoint.thread_ts,
+                text="⏸️ 봇이 재시작 중이라 토론을 시작할 수 없습니다. 잠시 후 다시 멘션해주세요.",
+                speaker="james"
+            )
+            return
+
+        self._save_checkpoint(checkpoint)
+        DEBATES_PAUSED.inc()
+        logger.info("Deferred debate until restart in thread: %s", checkpoint.thread_ts)
+        self._post_message(
+            channel=checkpoint.channel,
+            thread_ts=checkpoint.thread_ts,
+            text="⏸️ 봇이 재시작 중입니다. 재시작 후 토론을 시작합니다.",
+            speaker="james"
+        )
+
+    def resume_debate(self, checkpoint: DebateCheckpoint) -> bool:
+        """
+        Continue a checkpointed debate from its next turn in a background thread.
+
+        Args:
+            checkpoint: Checkpoint loaded from the store
+
+        Returns:
+            True if the debate was started (False if already active)
+        """
+        if not self._launch(checkpoint):
+            return False
+
+        DEBATES_RESUMED.inc()
+        logger.info(
+            "Resuming debate in thread: %s at round %d, step %d",
+            checkpoint.thread_ts, checkpoint.round, checkpoint.step
+        )
+        self._post_message(
+            channel=checkpoint.channel,
+            thread_ts=checkpoint.thread_ts,
+            text=f"🔄 봇이 재시작되어 라운드 {checkpoint.round}부터 토론을 이어갑니다.",
+            speaker="james"
+        )
+        return True
+
+    def resume_incomplete(self, max_age_hours: float = 0) -> int:
+        """
+        Resume every debate left unfinished by a previous process.
+
+        Args:
+            max_age_hours: Discard checkpoints idle longer than this (0 = keep all)
+
+        Returns:
+            Number of debates resumed
+        """
+        if not self.checkpoint_store:
+            return 0
+
+        resumed = 0
+        for checkpoint in self.checkpoint_store.list_incomplete(max_age_s=max_age_hours * 3600):
+            if self.resume_debate(checkpoint):
+                resumed += 1
+        if resumed:
+            logger.info("Resumed %d incomplete debate(s) from checkpoints", resumed)
+        return resumed
+
+    def run_debate(
+        self,
+        channel: str,
+        thread_ts: str,
+        initial_message: str,
+        user_id: str
+    ) -> str:
+        """
+        Run a debate to completion in the calling thread.
+
+        Used where there is no Slack event loop to return to, e.g., the
+        offline batch runner, which supplies its own threads.
+
+        Args:
+            channel: Channel ID (any label when posting to a sink)
+            thread_ts: Unique thread ID of the debate
+            initial_message: Debate topic
+            user_id: User ID who requested the debate
+
+        Returns:
+            Outcome (see _run_debate), or "duplicate" if the thread
+            already has an active debate
+        """
+        if not self._register(thread_ts):
+            return "duplicate"
+        DEBATES_STARTED.inc()
+        return self._run_debate(channel, thread_ts, initial_message, user_id)
+
+    def _register(self, thread_ts: str) -> bool:
+        """Mark a debate as active; False if the thread already has one."""
         with self._lock:
             if thread_ts in self.active_debates:
-                logger.warning(f"Debate already active for thread: {thread_ts}")
-                return
+                logger.warning("Debate already active for thread: %s", thread_ts)
+                return False
             self.active_debates[thread_ts] = True
+            self._cancel_tokens[thread_ts] = CancellationToken()
+            ACTIVE_DEBATES.set(len(self.active_debates))
+        return True
+
+    def _launch(self, checkpoint: DebateCheckpoint) -> bool:
+        """Register the debate as active and run it in a daemon thread."""
+        thread_ts = checkpoint.thread_ts
+
+        if not self._register(thread_ts):
+            return False
 
-        logger.info(f"Starting debate in thread: {thread_ts}")
+        logger.info("Starting debate in thread: %s", thread_ts)
 
         # Run debate in background thread to avoid blocking
+        # Daemon so a missed shutdown deadline can't hang the process;
+        # shutdown() joins these threads to drain them first
         debate_thread = threading.Thread(
             target=self._run_debate,
-            args=(channel, thread_ts, initial_message, user_id),
+            args=(checkpoint.channel, thread_ts, checkpoint.topic, checkpoint.user_id),
+            kwargs={"checkpoint": checkpoint},
             daemon=True
         )
+        with self._lock:
+            self._threads[thread_ts] = debate_thread
         debate_thread.start()
+        return True
 
     def _run_debate(
         self,
         channel: str,
         thread_ts: str,
         initial_message: str,
-        user_id: str
-    ) -> None:
+        user_id: str,
+        checkpoint: Optional[DebateCheckpoint] = None
+    ) -> str:
         """
         Execute debate loop until termination.
 
+        State is checkpointed after every turn; a checkpoint passed in
+        (e.g., after a restart) continues from its next turn.
+
         Args:
             channel: Slack channel ID
             thread_ts: Thread timestamp
             initial_message: User's initial message
             user_id: User ID who initiated the debate
-        """
-        try:
-            logger.info(f"Debate started by user: {user_id} in thread: {thread_ts}")
-            round_count = 0
-            terminated = False
+            checkpoint: Optional state to resume from
 
-            # Build context from initial message
-            context = f"주제: {initial_message}"
-
-            while not terminated and round_count < self.max_rounds:
-                round_count += 1
-                logger.info(f"[Round {round_count}] Starting debate round in thread: {thread_ts}")
+        Returns:
+            Outcome: "concluded", "converged", "max_rounds", "budget",
+            "paused", "cancelled" or "error"
+        """
+        state = checkpoint or DebateCheckpoint(
+            channel=channel,
+            thread_ts=thread_ts,
+            user_id=user_id,
+            topic=initial_message,
+            flow=self.flow.name
+        )
+        # A resumed debate keeps the flow it was started with
+        flow = self.flow if state.flow == self.flow.name else FLOWS.get(state.flow, self.flow)
+        if state.step >= len(flow):
+            state.step = 0
 
-                # 1. AgentJamal proposes
-                jamal_response = self._agent_speak(
-                    agent=self.jamal,
-                    context=context,
-                    thread_ts=thread_ts
+        with self._lock:
+            cancel_token = self._cancel_tokens.setdefault(thread_ts, CancellationToken())
+
+        with get_tracer().start_span(
+            "debate",
+            attributes={
+                "channel": channel,
+                "thread_ts": thread_ts,
+                "max_rounds": self.max_rounds,
+                "flow": flow.name,
+                "resumed": bool(state.utterances)
+            },
+            new_trace=True
+        ) as debate_span:
+            paused = False
+            outcome = "error"
+            round_count = 0
+            if self.transcript_store:
+                self.transcript_store.start_debate(thread_ts, channel, state.topic, user_id, flow.name)
+            try:
+                logger.info("Debate started by user: %s in thread: %s", user_id, thread_ts)
+                terminated = False
+                converged = False
+                # "tokens", "time" or "cost" when a budget stopped the debate
+                budget_stopped = ""
+                started = time.monotonic()
+                rounds_run = 0
+                summary_nodes = {node.id for node in flow.nodes if node.update_instruction}
+
+                # Past debates on similar topics, once per debate (kept in checkpoints)
+                if self.retriever and not state.utterances and not state.background:
+                    state.background = self.retriever.background_for(
+                        state.topic, channel, exclude_thread=thread_ts
+                    )
+
+                # Shared research, once per debate (checkpointed so a resume does not search again)
+                if self.research and not state.utterances and not state.fact_sheet:
+                    state.fact_sheet = self.research.fact_sheet_for(state.topic, thread_ts)
+                    if state.fact_sheet:
+                        self._save_checkpoint(state)
+
+                # A checkpoint taken mid-round resumes inside that round
+                round_count = state.round if state.step else state.round - 1
+                start_step = state.step
+
+                while not terminated and (start_step or round_count < self.max_rounds):
+                    if self._should_pause():
+                        paused = True
+                        break
+
+                    if not start_step:
+                        if self._budget_exceeded(thread_ts):
+                            budget_stopped = "tokens"
+                            break
+                        if self.round_controller:
+                            budget_stopped = self.round_controller.over_budget(
+                                rounds_run, time.monotonic() - started, self._debate_cost(thread_ts)
+                            ) or ""
+                            if budget_stopped:
+                                ROUNDS_STOPPED.inc(reason=budget_stopped)
+                                break
+                        round_count += 1
+                        rounds_run += 1
+
+                    with get_tracer().start_span("debate.round", attributes={"round": round_count}):
+                        logger.info("[Round %d] Starting debate round in thread: %s", round_count, thread_ts)
+
+                        # Responses so far this round (for edge conditions)
+                        round_state = RoundState(round_count, {
+                            u.node: u.text for u in state.utterances.in_round(round_count) if u.node
+                        })
+
+                        step = start_step
+                        while step < len(flow):
+                            if step != start_step and self._should_pause():
+                                paused = True
+                                break
+                            cancel_token.raise_if_cancelled()
+
+                            group = flow.parallel_group(step)
+                            terminated = self._run_turns(
+                                flow, group, state, round_state, cancel_token,
+                                channel=channel,
+                                thread_ts=thread_ts
+                            )
+                            if terminated:
+                                break
+                            step = group[-1] + 1
+                            # Checked per turn so a long round can't run far past the budget
+                            if step < len(flow) and self._budget_exceeded(thread_ts):
+                                budget_stopped = "tokens"
+                                break
+                        start_step = 0
+
+                    if paused or budget_stopped:
+                        break
+
+                    if (
+                        self.round_controller and not terminated and round_count < self.max_rounds
+                        and self.round_controller.check(state.utterances, summary_nodes)
+                    ):
+                        logger.info("[Round %d] No new points; concluding debate in thread: %s", round_count, thread_ts)
+                        ROUNDS_STOPPED.inc(reason="converged")
+                        self._conclude(state, round_count, cancel_token, channel, thread_ts)
+                        converged = True
+                        break
+
+                if paused:
+                    # Shutdown drain: keep the checkpoint for the next process
+                    self._save_checkpoint(state)
+                    DEBATES_PAUSED.inc()
+                    debate_span.set_attribute("paused", True)
+                    logger.info(
+                        "Paused debate for shutdown in thread: %s at round %d, step %d",
+                        thread_ts, state.round, state.step
+                    )
+                    self._post_message(
+                        channel=channel,
+                        thread_ts=thread_ts,
+                        text=f"⏸️ 봇이 재시작 중입니다. 재시작 후 라운드 {state.round}부터 이어갑니다.",
+                        speaker="james"
+                    )
+                    outcome = "paused"
+                    return outcome
+
+                if terminated:
+                    outcome = "concluded"
+                elif converged:
+                    outcome = "converged"
+                elif budget_stopped:
+                    outcome = "budget"
+                    logger.warning("Debate stopped by its %s budget in thread: %s", budget_stopped, thread_ts)
+                    self._post_message(
+                        channel=channel,
+                        thread_ts=thread_ts,
+                        text=self._budget_message(budget_stopped),
+                        speaker="james"
+                    )
+                elif round_count >= self.max_rounds:
+                    outcome = "max_rounds"
+                    logger.warning("Debate reached max rounds (%d) in thread: %s", self.max_rounds, thread_ts)
+                    self._post_message(
+                        channel=channel,
+                        thread_ts=thread_ts,
+                        text=f"⚠️ 토론이 최대 라운드({self.max_rounds})에 도달하여 종료되었습니다.",
+                        speaker="james"
+                    )
+
+                DEBATE_ROUNDS.observe(round_count)
+                debate_span.set_attribute("rounds", round_count)
+                debate_span.set_attribute("terminated", terminated)
+                logger.info("Debate completed in thread: %s after %d rounds", thread_ts, round_count)
+
+            except OperationCancelled:
+                # Remaining turns are skipped; the in-flight model call was aborted
+                latency = cancel_token.seconds_since_cancel()
+                DEBATES_CANCELLED.inc()
+                CANCEL_LATENCY_SECONDS.observe(latency)
+                debate_span.set_attribute("cancelled", True)
+                debate_span.set_attribute("cancel_latency_ms", latency * 1000)
+                logger.info(
+                    "Debate cancelled in thread: %s at round %d, step %d | cancel latency: %.0f ms",
+                    thread_ts, state.round, state.step, latency * 1000
                 )
-
-                self._post_with_mention(
+                self._post_message(
                     channel=channel,
                     thread_ts=thread_ts,
-                    text=jamal_response,
-                    next_agent="@AgentJames",
-                    speaker="jamal"
-                )
-
-                context += f"\n\nAgentJamal: {jamal_response}"
-
-                # 2. AgentJames summarizes
-                james_summary_prompt = f"{context}\n\n위 내용을 요약하고 AgentRyan에게 전달해주세요."
-                james_summary = self._agent_speak(
-                    agent=self.james,
-                    context=james_summary_prompt,
-                    thread_ts=thread_ts
+                    text=f"🛑 요청에 따라 토론을 중단했습니다. (라운드 {state.round}, 중단까지 {latency * 1000:.0f}ms)",
+                    speaker="james"
                 )
+                outcome = "cancelled"
 
-                self._post_with_mention(
+            except Exception as e:
+                logger.error("Error in debate loop for thread %s: %s", thread_ts, e, exc_info=True)
+                self._post_message(
                     channel=channel,
                     thread_ts=thread_ts,
-                    text=james_summary,
-                    next_agent="@AgentRyan",
+                    text=f"❌ 토론 중 오류가 발생했습니다: {str(e)}",
                     speaker="james"
                 )
 
-                context += f"\n\nAgentJames: {james_summary}"
+            finally:
+                self._log_usage_summary(thread_ts)
+
+                # The debate ended (or failed and was reported); nothing to resume
+                if self.checkpoint_store and not paused:
+                    self.checkpoint_store.delete(thread_ts)
+                if self.transcript_store and not paused:
+                    self.transcript_store.finish_debate(thread_ts, outcome, round_count)
+                if self.search_cache and not paused:
+                    self.search_cache.forget(thread_ts)
+
+                # Remove from active debates
+                with self._lock:
+                    if thread_ts in self.active_debates:
+                        del self.active_debates[thread_ts]
+                    self._threads.pop(thread_ts, None)
+                    self._cancel_tokens.pop(thread_ts, None)
+                    self._message_threads = {
+                        ts: owner for ts, owner in self._message_threads.items() if owner != thread_ts
+                    }
+                    ACTIVE_DEBATES.set(len(self.active_debates))
+                logger.info("Debate cleanup completed for thread: %s", thread_ts)
+
+        return outcome
+
+    def _run_turns(
+        self,
+        flow: DebateFlow,
+        indexes: List[int],
+        state: DebateCheckpoint,
+        round_state: RoundState,
+        cancel_token: CancellationToken,
+        channel: str,
+        thread_ts: str
+    ) -> bool:
+        """
+        Run a group of independent turns and post them in flow order.
 
-                # 3. AgentRyan opposes
-                ryan_response = self._agent_speak(
-                    agent=self.ryan,
-                    context=context,
-                    thread_ts=thread_ts
-                )
+        Every turn in the group sees the same transcript. A single runnable
+        turn runs inline on the debate thread; with more than one, every
+        turn runs on its own thread (_submit_turn). Each is posted as soon
+        as it and all turns before it are done, so posts keep the flow order.
 
-                self._post_with_mention(
-                    channel=channel,
-                    thread_ts=thread_ts,
-                    text=ryan_response,
-                    next_agent="@AgentJames",
-                    speaker="ryan"
-                )
+        Args:
+            flow: Debate flow
+            indexes: Node indexes from DebateFlow.parallel_group
+            state: Checkpoint state (its transcript is the prompt context;
+                advanced and saved after each turn)
+            round_state: This round's responses (updated in place)
+            cancel_token: Debate cancellation token
+            channel: Slack channel ID
+            thread_ts: Thread timestamp
 
-                context += f"\n\nAgentRyan: {ryan_response}"
+        Returns:
+            True if a turn concluded the debate
+        """
+        nodes = [flow.nodes[index] for index in indexes]
+        runnable = [node for node in nodes if node.when is None or node.when(round_state)]
+
+        pending: Dict[str, Future] = {}
+        for node in runnable:
+            prompt = self._build_prompt(state, node)
+            kwargs = {
+                "agent": getattr(self, node.speaker),
+                "context": prompt,
+                "thread_ts": thread_ts,
+                "channel": channel,
+                "round_num": round_state.round,
+                "cancel_token": cancel_token
+            }
+            if len(runnable) == 1:
+                pending[node.id] = self._call_inline(**kwargs)
+            else:
+                pending[node.id] = self._submit_turn(**kwargs)
+
+        for index, node in zip(indexes, nodes):
+            next_speaker = flow.nodes[(index + 1) % len(flow)].speaker
+            if node.id not in pending:
+                logger.info("[Round %d] Skipping turn '%s' (condition not met)", round_state.round, node.id)
+                state.skip_turn(next_speaker, steps_per_round=len(flow))
+                self._save_checkpoint(state)
+                continue
+
+            response = pending[node.id].result()
+            terminated = node.checks_termination and self._check_termination(response)
+
+            self._post_with_mention(
+                channel=channel,
+                thread_ts=thread_ts,
+                text=response,
+                next_agent=None if terminated else node.mention,
+                speaker=node.speaker
+            )
 
-                # 4. AgentJames checks termination
-                james_check_prompt = f"{context}\n\n합의가 이루어졌거나 논의가 반복되면 '토론을 종료합니다'로 시작하는 최종 결론을 작성하세요. 그렇지 않으면 AgentJamal에게 추가 의견을 요청하세요."
-                james_check = self._agent_speak(
-                    agent=self.james,
-                    context=james_check_prompt,
-                    thread_ts=thread_ts
-                )
+            round_state.responses[node.id] = response
+            utterance = Utterance(round_state.round, node.speaker, response, node.id)
+            if self.transcript_store:
+                self.transcript_store.append(thread_ts, utterance)
+            if terminated:
+                return True
 
-                # Check for termination
-                if self._check_termination(james_check):
-                    terminated = True
-                    next_agent = None
-                else:
-                    next_agent = "@AgentJamal"
+            state.record_turn(utterance, next_speaker=next_speaker, steps_per_round=len(flow))
+            if node.update_instruction:
+                # The running summary covers everything up to and including itself
+                state.summary, state.summary_upto = response, len(state.utterances)
+            self._save_checkpoint(state)
 
-                self._post_with_mention(
-                    channel=channel,
-                    thread_ts=thread_ts,
-                    text=james_check,
-                    next_agent=next_agent,
-                    speaker="james"
-                )
+        return False
 
-                context += f"\n\nAgentJames: {james_check}"
+    def _call_inline(self, **kwargs) -> Future:
+        """Run a turn on the debate thread, wrapped in a completed Future."""
+        future: Future = Future()
+        try:
+            future.set_result(self._agent_speak(**kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _submit_turn(self, **kwargs) -> Future:
+        """Run a turn on its own daemon thread (parallel branches)."""
+        return submit_daemon(self._agent_speak, name="debate-turn", **kwargs)
+
+    @staticmethod
+    def _context_header(state: DebateCheckpoint) -> str:
+        """Context before the first turn: topic, background and fact sheet."""
+        header = f"주제: {state.topic}"
+        if state.background:
+            header += f"\n\n{state.background}"
+        if state.fact_sheet:
+            header += f"\n\n{state.fact_sheet}"
+        return header
+
+    def _build_prompt(self, state: DebateCheckpoint, node: TurnNode) -> str:
+        """
+        Prompt for one turn: header, finished turns and the node's instruction,
+        fitted to the prompt budget if one is set.
 
-            if round_count >= self.max_rounds:
-                logger.warning(f"Debate reached max rounds ({self.max_rounds}) in thread: {thread_ts}")
-                self._post_message(
-                    channel=channel,
-                    thread_ts=thread_ts,
-                    text=f"⚠️ 토론이 최대 라운드({self.max_rounds})에 도달하여 종료되었습니다.",
-                    speaker="james"
-                )
+        In incremental mode a summary node that already summarized once
+        gets its previous summary and only the turns after it.
 
-            logger.info(f"Debate completed in thread: {thread_ts} after {round_count} rounds")
+        Args:
+            state: Debate checkpoint
+            node: The turn's flow node
 
-        except Exception as e:
-            logger.error(f"Error in debate loop for thread {thread_ts}: {e}", exc_info=True)
-            self._post_message(
-                channel=channel,
-                thread_ts=thread_ts,
-                text=f"❌ 토론 중 오류가 발생했습니다: {str(e)}",
-                speaker="james"
+        Returns:
+            Prompt text
+        """
+        header = self._context_header(state)
+        if self.incremental_summary and node.update_instruction and state.summary:
+            return state.utterances.render(
+                f"{header}\n\n{PREVIOUS_SUMMARY_HEADER}\n{state.summary}",
+                node.update_instruction,
+                budget=self.prompt_budget,
+                since=state.summary_upto
             )
+        return state.utterances.render(header, node.instruction or "", budget=self.prompt_budget)
 
-        finally:
-            # Remove from active debates
-            with self._lock:
-                if thread_ts in self.active_debates:
-                    del self.active_debates[thread_ts]
-            logger.info(f"Debate cleanup completed for thread: {thread_ts}")
+    def _should_pause(self) -> bool:
+        """True if draining and the debate can be checkpointed instead of finished."""
+        return self.is_draining and self.checkpoint_store is not None
+
+    def _save_checkpoint(self, state: DebateCheckpoint) -> None:
+        """Persist debate state after a turn (failures are logged, not raised)."""
+        if not self.checkpoint_store:
+            return
+        try:
+            self.checkpoint_store.save(state)
+        except OSError as e:
+            logger.warning("Failed to save checkpoint for thread %s: %s", state.thread_ts, e)
 
     def _agent_speak(
         self,
         agent: ADKAgent,
         context: str,
-        thread_ts: str
+        thread_ts: str,
+        channel: str = "default",
+        round_num: int = 0,
+        cancel_token: Optional[CancellationToken] = None
     ) -> str:
         """
         Get response from agent.
@@ -239,20 +780,116 @@ class DebateOrchestrator:
             agent: ADKAgent instance
             context: Current debate context
             thread_ts: Thread timestamp
+            channel: Slack channel ID (for usage accounting)
+            round_num: Current round number (for tracing)
+            cancel_token: Optional token that aborts the model call
 
         Returns:
             Agent's response text
+
+        Raises:
+            OperationCancelled: If the debate was cancelled during the call
         """
         try:
-            response = agent.generate_response(
-                text=context,
-                thread_ts=thread_ts
-            )
+            with get_tracer().start_span(
+                "debate.turn",
+                attributes={
+                    "agent": agent.agent_name,
+                    "round": round_num,
+                    "prompt_length": len(context)
+                }
+            ) as span:
+                response = agent.generate_response(
+                    text=context,
+                    channel=channel,
+                    thread_ts=thread_ts,
+                    cancel_token=cancel_token
+                )
+                span.set_attribute("response_length", len(response))
             return response
+        except OperationCancelled:
+            raise
         except Exception as e:
-            logger.error(f"Error getting response from {agent.agent_name}: {e}", exc_info=True)
+            logger.error("Error getting response from %s: %s", agent.agent_name, e, exc_info=True)
             return f"[Error: {agent.agent_name} failed to respond]"
 
+    def _budget_exceeded(self, thread_ts: str) -> bool:
+        """
+        Check whether the debate has used up its token budget.
+
+        Args:
+            thread_ts: Thread timestamp
+
+        Returns:
+            True if a budget is set and the debate exceeded it
+        """
+        if not self.usage_tracker or self.token_budget <= 0:
+            return False
+        return self.usage_tracker.is_over_budget(thread_ts, self.token_budget)
+
+    def _debate_cost(self, thread_ts: str) -> float:
+        """Estimated cost of the debate so far (0.0 without a usage tracker)."""
+        if not self.usage_tracker:
+            return 0.0
+        return self.usage_tracker.estimate_cost(self.usage_tracker.get_debate_usage(thread_ts))
+
+    def _budget_message(self, reason: str) -> str:
+        """Slack notice for a debate stopped by its token, time or cost budget."""
+        if reason == "time":
+            return f"⚠️ 토론이 시간 예산({self.round_controller.max_seconds:.0f}초)에 도달하여 종료되었습니다."
+        if reason == "cost":
+            return f"⚠️ 토론이 비용 예산(${self.round_controller.max_cost:.2f})에 도달하여 종료되었습니다."
+        return f"⚠️ 토론이 토큰 예산({self.token_budget:,})을 초과하여 종료되었습니다."
+
+    def _conclude(
+        self,
+        state: DebateCheckpoint,
+        round_num: int,
+        cancel_token: CancellationToken,
+        channel: str,
+        thread_ts: str
+    ) -> None:
+        """
+        Have James write the final conclusion of a converged debate.
+
+        Args:
+            state: Checkpoint state (its transcript is the prompt context)
+            round_num: Last finished round
+            cancel_token: Debate cancellation token
+            channel: Slack channel ID
+            thread_ts: Thread timestamp
+        """
+        prompt = state.utterances.render(self._context_header(state), CLOSING_INSTRUCTION, budget=self.prompt_budget)
+        response = self._agent_speak(
+            self.james, prompt, thread_ts,
+            channel=channel,
+            round_num=round_num,
+            cancel_token=cancel_token
+        )
+        self._post_with_mention(channel=channel, thread_ts=thread_ts, text=response, next_agent=None, speaker="james")
+        if self.transcript_store:
+            self.transcript_store.append(thread_ts, Utterance(round_num, "james", response, "closing"))
+
+    def _log_usage_summary(self, thread_ts: str) -> None:
+        """
+        Log token usage and estimated cost for a finished debate.
+
+        Args:
+            thread_ts: Thread timestamp
+        """
+        if not self.usage_tracker:
+            return
+
+        usage = self.usage_tracker.get_debate_usage(thread_ts)
+        turns = self.usage_tracker.finish_debate(thread_ts)
+        cost = self.usage_tracker.estimate_cost(usage)
+        logger.info(
+            "[USAGE] thread: %s | turns: %d | calls: %d | prompt: %d | candidates: %d | "
+            "cached: %d | total: %d | est. cost: $%.4f",
+            thread_ts, len(turns), usage.calls, usage.prompt_tokens, usage.candidate_tokens,
+            usage.cached_tokens, usage.total_tokens, cost
+        )
+
     def _check_termination(self, james_response: str) -> bool:
         """
         Check if debate should terminate based on James's response.
@@ -272,7 +909,7 @@ class DebateOrchestrator:
         response_lower = james_response.lower()
         for phrase in termination_phrases:
             if phrase.lower() in response_lower:
-                logger.info(f"Termination detected: '{phrase}' found in response")
+                logger.info("Termination detected: '%s' found in response", phrase)
                 return True
 
         return False
@@ -325,19 +962,31 @@ class DebateOrchestrator:
             client = self.clients.get(speaker, self.clients["jamal"])
 
             # Debug logging to verify correct bot is being used
-            logger.info(f"[POST] Speaker: {speaker} | Message preview: {text[:50]}...")
+            logger.info("[POST] Speaker: %s | Message preview: %.50s...", speaker, text)
 
-            response = client.chat_postMessage(
-                channel=channel,
-                thread_ts=thread_ts,
-                text=text
-            )
+            with get_tracer().start_span(
+                "slack.post_message",
+                attributes={"speaker": speaker, "text_length": len(text)}
+            ), SLACK_POST_SECONDS.time(speaker=speaker):
+                response = client.chat_postMessage(
+                    channel=channel,
+                    thread_ts=thread_ts,
+                    text=text
+                )
 
             # Log the bot user that actually posted the message
-            logger.info(f"[POST] Message sent by bot: {response.get('message', {}).get('username', 'unknown')}")
+            logger.info("[POST] Message sent by bot: %s", response.get('message', {}).get('username', 'unknown'))
+
+            # Reactions on this message can cancel the debate
+            message_ts = response.get("ts")
+            if isinstance(message_ts, str):
+                with self._lock:
+                    if thread_ts in self._cancel_tokens:
+                        self._message_threads[message_ts] = thread_ts
 
         except Exception as e:
-            logger.error(f"Failed to post message to Slack as {speaker}: {e}", exc_info=True)
+            SLACK_POST_ERRORS.inc(speaker=speaker)
+            logger.error("Failed to post message to Slack as %s: %s", speaker, e, exc_info=True)
 
     @classmethod
     def is_debate_active(cls, thread_ts: str) -> bool:
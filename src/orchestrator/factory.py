@@ -0,0 +1,158 @@
+"""Builds the debate agents and orchestrator from Config for the entry points."""
+
+from typing import Optional
+
+from slack_sdk import WebClient
+
+from src.config import Config
+from src.llm.adk_agent import ADKAgent
+from src.llm.search_cache import SearchCache
+from src.llm.tokens import TokenCalibration
+from src.llm.usage import UsageTracker
+from src.llm.web_search import GeminiSearch
+from src.orchestrator.checkpoint import CheckpointStore
+from src.orchestrator.convergence import RoundController
+from src.orchestrator.debate_flow import get_flow
+from src.orchestrator.debate_orchestrator import DebateOrchestrator
+from src.orchestrator.prompt_budget import PromptBudget
+from src.orchestrator.research import ResearchPhase
+from src.orchestrator.retrieval import PriorDebateRetriever
+from src.orchestrator.transcripts import TranscriptStore
+from src.utils.http_transport import HttpTransport, HttpTransportConfig
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Agent role per speaker, in the order they are built
+AGENT_ROLES = {"jamal": "proposer", "ryan": "opposer", "james": "mediator"}
+
+
+def build_http_transport() -> Optional[HttpTransport]:
+    """Shared keep-alive pool for Slack and model HTTP calls (None when HTTP_POOLING is off)."""
+    if not Config.HTTP_POOLING:
+        return None
+    return HttpTransport(HttpTransportConfig(
+        max_connections=Config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+        http2=Config.HTTP2,
+        connect_timeout=Config.HTTP_CONNECT_TIMEOUT,
+        read_timeout=Config.HTTP_READ_TIMEOUT
+    ))
+
+
+def build_usage_tracker() -> UsageTracker:
+    """Token usage tracker (per agent / debate / channel / day) priced from Config."""
+    return UsageTracker(
+        input_cost_per_mtok=Config.INPUT_COST_PER_MTOK,
+        output_cost_per_mtok=Config.OUTPUT_COST_PER_MTOK,
+        cached_cost_per_mtok=Config.CACHED_COST_PER_MTOK
+    )
+
+
+def build_orchestrator(
+    jamal_client: WebClient,
+    ryan_client: WebClient,
+    james_client: WebClient,
+    usage_tracker: UsageTracker,
+    http_transport: Optional[HttpTransport] = None,
+    transcript_store: Optional[TranscriptStore] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    max_rounds: Optional[int] = None,
+    flow: Optional[str] = None
+) -> DebateOrchestrator:
+    """
+    Build the three agents and the DebateOrchestrator from Config.
+
+    The agents are reachable as orchestrator.jamal, .ryan and .james.
+
+    Args:
+        jamal_client: Client AgentJamal posts with
+        ryan_client: Client AgentRyan posts with
+        james_client: Client AgentJames posts with
+        usage_tracker: Tracker shared by the agents and the orchestrator
+        http_transport: Optional shared HTTP transport for model and search calls
+        transcript_store: Optional store for finished turns (also enables
+            retrieval of prior debates when RETRIEVAL_ENABLED)
+        checkpoint_store: Optional store for per-turn checkpoints
+        max_rounds: Round limit (default: DEBATE_MAX_ROUNDS)
+        flow: Debate flow name (default: DEBATE_FLOW)
+
+    Returns:
+        Configured DebateOrchestrator
+    """
+    # Fit of reported vs. locally estimated prompt tokens (for the prompt budget)
+    token_calibration = TokenCalibration()
+
+    # Search results shared by the three agents within a debate
+    search_cache = SearchCache(
+        ttl_s=Config.SEARCH_CACHE_TTL_S,
+        token_budget=Config.SEARCH_CACHE_TOKEN_BUDGET
+    ) if Config.SEARCH_CACHE_ENABLED else None
+
+    agents = {}
+    for speaker, role in AGENT_ROLES.items():
+        logger.info("Initializing Agent%s (%s)...", speaker.capitalize(), role.capitalize())
+        agents[speaker] = ADKAgent(
+            api_key=Config.GOOGLE_GENAI_API_KEY or "",
+            role=role,
+            model="gemini-2.0-flash",
+            usage_tracker=usage_tracker,
+            cassette_mode=Config.CASSETTE_MODE,
+            cassette_dir=Config.CASSETTE_DIR,
+            replay_speed=Config.CASSETTE_REPLAY_SPEED,
+            lazy=Config.LAZY_INIT,
+            http_transport=http_transport,
+            search_cache=search_cache,
+            token_calibration=token_calibration
+        )
+    logger.info("All agents initialized successfully")
+
+    retriever = PriorDebateRetriever(
+        transcript_store,
+        top_k=Config.RETRIEVAL_TOP_K,
+        token_budget=Config.RETRIEVAL_TOKEN_BUDGET,
+        all_channels=Config.SEARCH_ALL_CHANNELS
+    ) if transcript_store is not None and Config.RETRIEVAL_ENABLED else None
+
+    # Shared research before round 1 (searches are live, so cassette replays skip it)
+    research = ResearchPhase(
+        GeminiSearch(Config.GOOGLE_GENAI_API_KEY or "", http_transport=http_transport),
+        search_cache=search_cache,
+        max_queries=Config.RESEARCH_MAX_QUERIES,
+        token_budget=Config.RESEARCH_TOKEN_BUDGET,
+        timeout_s=Config.RESEARCH_TIMEOUT_S
+    ) if Config.RESEARCH_ENABLED and Config.CASSETTE_MODE != "replay" else None
+
+    # Ends debates that stopped bringing new points, or that would go over their time/cost budget
+    round_controller = RoundController(
+        min_rounds=Config.ADAPTIVE_MIN_ROUNDS,
+        novelty_threshold=Config.ADAPTIVE_NOVELTY_THRESHOLD,
+        drift_threshold=Config.ADAPTIVE_DRIFT_THRESHOLD,
+        patience=Config.ADAPTIVE_PATIENCE,
+        max_seconds=Config.DEBATE_TIME_BUDGET_S,
+        max_cost=Config.DEBATE_COST_BUDGET
+    ) if Config.ADAPTIVE_ROUNDS else None
+
+    return DebateOrchestrator(
+        jamal_client=jamal_client,
+        ryan_client=ryan_client,
+        james_client=james_client,
+        jamal_agent=agents["jamal"],
+        ryan_agent=agents["ryan"],
+        james_agent=agents["james"],
+        max_rounds=max_rounds if max_rounds is not None else Config.DEBATE_MAX_ROUNDS,
+        usage_tracker=usage_tracker,
+        token_budget=Config.DEBATE_TOKEN_BUDGET,
+        checkpoint_store=checkpoint_store,
+        flow=get_flow(flow or Config.DEBATE_FLOW),
+        incremental_summary=Config.INCREMENTAL_SUMMARY,
+        round_controller=round_controller,
+        search_cache=search_cache,
+        transcript_store=transcript_store,
+        retriever=retriever,
+        research=research,
+        prompt_budget=PromptBudget(
+            Config.PROMPT_TOKEN_BUDGET, calibration=token_calibration
+        ) if Config.PROMPT_TOKEN_BUDGET > 0 else None
+    )
@@ -0,0 +1,147 @@
+"""Per-call prompt budget: shorten or drop the oldest turns of an oversized prompt."""
+
+from typing import Iterable, List, Optional
+
+from src.llm.tokens import TokenCalibration, estimate_tokens, truncate_to_tokens
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+
+logger = setup_logger(__name__)
+
+PROMPT_TOKENS = REGISTRY.histogram(
+    "debate_prompt_tokens_estimated", "Calibrated prompt token estimate per agent call, before trimming",
+    buckets=(500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000)
+)
+PROMPTS_TRIMMED = REGISTRY.counter(
+    "debate_prompt_trimmed_total", "Agent prompts over the budget, by how they were fitted (compacted/dropped/over)",
+    ["result"]
+)
+
+# Marker replacing turns dropped from the start of the transcript
+DROPPED_MARKER = "(앞선 발언 {count}개는 길이 제한으로 생략)"
+SEPARATOR = "\n\n"
+# Context block entries that would be cut below this many tokens are dropped instead
+MIN_ENTRY_TOKENS = 40
+
+
+def render_entries(header: str, entries: Iterable[str], token_budget: int) -> str:
+    """
+    Render a context block (background, fact sheet): header, then one line
+    per entry within a token budget.
+
+    Entries are taken in order; the last one is truncated to fit, and one
+    that would be cut below MIN_ENTRY_TOKENS ends the block.
+
+    Args:
+        header: First line(s) of the block
+        entries: Entry lines, best first (consumed only as far as they fit)
+        token_budget: Max estimated tokens of the whole block
+
+    Returns:
+        Block text, or "" if no entry fits
+    """
+    lines = [header]
+    used = estimate_tokens(header)
+    for entry in entries:
+        remaining = token_budget - used - 1
+        if remaining < MIN_ENTRY_TOKENS:
+            break
+        lines.append(truncate_to_tokens(entry, remaining))
+        used += estimate_tokens(lines[-1]) + 1
+
+    return "\n".join(lines) if len(lines) > 1 else ""
+
+
+class PromptBudget:
+    """
+    Keeps agent prompts under a token budget.
+
+    A prompt is header (topic, background, fact sheet), turns (oldest
+    first) and footer (the node's instruction). When the calibrated
+    estimate is over the budget, the oldest turns are first compacted to
+    a short excerpt, then dropped; the header, footer and the most recent
+    keep_recent turns are never touched.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        calibration: Optional[TokenCalibration] = None,
+        compact_turn_tokens: int = 80,
+        keep_recent: int = 4
+    ) -> None:
+        """
+        Initialize PromptBudget.
+
+        Args:
+            max_tokens: Max calibrated prompt tokens per call
+            calibration: Fit of reported vs. estimated tokens (None = raw estimates)
+            compact_turn_tokens: Size of a compacted turn
+            keep_recent: Most recent turns kept in full
+        """
+        self.max_tokens = max_tokens
+        self.calibration = calibration
+        self.compact_turn_tokens = compact_turn_tokens
+        self.keep_recent = keep_recent
+
+    def estimate(self, text: str) -> int:
+        """Calibrated token estimate for a prompt."""
+        estimated = estimate_tokens(text)
+        return self.calibration.adjust(estimated) if self.calibration else estimated
+
+    def _fits(self, tokens: int) -> bool:
+        if self.calibration:
+            tokens = self.calibration.adjust(tokens)
+        return tokens <= self.max_tokens
+
+    def fit(self, header: str, turns: List[str], footer: str = "", sizes: Optional[List[int]] = None) -> str:
+        """
+        Render a prompt within the budget.
+
+        Args:
+            header: Text kept at the start of every prompt
+            turns: Rendered turns, oldest first
+            footer: Text kept at the end (e.g., the turn's instruction)
+            sizes: Token estimates of turns, if already known
+
+        Returns:
+            The full prompt if it fits, otherwise the trimmed prompt (which
+            may still be over the budget if header, footer and the recent
+            turns alone are)
+        """
+        # Separators are ~0.5 tokens each; counting one per piece stays conservative
+        sizes = list(sizes) if sizes is not None else [estimate_tokens(turn) for turn in turns]
+        total = estimate_tokens(header) + estimate_tokens(footer) + len(turns) + 2 + sum(sizes)
+        PROMPT_TOKENS.observe(self.calibration.adjust(total) if self.calibration else total)
+        if self._fits(total):
+            return _join(header, turns, footer)
+
+        turns = list(turns)
+        oldest_kept = max(len(turns) - self.keep_recent, 0)
+        result = "compacted"
+        for i in range(oldest_kept):
+            if self._fits(total):
+                break
+            compacted = truncate_to_tokens(turns[i], self.compact_turn_tokens)
+            total += estimate_tokens(compacted) - sizes[i]
+            turns[i], sizes[i] = compacted, estimate_tokens(compacted)
+
+        dropped = 0
+        marker_tokens = estimate_tokens(DROPPED_MARKER) + 1
+        while dropped < oldest_kept and not self._fits(total + (marker_tokens if dropped else 0)):
+            total -= sizes[dropped] + 1
+            dropped += 1
+        if dropped:
+            result = "dropped"
+            total += marker_tokens
+            turns = [DROPPED_MARKER.format(count=dropped)] + turns[dropped:]
+
+        if not self._fits(total):
+            result = "over"
+            logger.warning("Prompt still over budget after trimming: ~%d > %d tokens", total, self.max_tokens)
+        PROMPTS_TRIMMED.inc(result=result)
+        return _join(header, turns, footer)
+
+
+def _join(header: str, turns: List[str], footer: str) -> str:
+    return SEPARATOR.join(part for part in [header, *turns, footer] if part)
@@ -0,0 +1,157 @@
+"""Shared research step before round 1: searches run once, condensed into a fact sheet."""
+
+import re
+import time
+from concurrent.futures import Future, wait
+from typing import Callable, Iterator, List, Optional
+
+from src.llm.search_cache import SearchCache, SearchResult, format_result
+from src.llm.tokens import estimate_tokens
+from src.orchestrator.prompt_budget import render_entries
+from src.utils.logger import setup_logger
+from src.utils.mentions import MENTION_PATTERN
+from src.utils.metrics import REGISTRY
+from src.utils.threads import submit_daemon
+from src.utils.tracing import get_tracer
+
+logger = setup_logger(__name__)
+
+RESEARCH_SECONDS = REGISTRY.histogram(
+    "debate_research_duration_seconds", "Wall time of the research step before round 1"
+)
+RESEARCH_QUERIES = REGISTRY.counter(
+    "debate_research_queries_total", "Research searches by result (ok/error/timeout)", ["result"]
+)
+
+FACT_SHEET_HEADER = (
+    "[사전 조사 자료]\n"
+    "세 참가자가 같은 자료를 받았습니다. 이 자료를 우선 근거로 삼고, 부족한 부분만 직접 검색하세요."
+)
+# Searches per topic: the topic itself, then the angles each side needs
+QUERY_TEMPLATES = (
+    "{topic}",
+    "{topic} 통계",
+    "{topic} 장점 근거",
+    "{topic} 문제점 비판",
+    "{topic} 최근 동향",
+)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class ResearchPhase:
+    """
+    Runs a debate's searches once, concurrently, and condenses them into a
+    fact sheet that every agent gets in the debate context.
+
+    Searches go through the search cache when one is given, so queries
+    already run (in this debate, or in others within the cache TTL) are
+    not repeated.
+    """
+
+    def __init__(
+        self,
+        search: Callable[[str], SearchResult],
+        search_cache: Optional[SearchCache] = None,
+        max_queries: int = 4,
+        token_budget: int = 700,
+        timeout_s: float = 20.0
+    ) -> None:
+        """
+        Initialize ResearchPhase.
+
+        Args:
+            search: Function running one search (e.g., GeminiSearch)
+            search_cache: Optional cache shared with the agents
+            max_queries: Searches per debate (taken from QUERY_TEMPLATES)
+            token_budget: Max estimated tokens for the fact sheet
+            timeout_s: Seconds to wait for all searches; late ones are left out
+        """
+        self.search = search
+        self.search_cache = search_cache
+        self.max_queries = max_queries
+        self.token_budget = token_budget
+        self.timeout_s = timeout_s
+
+    def queries_for(self, topic: str) -> List[str]:
+        """Search queries for a topic (mentions removed)."""
+        topic = " ".join(MENTION_PATTERN.sub(" ", topic).split())
+        if not topic:
+            return []
+        return [template.format(topic=topic) for template in QUERY_TEMPLATES[:self.max_queries]]
+
+    def fact_sheet_for(self, topic: str, thread_ts: str) -> str:
+        """
+        Run the searches for a debate and build its fact sheet.
+
+        Args:
+            topic: Debate topic
+            thread_ts: Debate thread (search cache scope)
+
+        Returns:
+            Fact sheet text, or "" if every search failed or timed out
+            (research never blocks a debate)
+        """
+        queries = self.queries_for(topic)
+        if not queries:
+            return ""
+
+        start = time.perf_counter()
+        with get_tracer().start_span("debate.research", attributes={"queries": len(queries)}) as span:
+            futures = [self._submit(query, thread_ts) for query in queries]
+            done, _ = wait(futures, timeout=self.timeout_s)
+
+            results = []
+            for query, future in zip(queries, futures):
+                if future not in done:
+                    RESEARCH_QUERIES.inc(result="timeout")
+                    logger.warning("Research search timed out: %s", query)
+                elif future.exception() is not None:
+                    RESEARCH_QUERIES.inc(result="error")
+                    logger.warning("Research search failed: %s (%s)", query, future.exception())
+                else:
+                    RESEARCH_QUERIES.inc(result="ok")
+                    results.append(future.result())
+
+            fact_sheet = self.format(results)
+            if fact_sheet and self.search_cache is not None:
+                self.search_cache.mark_shared(thread_ts, results)
+            span.set_attribute("results", len(results))
+            span.set_attribute("tokens", estimate_tokens(fact_sheet))
+
+        RESEARCH_SECONDS.observe(time.perf_counter() - start)
+        logger.info(
+            "Research for %s: %d/%d searches in %.0f ms",
+            thread_ts, len(results), len(queries), (time.perf_counter() - start) * 1000
+        )
+        return fact_sheet
+
+    def _submit(self, query: str, thread_ts: str) -> Future:
+        """Run one search on its own daemon thread (a timed-out search is left behind)."""
+        if self.search_cache is not None:
+            return submit_daemon(self.search_cache.get_or_search, thread_ts, query, self.search, name="debate-research")
+        return submit_daemon(self.search, query, name="debate-research")
+
+    def format(self, results: List[SearchResult]) -> str:
+        """
+        Render results as a fact sheet within the token budget.
+
+        Sentences already given by an earlier result are left out, since
+        overlapping queries often return the same facts.
+
+        Returns:
+            Fact sheet text, or "" if no result has content
+        """
+        return render_entries(FACT_SHEET_HEADER, self._condensed_entries(results), self.token_budget)
+
+    @staticmethod
+    def _condensed_entries(results: List[SearchResult]) -> Iterator[str]:
+        """Fact sheet line per result, without sentences an earlier result gave."""
+        seen = set()
+        for result in results:
+            sentences = []
+            for sentence in _SENTENCE_END.split(" ".join(result.summary.split())):
+                if sentence and sentence not in seen:
+                    seen.add(sentence)
+                    sentences.append(sentence)
+            if sentences:
+                yield format_result(SearchResult(result.queries, " ".join(sentences), result.sources, result.fetched_at))
@@ -0,0 +1,107 @@
+"""Background from past debates, retrieved once before round 1."""
+
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.llm.tokens import estimate_tokens
+from src.orchestrator.prompt_budget import render_entries
+from src.orchestrator.transcripts import TranscriptStore
+from src.utils.logger import setup_logger
+from src.utils.mentions import MENTION_PATTERN
+from src.utils.metrics import REGISTRY
+from src.utils.tracing import get_tracer
+
+logger = setup_logger(__name__)
+
+RETRIEVALS = REGISTRY.counter(
+    "debate_retrieval_total", "Prior-debate retrievals before round 1, by result (hit/miss/error)", ["result"]
+)
+
+BACKGROUND_HEADER = (
+    "[참고: 비슷한 주제의 지난 토론]\n"
+    "이미 다룬 근거와 결론입니다. 같은 내용은 다시 검색하지 말고 참고하여 새로운 논점에 집중하세요."
+)
+
+
+class PriorDebateRetriever:
+    """
+    Finds finished debates on similar topics and condenses them into a
+    background block for the new debate's context.
+
+    Ranking is the transcript store's BM25 full-text search over topics,
+    conclusions and utterances, matching any word of the new topic.
+    """
+
+    def __init__(
+        self,
+        store: TranscriptStore,
+        top_k: int = 3,
+        token_budget: int = 600,
+        all_channels: bool = False
+    ) -> None:
+        """
+        Initialize PriorDebateRetriever.
+
+        Args:
+            store: Transcript store to search
+            top_k: Max past debates included
+            token_budget: Max estimated tokens for the whole block
+            all_channels: Search every channel (default: only the debate's channel)
+        """
+        self.store = store
+        self.top_k = top_k
+        self.token_budget = token_budget
+        self.all_channels = all_channels
+
+    def background_for(self, topic: str, channel: str, exclude_thread: Optional[str] = None) -> str:
+        """
+        Build the background block for a new debate.
+
+        Args:
+            topic: The new debate's topic (mentions are ignored)
+            channel: Channel the debate runs in
+            exclude_thread: Thread of the new debate itself
+
+        Returns:
+            Background text, or "" if nothing relevant was found (or the
+            store failed; retrieval never blocks a debate)
+        """
+        query = MENTION_PATTERN.sub(" ", topic)
+        with get_tracer().start_span("debate.retrieval") as span:
+            try:
+                hits = self.store.search(
+                    query,
+                    limit=self.top_k + 1,
+                    channel=None if self.all_channels else channel,
+                    match_any=True
+                )
+            except sqlite3.Error as e:
+                RETRIEVALS.inc(result="error")
+                logger.warning("Prior-debate retrieval failed: %s", e)
+                return ""
+
+            hits = [hit for hit in hits if hit["thread_ts"] != exclude_thread and hit.get("outcome")]
+            background = self.format(hits[:self.top_k])
+            span.set_attribute("hits", len(hits[:self.top_k]))
+            span.set_attribute("tokens", estimate_tokens(background))
+
+        RETRIEVALS.inc(result="hit" if background else "miss")
+        return background
+
+    def format(self, hits: List[Dict[str, Any]]) -> str:
+        """
+        Render hits (best first) as a background block within the token budget.
+
+        Returns:
+            Background text, or "" if no hit fits
+        """
+        return render_entries(BACKGROUND_HEADER, (self._entry(hit) for hit in hits), self.token_budget)
+
+    @staticmethod
+    def _entry(hit: Dict[str, Any]) -> str:
+        """Background line for one hit: topic, start date and conclusion."""
+        topic = " ".join(MENTION_PATTERN.sub(" ", hit["topic"]).split())
+        started = datetime.fromtimestamp(hit["started_at"]).strftime("%Y-%m-%d")
+        summary = " ".join((hit.get("conclusion") or hit.get("snippet") or "").split())
+        return f"- {topic} ({started}): {summary}"
@@ -0,0 +1,418 @@
+"""Durable SQLite store of debate transcripts, written by a background thread."""
+
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.orchestrator.utterances import Utterance
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+
+logger = setup_logger(__name__)
+
+TRANSCRIPT_WRITES = REGISTRY.counter(
+    "transcript_writes_total", "Transcript store operations written, by kind", ["kind"]
+)
+TRANSCRIPT_WRITE_ERRORS = REGISTRY.counter(
+    "transcript_write_errors_total", "Transcript store write batches that failed"
+)
+TRANSCRIPT_QUEUE_DEPTH = REGISTRY.gauge(
+    "transcript_queue_depth", "Transcript operations waiting for the background writer"
+)
+SEARCH_SECONDS = REGISTRY.histogram(
+    "transcript_search_duration_seconds", "Latency of full-text searches over stored debates",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS debates (
+    id INTEGER PRIMARY KEY,
+    thread_ts TEXT NOT NULL UNIQUE,
+    channel TEXT NOT NULL,
+    user_id TEXT,
+    topic TEXT NOT NULL,
+    flow TEXT,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    outcome TEXT,
+    rounds INTEGER,
+    conclusion TEXT
+);
+CREATE INDEX IF NOT EXISTS debates_started ON debates (started_at);
+CREATE INDEX IF NOT EXISTS debates_channel_started ON debates (channel, started_at);
+
+CREATE TABLE IF NOT EXISTS utterances (
+    id INTEGER PRIMARY KEY,
+    thread_ts TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    node TEXT,
+    speaker TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS utterances_thread ON utterances (thread_ts, id);
+
+-- Full-text index over topics, utterances and James's conclusions, kept
+-- current by triggers as the writer inserts. While a debate runs, each
+-- utterance is its own row (rowid = -utterances.id); when it finishes,
+-- they are folded into the debate's row (rowid = debates.id), so search
+-- ranks whole debates and scans one row per finished debate. Columns let
+-- bm25 weight topic > conclusion > utterances. unicode61 tokenizes Hangul
+-- as words, and queries use prefix terms so "근무" also matches "근무는";
+-- prefix indexes for 2-3 characters (most Korean words) keep those fast.
+CREATE VIRTUAL TABLE IF NOT EXISTS debate_search USING fts5(
+    thread_ts UNINDEXED, topic, utterance, conclusion,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+CREATE TRIGGER IF NOT EXISTS debates_search_insert AFTER INSERT ON debates BEGIN
+    INSERT INTO debate_search (rowid, thread_ts, topic) VALUES (new.id, new.thread_ts, new.topic);
+END;
+CREATE TRIGGER IF NOT EXISTS utterances_search_insert AFTER INSERT ON utterances BEGIN
+    INSERT INTO debate_search (rowid, thread_ts, utterance) VALUES (-new.id, new.thread_ts, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS debates_search_finish AFTER UPDATE OF ended_at ON debates
+WHEN old.ended_at IS NULL AND new.ended_at IS NOT NULL BEGIN
+    DELETE FROM debate_search WHERE rowid IN (SELECT -id FROM utterances WHERE thread_ts = new.thread_ts);
+    UPDATE debate_search SET
+        utterance = (
+            SELECT group_concat(text, char(10)) FROM (
+                SELECT text FROM utterances WHERE thread_ts = new.thread_ts ORDER BY id
+            )
+        ),
+        conclusion = new.conclusion
+    WHERE rowid = new.id;
+END;
+"""
+
+# bm25 column weights: thread_ts (unindexed), topic, utterance, conclusion
+_SEARCH_WEIGHTS = (0.0, 10.0, 1.0, 5.0)
+# Ranked rows fetched per requested hit (see TranscriptStore.search)
+_SEARCH_OVERFETCH = 10
+
+_INSERT_DEBATE = (
+    "INSERT OR IGNORE INTO debates (thread_ts, channel, user_id, topic, flow, started_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_UTTERANCE = (
+    "INSERT INTO utterances (thread_ts, round, node, speaker, text, created_at) VALUES (?, ?, ?, ?, ?, ?)"
+)
+# A concluded (or converged) debate's last utterance is James's conclusion
+_FINISH_DEBATE = (
+    "UPDATE debates SET ended_at = ?, outcome = ?, rounds = ?, "
+    "conclusion = CASE WHEN ? IN ('concluded', 'converged') THEN "
+    "(SELECT text FROM utterances WHERE thread_ts = debates.thread_ts ORDER BY id DESC LIMIT 1) END "
+    "WHERE thread_ts = ?"
+)
+
+_QUERY_TERM = re.compile(r"\w+")
+
+
+def build_match_query(text: str, match_any: bool = False) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query of prefix terms.
+
+    Args:
+        text: User's search text (FTS5 syntax characters are dropped)
+        match_any: Match debates containing any word (one-character
+            words are skipped) instead of all words
+
+    Returns:
+        MATCH expression, or None if the text has no usable words
+    """
+    terms = _QUERY_TERM.findall(text or "")
+    if match_any:
+        terms = list(dict.fromkeys(term for term in terms if len(term) > 1))
+    if not terms:
+        return None
+    return (" OR " if match_any else " ").join(f'"{term}"*' for term in terms)
+
+# Queue items: (kind, sql, params); kind "flush" carries an Event, None stops the writer
+_Op = Optional[Tuple[str, str, Any]]
+
+
+class TranscriptStore:
+    """
+    Append-only store of debates and their utterances.
+
+    Writers only enqueue; a single background thread applies queued
+    operations in batches (one transaction per batch), so debate threads
+    never wait on disk I/O. Reads open their own connection and see
+    everything written so far (WAL mode). Debates are indexed by thread,
+    by start time and by channel + start time.
+    """
+
+    def __init__(self, path: str, batch_size: int = 256) -> None:
+        """
+        Initialize TranscriptStore and start its writer thread.
+
+        Args:
+            path: SQLite database file (parent directory is created)
+            batch_size: Max operations per write transaction
+        """
+        self.path = path
+        self.batch_size = batch_size
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        try:
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+        self._queue: "queue.Queue[_Op]" = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name="transcript-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _put(self, kind: str, sql: str, params: Any) -> None:
+        if self._closed:
+            logger.warning("Transcript store closed; dropping %s for %s", kind, params[0])
+            return
+        self._queue.put((kind, sql, params))
+        TRANSCRIPT_QUEUE_DEPTH.set(self._queue.qsize())
+
+    def start_debate(
+        self,
+        thread_ts: str,
+        channel: str,
+        topic: str,
+        user_id: Optional[str] = None,
+        flow: Optional[str] = None
+    ) -> None:
+        """Record a debate's start (ignored if the thread is already stored, e.g., on resume)."""
+        self._put("debate", _INSERT_DEBATE, (thread_ts, channel, user_id, topic, flow, time.time()))
+
+    def append(self, thread_ts: str, utterance: Utterance) -> None:
+        """Append one finished turn (the record the orchestrator also checkpoints) to a debate."""
+        self._put("utterance", _INSERT_UTTERANCE, (
+            thread_ts, utterance.round, utterance.node, utterance.speaker, utterance.text, time.time()
+        ))
+
+    def finish_debate(self, thread_ts: str, outcome: str, rounds: int) -> None:
+        """Record how and when a debate ended (a concluded debate's last utterance becomes its conclusion)."""
+        self._put("finish", _FINISH_DEBATE, (time.time(), outcome, rounds, outcome, thread_ts))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything queued so far is written.
+
+        Returns:
+            True if flushed within the timeout
+        """
+        if not self._writer.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        self._queue.put(("flush", "", done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Write what is queued, then stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join(timeout)
+
+    def _run(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                TRANSCRIPT_QUEUE_DEPTH.set(self._queue.qsize())
+
+                stop = None in batch
+                ops = [op for op in batch if op is not None]
+                self._write(conn, [op for op in ops if op[0] != "flush"])
+                for kind, _, event in ops:
+                    if kind == "flush":
+                        event.set()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _write(self, conn: sqlite3.Connection, ops: List[Tuple[str, str, Any]]) -> None:
+        if not ops:
+            return
+        try:
+            with conn:
+                for _, sql, params in ops:
+                    conn.execute(sql, params)
+        except sqlite3.Error as e:
+            TRANSCRIPT_WRITE_ERRORS.inc()
+            logger.error("Failed to write %d transcript operation(s): %s", len(ops), e)
+            return
+        for kind, _, _ in ops:
+            TRANSCRIPT_WRITES.inc(kind=kind)
+
+    def get_transcript(self, thread_ts: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a debate with its utterances in order.
+
+        Returns:
+            Debate fields plus "utterances", or None if the thread is unknown
+        """
+        conn = self._connect()
+        try:
+            debate = conn.execute("SELECT * FROM debates WHERE thread_ts = ?", (thread_ts,)).fetchone()
+            if debate is None:
+                return None
+            rows = conn.execute(
+                "SELECT round, node, speaker, text, created_at FROM utterances WHERE thread_ts = ? ORDER BY id",
+                (thread_ts,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return {**dict(debate), "utterances": [dict(row) for row in rows]}
+
+    def list_debates(
+        self,
+        channel: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        List debates, newest first.
+
+        Args:
+            channel: Only debates in this channel
+            since: Only debates started at or after this epoch time
+            until: Only debates started before this epoch time
+            limit: Max debates returned
+
+        Returns:
+            Debate rows (without utterances)
+        """
+        clauses, params = [], []
+        if channel is not None:
+            clauses.append("channel = ?")
+            params.append(channel)
+        if since is not None:
+            clauses.append("started_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("started_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT * FROM debates {where} ORDER BY started_at DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+    def search(
+        self,
+        text: str,
+        limit: int = 5,
+        channel: Optional[str] = None,
+        match_any: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the debates that best match the text.
+
+        Matches in topics count most, then conclusions, then utterances.
+        Finished debates are ranked as a whole; running ones by their best
+        utterance.
+
+        Args:
+            text: Search words (matched as prefixes)
+            limit: Max debates returned
+            channel: Only debates in this channel
+            match_any: Rank debates matching any word (see build_match_query)
+
+        Returns:
+            Hits, best first: thread_ts, channel, topic, started_at,
+            outcome, conclusion, score (lower is better) and snippet
+            (matches in *bold*)
+        """
+        match = build_match_query(text, match_any=match_any)
+        if match is None or limit <= 0:
+            return []
+
+        weights = ", ".join(str(w) for w in _SEARCH_WEIGHTS)
+        with SEARCH_SECONDS.time():
+            conn = self._connect()
+            try:
+                # FTS5 keeps only the top rows while ranking; rows are over-fetched
+                # because running debates have several and a channel filter drops some
+                candidates = limit * _SEARCH_OVERFETCH
+                while True:
+                    rows = conn.execute(
+                        f"SELECT rowid, thread_ts, bm25(debate_search, {weights}) AS score "
+                        f"FROM debate_search WHERE debate_search MATCH ? ORDER BY score LIMIT ?",
+                        (match, candidates)
+                    ).fetchall()
+                    hits = self._search_hits(conn, rows, limit, channel)
+                    if len(hits) >= limit or len(rows) < candidates:
+                        break
+                    candidates *= 4
+
+                results = []
+                for hit in hits:
+                    snippet = conn.execute(
+                        "SELECT snippet(debate_search, -1, '*', '*', '…', 16) FROM debate_search "
+                        "WHERE debate_search MATCH ? AND rowid = ?",
+                        (match, hit.pop("rowid"))
+                    ).fetchone()
+                    hit["snippet"] = snippet[0] if snippet else ""
+                    results.append(hit)
+            finally:
+                conn.close()
+        return results
+
+    @staticmethod
+    def _search_hits(
+        conn: sqlite3.Connection,
+        rows: List[sqlite3.Row],
+        limit: int,
+        channel: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Best row per debate, with debate fields, for up to `limit` debates."""
+        best: Dict[str, sqlite3.Row] = {}
+        for row in rows:
+            best.setdefault(row["thread_ts"], row)
+        if not best:
+            return []
+
+        placeholders = ", ".join("?" for _ in best)
+        debates = {
+            debate["thread_ts"]: debate
+            for debate in conn.execute(
+                f"SELECT thread_ts, channel, topic, started_at, outcome, conclusion FROM debates "
+                f"WHERE thread_ts IN ({placeholders})",
+                list(best)
+            )
+        }
+
+        hits = []
+        for thread_ts, row in best.items():
+            debate = debates.get(thread_ts)
+            if debate is None or (channel is not None and debate["channel"] != channel):
+                continue
+            hits.append({**dict(debate), "score": row["score"], "rowid": row["rowid"]})
+            if len(hits) == limit:
+                break
+        return hits
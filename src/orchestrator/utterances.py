@@ -0,0 +1,188 @@
+"""In-memory debate transcript: utterance records and prompt rendering."""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.llm.agent_roles import AGENT_NAMES
+from src.llm.tokens import estimate_tokens
+from src.orchestrator.prompt_budget import SEPARATOR, PromptBudget
+
+SPEAKER_NAMES = {
+    "jamal": AGENT_NAMES["proposer"],
+    "ryan": AGENT_NAMES["opposer"],
+    "james": AGENT_NAMES["mediator"]
+}
+
+
+class Utterance:
+    """One finished turn. Its prompt line and token estimate are computed once, on first use."""
+
+    __slots__ = ("round", "speaker", "text", "node", "_line", "_tokens")
+
+    def __init__(self, round: int, speaker: str, text: str, node: Optional[str] = None) -> None:
+        """
+        Initialize Utterance.
+
+        Args:
+            round: Round the turn belongs to
+            speaker: Speaker key ("jamal", "ryan", "james")
+            text: The agent's response
+            node: Flow node ID of the turn
+        """
+        self.round = round
+        self.speaker = speaker
+        self.text = text
+        self.node = node
+        self._line: Optional[str] = None
+        self._tokens: Optional[int] = None
+
+    @property
+    def line(self) -> str:
+        """The turn as it appears in prompts ("AgentJamal: ...")."""
+        if self._line is None:
+            self._line = f"{SPEAKER_NAMES[self.speaker]}: {self.text}"
+        return self._line
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of line."""
+        if self._tokens is None:
+            self._tokens = estimate_tokens(self.line)
+        return self._tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for checkpoints (node only when set)."""
+        data = {"round": self.round, "speaker": self.speaker, "text": self.text}
+        if self.node:
+            data["node"] = self.node
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Utterance":
+        return cls(data["round"], data["speaker"], data["text"], data.get("node"))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Utterance):
+            return NotImplemented
+        return (self.round, self.speaker, self.text, self.node) == (other.round, other.speaker, other.text, other.node)
+
+    def __repr__(self) -> str:
+        return f"Utterance(round={self.round}, speaker={self.speaker!r}, node={self.node!r}, text={self.text[:30]!r})"
+
+
+class Transcript:
+    """
+    Ordered utterances of one debate.
+
+    The orchestrator appends to it, checkpoints serialize it and prompts
+    are rendered from it. Rendering joins the cached per-utterance lines
+    once per prompt instead of growing a context string turn by turn,
+    and the running token total lets a prompt budget be checked without
+    re-estimating old turns.
+    """
+
+    def __init__(self, utterances: Iterable[Utterance] = ()) -> None:
+        """
+        Initialize Transcript.
+
+        Args:
+            utterances: Initial utterances, oldest first
+        """
+        self._utterances: List[Utterance] = []
+        self._tokens = 0
+        for utterance in utterances:
+            self.append(utterance)
+
+    def append(self, utterance: Utterance) -> None:
+        """Add a finished turn."""
+        self._utterances.append(utterance)
+        self._tokens += utterance.tokens
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of all lines (separators not included)."""
+        return self._tokens
+
+    def in_round(self, round_num: int) -> List[Utterance]:
+        """Utterances of one round."""
+        return [u for u in self._utterances if u.round == round_num]
+
+    def view(
+        self,
+        speakers: Optional[Iterable[str]] = None,
+        last: Optional[int] = None,
+        since: int = 0
+    ) -> List[Utterance]:
+        """
+        Subset of the transcript for a prompt.
+
+        Args:
+            speakers: Only turns by these speaker keys (None = everyone)
+            last: Only the most recent N of those turns (None = all)
+            since: Skip the first `since` utterances
+
+        Returns:
+            Utterances, oldest first
+        """
+        utterances = self._utterances[since:] if since else self._utterances
+        if speakers is not None:
+            wanted = set(speakers)
+            utterances = [u for u in utterances if u.speaker in wanted]
+        if last is not None:
+            utterances = utterances[-last:] if last > 0 else []
+        return list(utterances)
+
+    def render(
+        self,
+        header: str,
+        instruction: str = "",
+        budget: Optional[PromptBudget] = None,
+        speakers: Optional[Iterable[str]] = None,
+        last: Optional[int] = None,
+        since: int = 0
+    ) -> str:
+        """
+        Render a prompt: header, turns (oldest first) and instruction.
+
+        Args:
+            header: Text before the turns (topic, background, fact sheet)
+            instruction: Text after the turns (the node's instruction)
+            budget: Optional prompt budget; oversized prompts are trimmed
+            speakers: Only turns by these speaker keys (None = everyone)
+            last: Only the most recent N turns (None = all)
+            since: Skip the first `since` utterances
+
+        Returns:
+            Prompt text
+        """
+        if speakers is None and last is None and not since:
+            utterances = self._utterances
+        else:
+            utterances = self.view(speakers, last, since)
+
+        lines = [u.line for u in utterances]
+        if budget is not None:
+            return budget.fit(header, lines, instruction, sizes=[u.tokens for u in utterances])
+        return SEPARATOR.join(part for part in (header, *lines, instruction) if part)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Plain dicts for checkpoints."""
+        return [u.to_dict() for u in self._utterances]
+
+    @classmethod
+    def from_list(cls, items: Iterable[Any]) -> "Transcript":
+        """Build from checkpoint dicts (Utterance items are taken as they are)."""
+        return cls(item if isinstance(item, Utterance) else Utterance.from_dict(item) for item in items)
+
+    def __len__(self) -> int:
+        return len(self._utterances)
+
+    def __iter__(self) -> Iterator[Utterance]:
+        return iter(self._utterances)
+
+    def __getitem__(self, index: int) -> Utterance:
+        return self._utterances[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Transcript):
+            return self._utterances == other._utterances
+        return NotImplemented
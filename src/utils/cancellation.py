@@ -0,0 +1,76 @@
+"""Thread-safe cancellation tokens for aborting in-flight work."""
+
+import threading
+import time
+from typing import Callable, List, Optional
+
+
+class OperationCancelled(Exception):
+    """Raised when work is aborted through a CancellationToken."""
+
+
+class CancellationToken:
+    """
+    One-shot cancel signal shared between a requester and a worker.
+
+    Callbacks registered with add_callback (e.g., Future.cancel for an
+    in-flight model call) run immediately on cancel(), so blocked work is
+    aborted instead of noticed at the next checkpoint.
+    """
+
+    def __init__(self) -> None:
+        self.reason = ""
+        self.cancelled_at: Optional[float] = None
+        self._callbacks: List[Callable[[], object]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True once cancel() has been called."""
+        return self.cancelled_at is not None
+
+    def cancel(self, reason: str = "") -> bool:
+        """
+        Cancel and run registered callbacks.
+
+        Args:
+            reason: Free-form reason (e.g., who cancelled)
+
+        Returns:
+            True on the first call, False if already cancelled
+        """
+        with self._lock:
+            if self.cancelled_at is not None:
+                return False
+            self.reason = reason
+            self.cancelled_at = time.monotonic()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            callback()
+        return True
+
+    def add_callback(self, callback: Callable[[], object]) -> None:
+        """Register a callback for cancel(); runs now if already cancelled."""
+        with self._lock:
+            if self.cancelled_at is None:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], object]) -> None:
+        """Unregister a callback (no-op if it is not registered)."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise OperationCancelled if cancel() has been called."""
+        if self.is_cancelled:
+            raise OperationCancelled(self.reason or "cancelled")
+
+    def seconds_since_cancel(self) -> float:
+        """Seconds elapsed since cancel() (0 if not cancelled)."""
+        if self.cancelled_at is None:
+            return 0.0
+        return time.monotonic() - self.cancelled_at
@@ -0,0 +1,120 @@
+"""Long-lived asyncio event loop for running agent coroutines from sync code."""
+
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class BackgroundLoop:
+    """
+    Runs one asyncio event loop in a daemon thread.
+
+    Sync callers (Slack listener threads, the orchestrator) submit
+    coroutines with run(). Because the loop outlives each call, clients
+    bound to it (e.g., the genai httpx.AsyncClient) keep their pooled
+    connections between requests, unlike a fresh asyncio.run per call.
+
+    Context variables (e.g., the current trace span) are copied from the
+    submitting thread, so spans opened in the coroutine nest correctly.
+    """
+
+    def __init__(self, name: str = "agent-loop") -> None:
+        """
+        Initialize BackgroundLoop.
+
+        Args:
+            name: Name of the loop thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running event loop (started on first access)."""
+        self.start()
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """True while the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "BackgroundLoop":
+        """Start the loop thread if it is not running yet."""
+        if self.is_running:
+            return self
+
+        with self._lock:
+            if self.is_running:
+                return self
+
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=_run, name=self.name, daemon=True)
+            self._thread.start()
+            started.wait()
+        return self
+
+    def submit(self, coro: Coroutine) -> "asyncio.Future":
+        """
+        Schedule a coroutine on the loop without waiting for it.
+
+        Returns:
+            concurrent.futures.Future for the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None = no limit); on timeout the
+                coroutine is cancelled instead of left running on the loop
+
+        Returns:
+            The coroutine's result (its exception is re-raised)
+
+        Raises:
+            concurrent.futures.TimeoutError: If the coroutine did not finish in time
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop and wait for its thread to exit."""
+        with self._lock:
+            if not self.is_running:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._loop.close()
+            self._thread = None
+
+
+_default_loop = BackgroundLoop()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Return the process-wide loop shared by all agents."""
+    return _default_loop.start()
@@ -0,0 +1,264 @@
+"""
+Shared, pooled HTTP transport for the Slack Web API and model clients.
+
+PooledWebClient overrides WebClient._perform_urllib_http_request_internal,
+a private slack_sdk method, to send requests over the shared pool.
+pyproject caps slack-sdk below the next major version, and
+tests/unit/test_http_transport.py fails if the hook is renamed or
+stops being called, so upgrades that break it are caught in CI.
+"""
+
+import email.message
+import importlib.util
+import io
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+import httpx
+from slack_sdk import WebClient
+
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+
+logger = setup_logger(__name__)
+
+# Requests and responses are small and written in several sends (headers,
+# then body); without TCP_NODELAY, Nagle + delayed ACK stalls each request
+# on a kept-alive connection by up to ~40 ms
+SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "Requests through the shared HTTP transport by pool and connection (new/reused)",
+    ["pool", "connection"]
+)
+
+
+def http2_available() -> bool:
+    """True if the optional h2 package (httpx[http2]) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class HttpTransportConfig:
+    """Connection pool, keep-alive and timeout settings."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+
+    def limits(self) -> httpx.Limits:
+        """Pool limits for httpx clients."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        """Timeouts for httpx clients (read/write/pool share read_timeout)."""
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+
+class _ConnectionTrace:
+    """httpcore trace hook that notes whether the request opened a connection."""
+
+    __slots__ = ("opened",)
+
+    def __init__(self) -> None:
+        self.opened = False
+
+    def __call__(self, name: str, info: Dict[str, Any]) -> None:
+        if name == "connection.connect_tcp.started":
+            self.opened = True
+
+
+class _AsyncConnectionTrace(_ConnectionTrace):
+    """Async variant (httpcore awaits trace hooks on async clients)."""
+
+    __slots__ = ()
+
+    async def __call__(self, name: str, info: Dict[str, Any]) -> None:
+        if name == "connection.connect_tcp.started":
+            self.opened = True
+
+
+def _record_connection(pool: str, response: httpx.Response) -> None:
+    trace = response.request.extensions.get("trace")
+    if isinstance(trace, _ConnectionTrace):
+        HTTP_REQUESTS.inc(pool=pool, connection="new" if trace.opened else "reused")
+
+
+class HttpTransport:
+    """
+    Owns the process-wide httpx clients.
+
+    - client: sync client shared by every Slack WebClient (pool "slack")
+    - async_client: async client for the genai model client (pool "model");
+      it must only be used from one event loop (see BackgroundLoop)
+
+    Every request is counted in http_requests_total{pool, connection},
+    where connection is "new" if a TCP connection was opened for it and
+    "reused" if it went over a pooled keep-alive connection.
+    """
+
+    def __init__(self, config: Optional[HttpTransportConfig] = None) -> None:
+        """
+        Initialize HttpTransport.
+
+        Args:
+            config: Pool and timeout settings (default: HttpTransportConfig())
+        """
+        self.config = config or HttpTransportConfig()
+        self.http2 = self.config.http2 and http2_available()
+        if self.config.http2 and not self.http2:
+            logger.info("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Shared sync client (created on first use)."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        transport=httpx.HTTPTransport(
+                            http2=self.http2, limits=self.config.limits(), socket_options=SOCKET_OPTIONS
+                        ),
+                        timeout=self.config.timeout(),
+                        event_hooks={"request": [self._on_request], "response": [self._on_response]}
+                    )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared async client (created on first use)."""
+        if self._async_client is None:
+            with self._lock:
+                if self._async_client is None:
+                    self._async_client = httpx.AsyncClient(
+                        transport=httpx.AsyncHTTPTransport(
+                            http2=self.http2, limits=self.config.limits(), socket_options=SOCKET_OPTIONS
+                        ),
+                        timeout=self.config.timeout(),
+                        follow_redirects=True,
+                        event_hooks={
+                            "request": [self._on_async_request],
+                            "response": [self._on_async_response]
+                        }
+                    )
+        return self._async_client
+
+    @staticmethod
+    def _on_request(request: httpx.Request) -> None:
+        request.extensions["trace"] = _ConnectionTrace()
+
+    @staticmethod
+    def _on_response(response: httpx.Response) -> None:
+        _record_connection("slack", response)
+
+    @staticmethod
+    async def _on_async_request(request: httpx.Request) -> None:
+        request.extensions["trace"] = _AsyncConnectionTrace()
+
+    @staticmethod
+    async def _on_async_response(response: httpx.Response) -> None:
+        _record_connection("model", response)
+
+    def slack_client(self, token: Optional[str] = None, **kwargs) -> "PooledWebClient":
+        """
+        Build a WebClient that sends requests over the shared pool.
+
+        Args:
+            token: Bot token
+            **kwargs: Other WebClient arguments (e.g., base_url)
+
+        Returns:
+            PooledWebClient
+        """
+        kwargs.setdefault("timeout", int(self.config.read_timeout))
+        return PooledWebClient(token=token, http_client=self.client, **kwargs)
+
+    def genai_http_options(self) -> Any:
+        """
+        HttpOptions that make a genai Client use the shared async pool.
+
+        Returns:
+            google.genai.types.HttpOptions
+        """
+        from google.genai import types
+
+        return types.HttpOptions(httpx_async_client=self.async_client)
+
+    def close(self) -> None:
+        """Close the sync client (the async client closes with its loop)."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class PooledWebClient(WebClient):
+    """
+    WebClient that sends requests through a shared httpx.Client.
+
+    Request building, retries and response parsing stay in slack_sdk;
+    only the HTTP round-trip (the private _perform_urllib_http_request_internal)
+    is replaced, so connections are kept alive and shared by every client
+    on the same transport. Clients configured with a proxy or custom SSL
+    context fall back to urllib.
+    """
+
+    def __init__(self, *args, http_client: httpx.Client, **kwargs) -> None:
+        """
+        Initialize PooledWebClient.
+
+        Args:
+            http_client: Shared httpx client (see HttpTransport.client)
+            *args, **kwargs: WebClient arguments
+        """
+        super().__init__(*args, **kwargs)
+        self.http_client = http_client
+
+    def _perform_urllib_http_request_internal(self, url: str, req: Request) -> Dict[str, Any]:
+        if self.proxy is not None or self.ssl is not None or not url.lower().startswith("http"):
+            return super()._perform_urllib_http_request_internal(url, req)
+
+        headers = {name: str(value) for name, value in req.header_items()}
+        try:
+            response = self.http_client.post(url, content=req.data, headers=headers)
+        except httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            # URLError keeps slack_sdk's ConnectionErrorRetryHandler working
+            raise URLError(e) from e
+
+        response_headers = email.message.Message()
+        for name, value in response.headers.multi_items():
+            response_headers[name] = value
+
+        if response.status_code >= 400:
+            # Same shape urllib raises, so slack_sdk's retry handling applies
+            raise HTTPError(
+                url, response.status_code, response.reason_phrase,
+                response_headers, io.BytesIO(response.content)
+            )
+
+        if response.headers.get("content-type", "").startswith("application/gzip"):
+            return {"status": response.status_code, "headers": response_headers, "body": response.content}
+
+        charset = response.charset_encoding or "utf-8"
+        return {
+            "status": response.status_code,
+            "headers": response_headers,
+            "body": response.content.decode(charset)
+        }
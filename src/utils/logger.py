@@ -1,8 +1,157 @@
 """Logging configuration for AgentJamal bot."""
 
+import json
 import logging
+import queue
 import sys
-from typing import Optional
+import threading
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Default cap on rendered message length (0 = unlimited)
+DEFAULT_MAX_LENGTH = 2000
+
+# Message templates whose counts SamplingFilter remembers
+DEFAULT_SAMPLING_KEYS = 4096
+
+# Attributes present on every LogRecord; anything else came from `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def truncate(text: str, max_length: int) -> str:
+    """
+    Truncate text to max_length characters, noting how much was dropped.
+
+    Args:
+        text: Text to truncate
+        max_length: Maximum length (0 or less = unlimited)
+
+    Returns:
+        Original or truncated text
+    """
+    if max_length <= 0 or len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}... [truncated {len(text) - max_length} chars]"
+
+
+class TruncatingFormatter(logging.Formatter):
+    """Text formatter that caps the rendered message length."""
+
+    def __init__(self, fmt: str = TEXT_FORMAT, datefmt: str = DATE_FORMAT, max_length: int = DEFAULT_MAX_LENGTH):
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self.max_length = max_length
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        record.message = truncate(record.message, self.max_length)
+        return super().formatMessage(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter that renders one JSON object per record."""
+
+    def __init__(self, max_length: int = DEFAULT_MAX_LENGTH):
+        super().__init__(datefmt=DATE_FORMAT)
+        self.max_length = max_length
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": truncate(record.getMessage(), self.max_length)
+        }
+        # Structured fields passed via `extra=`
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep 1 in N records below WARNING for each (logger, message template).
+
+    The first occurrence of a template is always kept, so rare messages
+    are never dropped. WARNING and above always pass. Templates are the
+    unformatted message, so callers must log with %-style arguments
+    rather than f-strings for sampling to apply.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None, max_keys: int = DEFAULT_SAMPLING_KEYS):
+        """
+        Initialize SamplingFilter.
+
+        Args:
+            rates: Mapping of logger name to keep-rate in (0, 1]
+            max_keys: Templates to keep counts for (least recently seen
+                are forgotten, and restart at their first occurrence)
+        """
+        super().__init__()
+        self.rates = rates or {}
+        self.max_keys = max_keys
+        self._counts: "OrderedDict[tuple, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.name)
+        if rate is None or rate >= 1 or record.levelno >= logging.WARNING:
+            return True
+        if rate <= 0:
+            return False
+
+        every = int(round(1 / rate))
+        key = (record.name, record.msg if isinstance(record.msg, str) else id(record.msg))
+        with self._lock:
+            count = self._counts.pop(key, 0)
+            self._counts[key] = count + 1
+            if len(self._counts) > self.max_keys:
+                self._counts.popitem(last=False)
+        return count % every == 0
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _LoggingState:
+    """Process-wide logging mode set by configure_logging()."""
+
+    json_format = False
+    async_mode = False
+    max_length = DEFAULT_MAX_LENGTH
+    sampling_filter = SamplingFilter()
+    shared_handler: Optional[logging.Handler] = None
+    listener: Optional[QueueListener] = None
+    loggers: List[logging.Logger] = []
+    lock = threading.Lock()
+
+
+def _make_formatter() -> logging.Formatter:
+    if _LoggingState.json_format:
+        return JsonFormatter(max_length=_LoggingState.max_length)
+    return TruncatingFormatter(max_length=_LoggingState.max_length)
+
+
+def _make_handler(log_level: int) -> logging.Handler:
+    """Return the handler to attach to a logger under the current mode."""
+    if _LoggingState.async_mode:
+        # One queue + background writer shared by every logger
+        return _LoggingState.shared_handler
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(log_level)
+    handler.setFormatter(_make_formatter())
+    return handler
 
 
 def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
@@ -23,18 +172,93 @@ def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         log_level = getattr(logging, (level or "INFO").upper())
         logger.setLevel(log_level)
 
-        # Create console handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(log_level)
+        # Add handler to logger (stdout, or the shared queue in async mode)
+        logger.addHandler(_make_handler(log_level))
+        logger.addFilter(_LoggingState.sampling_filter)
 
-        # Create formatter
-        formatter = logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        handler.setFormatter(formatter)
-
-        # Add handler to logger
-        logger.addHandler(handler)
+        with _LoggingState.lock:
+            _LoggingState.loggers.append(logger)
 
     return logger
+
+
+def configure_logging(
+    json_format: bool = False,
+    async_mode: bool = False,
+    max_length: int = DEFAULT_MAX_LENGTH,
+    sample_rates: Optional[Dict[str, float]] = None
+) -> None:
+    """
+    Switch logging mode for all loggers created by setup_logger.
+
+    In async mode, records are put on an in-memory queue and written to
+    stdout by a QueueListener thread, so slow stdout never blocks the
+    caller. Message formatting also happens on the listener thread.
+
+    Args:
+        json_format: Emit one JSON object per line instead of text
+        async_mode: Use QueueHandler/QueueListener background writer
+        max_length: Cap on rendered message length (0 = unlimited)
+        sample_rates: Logger name -> keep-rate for records below WARNING
+    """
+    shutdown_logging()
+
+    _LoggingState.json_format = json_format
+    _LoggingState.async_mode = async_mode
+    _LoggingState.max_length = max_length
+    _LoggingState.sampling_filter.rates = dict(sample_rates or {})
+
+    if async_mode:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(_make_formatter())
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _LoggingState.shared_handler = _DeferredQueueHandler(log_queue)
+        # Per-logger levels are applied before records reach the queue
+        _LoggingState.listener = QueueListener(log_queue, stream_handler)
+        _LoggingState.listener.start()
+
+    _reattach_handlers()
+
+
+def _reattach_handlers() -> None:
+    """Give every logger from setup_logger a handler for the current mode."""
+    with _LoggingState.lock:
+        loggers = list(_LoggingState.loggers)
+    for logger in loggers:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(_make_handler(logger.level))
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the background writer, if running.
+
+    Loggers are switched back to writing to stdout directly, so records
+    logged afterwards (e.g., by atexit hooks) are not lost in a queue
+    nobody reads.
+    """
+    if _LoggingState.listener is not None:
+        _LoggingState.listener.stop()
+        _LoggingState.listener = None
+        _LoggingState.async_mode = False
+        _LoggingState.shared_handler = None
+        _reattach_handlers()
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """
+    Parse "logger=rate,logger=rate" into a dict.
+
+    Args:
+        spec: Comma-separated logger=rate pairs (e.g., "src.llm.adk_agent=0.1")
+
+    Returns:
+        Mapping of logger name to keep-rate
+    """
+    rates = {}
+    for item in (spec or "").split(","):
+        if "=" in item:
+            name, rate = item.split("=", 1)
+            rates[name.strip()] = float(rate)
+    return rates
@@ -0,0 +1,6 @@
+"""Slack user mention markup (<@U123>) shared by the bot and the orchestrator."""
+
+import re
+
+# Removed from topics, commands and queries before they are matched or searched
+MENTION_PATTERN = re.compile(r"<@[^>]+>")
@@ -0,0 +1,35 @@
+"""Fire-and-forget daemon threads that report back through a Future."""
+
+import contextvars
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+def submit_daemon(fn: Callable[..., Any], *args: Any, name: str = "worker", **kwargs: Any) -> Future:
+    """
+    Run fn(*args, **kwargs) on a new daemon thread.
+
+    The caller's context (current trace span) is carried over. Daemon
+    threads, unlike a ThreadPoolExecutor, never hold up process exit, so
+    work that outlives its caller's timeout is simply abandoned.
+
+    Args:
+        fn: Function to run
+        name: Thread name
+        *args, **kwargs: Arguments for fn
+
+    Returns:
+        Future resolved with fn's return value or exception
+    """
+    future: Future = Future()
+    ctx = contextvars.copy_context()
+
+    def _run() -> None:
+        try:
+            future.set_result(ctx.run(fn, *args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_run, name=name, daemon=True).start()
+    return future
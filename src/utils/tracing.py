@@ -0,0 +1,296 @@
+"""Span-based latency tracing with pluggable exporters."""
+
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "start_time",
+        "end_time", "duration_ms", "attributes", "status", "error", "_start"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Initialize and start a span.
+
+        Args:
+            name: Operation name (e.g., "debate.turn")
+            trace_id: ID shared by all spans of the trace
+            parent_id: span_id of the enclosing span, if any
+            attributes: Initial attributes
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self.duration_ms: Optional[float] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._start = time.perf_counter()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a single attribute."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span as failed."""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        """Stop the span clock."""
+        if self.end_time is None:
+            self.duration_ms = (time.perf_counter() - self._start) * 1000
+            self.end_time = self.start_time + self.duration_ms / 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the span as a JSON-serializable dict."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error
+        }
+
+
+class SpanExporter:
+    """Base class for span exporters."""
+
+    def export(self, span: Span) -> None:
+        """Export a finished span."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+
+
+class NullExporter(SpanExporter):
+    """Exporter that drops all spans."""
+
+    def export(self, span: Span) -> None:
+        pass
+
+
+class InMemoryExporter(SpanExporter):
+    """Exporter that keeps finished spans in memory (for tests)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def get_spans(self, name: Optional[str] = None) -> List[Span]:
+        """Return finished spans, optionally filtered by name."""
+        with self._lock:
+            return [s for s in self.spans if name is None or s.name == name]
+
+
+class JSONLFileExporter(SpanExporter):
+    """Exporter that appends one JSON object per span to a local file."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize JSONLFileExporter.
+
+        Args:
+            path: File to append spans to
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Creates spans and hands finished spans to an exporter.
+
+    The current span is tracked in a ContextVar, so nested spans inside
+    one thread (and inside asyncio.run called from that thread) are
+    parented automatically. New threads start without a current span.
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None) -> None:
+        self.exporter = exporter or NullExporter()
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        new_trace: bool = False
+    ) -> Iterator[Span]:
+        """
+        Start a span as a context manager.
+
+        Args:
+            name: Operation name
+            attributes: Initial attributes
+            new_trace: Start a new trace even if a span is active
+
+        Yields:
+            The active span
+        """
+        parent = None if new_trace else _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            try:
+                self.exporter.export(span)
+            except Exception:
+                # Tracing must never break the traced operation
+                pass
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """Return the active span in this context, if any."""
+        return _current_span.get()
+
+    def shutdown(self) -> None:
+        """Shut down the exporter."""
+        self.exporter.shutdown()
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+    return _tracer
+
+
+def create_exporter(kind: str, path: str = "traces.jsonl") -> SpanExporter:
+    """
+    Create an exporter by name.
+
+    Args:
+        kind: "none", "memory" or "jsonl"
+        path: Output file for the jsonl exporter
+
+    Returns:
+        SpanExporter instance
+    """
+    kind = (kind or "none").lower()
+    if kind == "none":
+        return NullExporter()
+    if kind == "memory":
+        return InMemoryExporter()
+    if kind == "jsonl":
+        return JSONLFileExporter(path)
+    raise ValueError(f"Invalid trace exporter: {kind}. Must be one of ['none', 'memory', 'jsonl']")
+
+
+def configure_tracing(exporter: SpanExporter) -> Tracer:
+    """
+    Replace the exporter of the process-wide tracer.
+
+    Args:
+        exporter: New exporter (the previous one is shut down)
+
+    Returns:
+        The process-wide tracer
+    """
+    previous = _tracer.exporter
+    _tracer.exporter = exporter
+    if previous is not exporter:
+        previous.shutdown()
+    return _tracer
+
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """
+    Load spans written by JSONLFileExporter.
+
+    Args:
+        path: JSONL trace file
+
+    Returns:
+        List of span dicts
+    """
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def latency_breakdown(spans: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize span durations by span name.
+
+    Args:
+        spans: Span dicts (e.g., from load_spans)
+
+    Returns:
+        Mapping of span name to count, total, mean, p50, p95 and max (ms)
+    """
+    durations: Dict[str, List[float]] = {}
+    for span in spans:
+        if span.get("duration_ms") is not None:
+            durations.setdefault(span["name"], []).append(span["duration_ms"])
+
+    def _percentile(values: List[float], pct: float) -> float:
+        index = min(int(round(pct / 100 * (len(values) - 1))), len(values) - 1)
+        return values[index]
+
+    breakdown = {}
+    for name, values in durations.items():
+        values.sort()
+        total = sum(values)
+        breakdown[name] = {
+            "count": len(values),
+            "total_ms": total,
+            "mean_ms": total / len(values),
+            "p50_ms": _percentile(values, 50),
+            "p95_ms": _percentile(values, 95),
+            "max_ms": values[-1]
+        }
+    return breakdown
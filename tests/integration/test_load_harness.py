@@ -0,0 +1,25 @@
+"""Integration test for the end-to-end load-test harness (local fakes only)."""
+
+import pytest
+from benchmarks.load_test import parse_args, run
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_load_harness_completes_debates_against_fakes():
+    """Test mentions flow through SlackBot, orchestrator and ADK runners to the fake Slack API."""
+    args = parse_args([
+        "--debates", "2", "--rate", "0", "--rounds", "1",
+        "--llm-latency-ms", "0", "--llm-jitter-ms", "0",
+        "--slack-latency-ms", "0", "--slack-jitter-ms", "0",
+        "--timeout", "60"
+    ])
+
+    report = run(args)
+
+    assert report["completed_debates"] == 2
+    # Per debate, one round: Jamal, James summary, Ryan, James conclusion
+    assert report["slack_calls"]["chat.postMessage"] == 8
+    assert report["slack_calls"]["reactions.add"] == 2
+    assert report["stages"]["llm.generate"]["count"] == 8
+    assert report["tokens"]["calls"] == 8
@@ -58,3 +58,26 @@ def test_session_service_accessible():
 
     agent = ADKAgent(api_key="test_key", role="proposer")
     assert agent.runner.session_service is not None
+
+
+def test_lazy_agent_defers_runner_until_first_use():
+    """Test lazy mode builds the agent and runner on first access."""
+    from src.llm.adk_agent import ADKAgent
+
+    agent = ADKAgent(api_key="test_key", role="opposer", lazy=True)
+    assert not agent.is_initialized
+
+    assert agent.runner.session_service is not None
+    assert agent.is_initialized
+    assert agent.agent.name == "AgentRyan"
+
+
+def test_warm_up_initializes_once():
+    """Test warm_up builds the runner and is a no-op afterwards."""
+    from src.llm.adk_agent import ADKAgent
+
+    agent = ADKAgent(api_key="test_key", role="mediator", lazy=True)
+
+    assert agent.warm_up() >= 0
+    assert agent.is_initialized
+    assert agent.warm_up() == 0.0
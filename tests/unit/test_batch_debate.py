@@ -0,0 +1,89 @@
+"""Unit tests for the offline batch debate runner."""
+
+import io
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+from src.batch_debate import TranscriptSink, read_topics, run_batch
+from src.config import Config
+from src.llm.usage import TokenUsage, UsageTracker
+from src.orchestrator import DebateOrchestrator
+from src.orchestrator.factory import build_orchestrator
+
+
+def _agent(name, speak):
+    agent = Mock()
+    agent.agent_name = name
+    agent.generate_response.side_effect = speak
+    return agent
+
+
+def test_read_topics_skips_blank_and_comment_lines():
+    """Test topic file parsing."""
+    assert read_topics(["# 주제 목록\n", "원격 근무\n", "  \n", "  기본소득  \n"]) == ["원격 근무", "기본소득"]
+
+
+def test_run_batch_streams_results_under_concurrency_limit():
+    """Test every topic yields one JSONL result and at most N debates run at once."""
+    tracker = UsageTracker()
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _jamal(text, thread_ts, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        tracker.record("AgentJamal", TokenUsage(100, 20, 0, 1), thread_ts=thread_ts)
+        return "찬성합니다"
+
+    def _james(text, **kwargs):
+        return "토론을 종료합니다. 결론" if "AgentRyan:" in text else "요약"
+
+    sink = TranscriptSink()
+    orchestrator = DebateOrchestrator(
+        jamal_client=sink.client("jamal"),
+        ryan_client=sink.client("ryan"),
+        james_client=sink.client("james"),
+        jamal_agent=_agent("AgentJamal", _jamal),
+        ryan_agent=_agent("AgentRyan", lambda text, **kwargs: "반대합니다"),
+        james_agent=_agent("AgentJames", _james),
+        usage_tracker=tracker
+    )
+    out = io.StringIO()
+
+    summary = run_batch(orchestrator, sink, ["주제 A", "주제 B", "주제 C", "주제 D"], out, 2, tracker)
+
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert sorted(r["topic"] for r in results) == ["주제 A", "주제 B", "주제 C", "주제 D"]
+    assert all(r["outcome"] == "concluded" for r in results)
+    assert [m["speaker"] for m in results[0]["messages"]] == ["jamal", "james", "ryan", "james"]
+    assert results[0]["usage"]["total_tokens"] == 120
+    assert peak == 2
+    assert summary["outcomes"] == {"concluded": 4}
+    assert summary["tokens"] == 480
+    assert not any(DebateOrchestrator.is_debate_active(f"batch-{i:06d}") for i in range(4))
+
+
+def test_batch_uses_the_same_wiring_as_the_bot(monkeypatch):
+    """Test build_orchestrator applies Config (lazy agents, shared transport) for any client set."""
+    monkeypatch.setattr(Config, "LAZY_INIT", True)
+    monkeypatch.setattr(Config, "SEARCH_CACHE_ENABLED", True)
+    sink, transport = TranscriptSink(), Mock()
+
+    orchestrator = build_orchestrator(
+        sink.client("jamal"), sink.client("ryan"), sink.client("james"),
+        usage_tracker=UsageTracker(), http_transport=transport, max_rounds=2, flow="panel"
+    )
+
+    agents = [orchestrator.jamal, orchestrator.ryan, orchestrator.james]
+    assert [agent.role for agent in agents] == ["proposer", "opposer", "mediator"]
+    assert all(agent.http_transport is transport and not agent.is_initialized for agent in agents)
+    assert agents[0].search_cache is not None and agents[0].search_cache is agents[2].search_cache
+    assert (orchestrator.max_rounds, orchestrator.flow.name) == (2, "panel")
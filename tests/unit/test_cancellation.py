@@ -0,0 +1,58 @@
+"""Unit tests for cancellation tokens and cancelling in-flight agent calls."""
+
+import threading
+import time
+import pytest
+from benchmarks.fakes import FakeLlm, LatencyModel, build_fake_agent
+from src.bot.slack_handler import is_cancel_command
+from src.llm.adk_agent import ADKAgent
+from src.utils.cancellation import CancellationToken, OperationCancelled
+
+
+def test_token_runs_callbacks_once():
+    """Test callbacks run on the first cancel and immediately if added later."""
+    token = CancellationToken()
+    calls = []
+    def _removed():
+        calls.append("removed")
+
+    token.add_callback(lambda: calls.append("early"))
+    token.add_callback(_removed)
+    token.remove_callback(_removed)
+
+    assert token.cancel("user") is True
+    assert token.cancel("again") is False
+    token.add_callback(lambda: calls.append("late"))
+
+    assert calls == ["early", "late"]
+    assert token.reason == "user"
+    with pytest.raises(OperationCancelled):
+        token.raise_if_cancelled()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("stop", True),
+    ("<@U123> 중지", True),
+    ("  Cancel! ", True),
+    ("stop the bleeding", False),
+    ("<@U123> 원격 근무 토론", False),
+])
+def test_is_cancel_command(text, expected):
+    """Test cancel words are recognised with or without a mention."""
+    assert is_cancel_command(text) is expected
+
+
+def test_generate_response_aborts_in_flight_call():
+    """Test cancelling aborts runner.run_async instead of waiting for the model."""
+    model = FakeLlm(model="fake-llm", latency=LatencyModel(mean_ms=5000))
+    agent = ADKAgent(api_key="test-key", role="opposer", root_agent=build_fake_agent("opposer", model))
+    token = CancellationToken()
+    threading.Timer(0.2, token.cancel, args=("test",)).start()
+
+    start = time.perf_counter()
+    with pytest.raises(OperationCancelled):
+        agent.generate_response("주제: 테스트", thread_ts="T1", cancel_token=token)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    assert token.seconds_since_cancel() < 1.0
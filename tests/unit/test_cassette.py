@@ -0,0 +1,105 @@
+"""Unit tests for ADKAgent cassette record/replay."""
+
+import threading
+import time
+import pytest
+from benchmarks.fakes import FakeLlm, LatencyModel, build_fake_agent
+from src.llm.adk_agent import ADKAgent
+from src.llm.cassette import Cassette
+from src.llm.search_cache import SearchCache, SearchResult
+from src.llm.usage import TokenUsage
+from src.utils.cancellation import CancellationToken, OperationCancelled
+
+
+def _agent(mode, directory, error_rate=0.0, replay_speed=0.0, search_cache=None):
+    model = FakeLlm(model="fake-llm", latency=LatencyModel(error_rate=error_rate))
+    return ADKAgent(
+        api_key="test-key",
+        role="opposer",
+        root_agent=build_fake_agent("opposer", model),
+        cassette_mode=mode,
+        cassette_dir=str(directory),
+        replay_speed=replay_speed,
+        search_cache=search_cache
+    )
+
+
+def test_record_then_replay_returns_same_text_and_usage(tmp_path):
+    """Test a recorded run is served back without calling the model."""
+    recorder = _agent("record", tmp_path)
+    recorded = recorder.generate_response("주제: 테스트", thread_ts="T1")
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # The replaying agent's model always fails, so any live call would show
+    player = _agent("replay", tmp_path, error_rate=1.0)
+    replayed = player.generate_response("주제: 테스트", thread_ts="T2")
+
+    assert replayed == recorded
+    assert player.last_usage.total_tokens == recorder.last_usage.total_tokens
+    assert player.last_usage.calls == 1
+
+
+def test_recordings_are_keyed_on_the_prompt_with_search_results(tmp_path):
+    """Test a prompt carrying cached search results replays only with the same results."""
+    def _cache(thread_ts):
+        cache = SearchCache()
+        cache.put(thread_ts, SearchResult(("원격 근무 통계",), "생산성 13% 향상"))
+        return cache
+
+    _agent("record", tmp_path, search_cache=_cache("T1")).generate_response("반론해 주세요", thread_ts="T1")
+
+    cache = _cache("T2")
+    player = _agent("replay", tmp_path, error_rate=1.0, search_cache=cache)
+    assert not player.generate_response("반론해 주세요", thread_ts="T2").startswith("Error")
+    assert cache.render_unseen("T2", player.agent_name) == ("", [])
+
+    # Without the results the prompt differs, so there is no recording for it
+    assert _agent("replay", tmp_path).generate_response("반론해 주세요").startswith("Error")
+
+
+def test_replay_miss_returns_error(tmp_path):
+    """Test replay without a recording returns an error string."""
+    player = _agent("replay", tmp_path)
+
+    response = player.generate_response("녹화되지 않은 프롬프트")
+
+    assert response.startswith("Error generating response: no cassette recording")
+
+
+def test_invalid_cassette_mode_raises_error(tmp_path):
+    """Test unknown cassette modes are rejected."""
+    with pytest.raises(ValueError, match="Invalid cassette_mode"):
+        _agent("rewind", tmp_path)
+
+
+def test_replay_scales_recorded_timing(tmp_path):
+    """Test replay sleeps for recorded delays divided by speed."""
+    cassette = Cassette(str(tmp_path))
+    cassette.save("mediator", "prompt", [{"text": "a", "delay_s": 0.1}, {"text": "b", "delay_s": 0.1}], TokenUsage(1, 1, 0, 1))
+    recording = cassette.load("mediator", "prompt")
+
+    start = time.perf_counter()
+    text = Cassette.replay(recording, speed=4.0)
+    elapsed = time.perf_counter() - start
+
+    assert text == "ab"
+    assert 0.04 <= elapsed < 0.2
+    assert cassette.load("mediator", "other prompt") is None
+
+
+def test_replay_stops_when_cancelled(tmp_path):
+    """Test a cancelled token aborts replay before the next chunk, without waiting out its delay."""
+    cassette = Cassette(str(tmp_path))
+    cassette.save("mediator", "prompt", [{"text": "a", "delay_s": 0.01}, {"text": "b", "delay_s": 5.0}],
+                  TokenUsage(1, 1, 0, 1))
+    recording = cassette.load("mediator", "prompt")
+    token = CancellationToken()
+    threading.Timer(0.1, token.cancel, args=("test",)).start()
+
+    start = time.perf_counter()
+    with pytest.raises(OperationCancelled):
+        Cassette.replay(recording, speed=1.0, cancel_token=token)
+    assert time.perf_counter() - start < 1.0
+
+    with pytest.raises(OperationCancelled):
+        Cassette.replay(recording, speed=0, cancel_token=token)
@@ -0,0 +1,55 @@
+"""Unit tests for debate checkpoints."""
+
+import json
+import time
+from src.orchestrator.checkpoint import CheckpointStore, DebateCheckpoint
+from src.orchestrator.utterances import Utterance
+
+
+def test_record_turn_advances_step_and_round():
+    """Test turns advance the step and roll over to the next round."""
+    checkpoint = DebateCheckpoint(channel="C1", thread_ts="T1", user_id="U1", topic="주제")
+
+    checkpoint.record_turn(Utterance(1, "jamal", "a"), next_speaker="james", steps_per_round=2)
+    assert (checkpoint.round, checkpoint.step) == (1, 1)
+    checkpoint.record_turn(Utterance(1, "james", "b"), next_speaker="jamal", steps_per_round=2)
+
+    assert (checkpoint.round, checkpoint.step, checkpoint.next_speaker) == (2, 0, "jamal")
+    assert checkpoint.to_dict()["utterances"] == [
+        {"round": 1, "speaker": "jamal", "text": "a"},
+        {"round": 1, "speaker": "james", "text": "b"}
+    ]
+
+
+def test_store_round_trip_and_delete(tmp_path):
+    """Test save/load/delete of a checkpoint."""
+    store = CheckpointStore(str(tmp_path / "checkpoints"))
+    checkpoint = DebateCheckpoint(channel="C1", thread_ts="1700000000.000100", user_id="U1", topic="주제")
+    checkpoint.record_turn(Utterance(1, "jamal", "찬성"), next_speaker="james", steps_per_round=4)
+
+    store.save(checkpoint)
+    loaded = store.load("1700000000.000100")
+
+    assert loaded == checkpoint
+    assert loaded.updated_at > 0
+    store.delete("1700000000.000100")
+    assert store.load("1700000000.000100") is None
+    store.delete("1700000000.000100")
+
+
+def test_list_incomplete_skips_unreadable_and_discards_stale(tmp_path):
+    """Test listing ignores broken files and deletes old checkpoints."""
+    store = CheckpointStore(str(tmp_path))
+    store.save(DebateCheckpoint(channel="C1", thread_ts="FRESH", user_id="U1", topic="a"))
+    stale = DebateCheckpoint(channel="C1", thread_ts="STALE", user_id="U1", topic="b")
+    store.save(stale)
+    data = stale.to_dict()
+    data["updated_at"] = time.time() - 7200
+    (tmp_path / "STALE.json").write_text(json.dumps(data), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    checkpoints = store.list_incomplete(max_age_s=3600)
+
+    assert [c.thread_ts for c in checkpoints] == ["FRESH"]
+    assert store.load("STALE") is None
+    assert CheckpointStore(str(tmp_path / "missing")).list_incomplete() == []
@@ -0,0 +1,100 @@
+"""Unit tests for adaptive round control and its replay over recorded debates."""
+
+from unittest.mock import Mock
+
+from benchmarks.eval_convergence import evaluate
+from src.orchestrator import DebateOrchestrator, RoundController, Utterance
+from src.orchestrator.convergence import drift, round_signals
+from src.orchestrator.debate_flow import CLOSING_INSTRUCTION
+
+NEW_POINTS = ["재택 근무는 출퇴근 시간을 줄여 생산성을 높입니다", "협업 도구 비용이 늘어나고 보안 위험이 커집니다",
+              "육아 부담이 있는 직원의 이직률이 낮아집니다", "신입 사원 교육과 멘토링이 어려워집니다"]
+
+
+def _orchestrator(replies, controller):
+    agents = {name: Mock(agent_name=name) for name in ("AgentJamal", "AgentRyan", "AgentJames")}
+    agents["AgentJamal"].generate_response.side_effect = replies("jamal")
+    agents["AgentRyan"].generate_response.side_effect = replies("ryan")
+    agents["AgentJames"].generate_response.return_value = "계속 논의해주세요"
+    orchestrator = DebateOrchestrator(
+        jamal_client=Mock(), ryan_client=Mock(), james_client=Mock(),
+        jamal_agent=agents["AgentJamal"], ryan_agent=agents["AgentRyan"], james_agent=agents["AgentJames"],
+        max_rounds=6,
+        round_controller=controller
+    )
+    return orchestrator, agents
+
+
+def test_round_signals_measure_new_text_and_summary_drift():
+    """Test repeated rounds score low novelty and a stable summary low drift."""
+    utterances = [
+        Utterance(1, "jamal", NEW_POINTS[0], "proposal"),
+        Utterance(1, "james", "생산성 논쟁 요약", "summary"),
+        Utterance(2, "jamal", NEW_POINTS[0], "proposal"),
+        Utterance(2, "james", "생산성 논쟁 요약", "summary"),
+        Utterance(3, "jamal", NEW_POINTS[1], "proposal"),
+        Utterance(3, "james", "비용과 보안 논쟁 요약", "summary"),
+    ]
+
+    signals = round_signals(utterances, {"summary"})
+
+    assert [s.novelty for s in signals[:2]] == [1.0, 0.0]
+    assert signals[2].novelty > 0.8
+    assert (signals[0].drift, signals[1].drift) == (None, 0.0) and signals[2].drift > 0.5
+    assert round_signals(utterances)[1].drift is None
+    assert drift("같은 문장입니다", "같은 문장입니다") == 0.0
+
+
+def test_repetitive_debate_is_concluded_early():
+    """Test James is asked to conclude once rounds stop adding points."""
+    def replies(speaker):
+        return lambda text, **kwargs: f"{speaker}: 같은 주장을 반복합니다"
+
+    orchestrator, agents = _orchestrator(replies, RoundController(min_rounds=2))
+
+    assert orchestrator._run_debate("C1", "T1", "원격 근무", "U1") == "converged"
+
+    assert agents["AgentJamal"].generate_response.call_count == 2
+    last_prompt = agents["AgentJames"].generate_response.call_args_list[-1].kwargs["text"]
+    assert last_prompt.endswith(CLOSING_INSTRUCTION)
+
+
+def test_new_points_keep_the_debate_going_and_time_budget_stops_it():
+    """Test novel rounds run on, and a round projected past the time budget is not started."""
+    def replies(speaker):
+        points = iter(NEW_POINTS * 2)
+        return lambda text, **kwargs: f"{next(points)} ({speaker})"
+
+    orchestrator, agents = _orchestrator(replies, RoundController(min_rounds=2))
+    # Four distinct rounds, then round 5 repeats round 1
+    assert orchestrator._run_debate("C1", "T2", "원격 근무", "U1") == "converged"
+    assert agents["AgentJamal"].generate_response.call_count == 5
+
+    orchestrator, agents = _orchestrator(replies, RoundController(max_seconds=1e-6))
+    assert orchestrator._run_debate("C1", "T3", "원격 근무", "U1") == "budget"
+    assert agents["AgentJamal"].generate_response.call_count == 1
+    assert RoundController(max_cost=1.0).over_budget(rounds_done=0, elapsed_s=0, cost=5.0) is None
+    assert RoundController(max_cost=1.0).over_budget(rounds_done=3, elapsed_s=0, cost=0.8) == "cost"
+    assert RoundController(max_cost=1.0).over_budget(rounds_done=4, elapsed_s=0, cost=0.8) is None
+
+
+def test_replay_counts_calls_saved_and_changed_conclusions():
+    """Test the evaluation finds the stop round and flags conclusions built on later points."""
+    def debate(thread_ts, round_texts, conclusion):
+        rows = []
+        for round_num, text in enumerate(round_texts, 1):
+            rows += [{"round": round_num, "node": "proposal", "speaker": "jamal", "text": text},
+                     {"round": round_num, "node": "check", "speaker": "james", "text": "계속"}]
+        rows[-1]["text"] = conclusion
+        return {"thread_ts": thread_ts, "flow": "classic", "conclusion": conclusion, "utterances": rows}
+
+    same = debate("T1", [NEW_POINTS[0]] * 4, f"토론을 종료합니다. {NEW_POINTS[0]}")
+    late = debate("T2", [NEW_POINTS[0], NEW_POINTS[0], NEW_POINTS[2], NEW_POINTS[2]],
+                  f"토론을 종료합니다. {NEW_POINTS[2]}")
+
+    report = evaluate([same, late], RoundController(min_rounds=2))
+
+    assert (report["debates"], report["stopped"], report["calls"]) == (2, 2, 16)
+    assert [r["stop_round"] for r in report["results"]] == [2, 2]
+    assert report["calls_saved"] == 6
+    assert [r["changed"] for r in report["results"]] == [False, True]
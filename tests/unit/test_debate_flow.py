@@ -0,0 +1,33 @@
+"""Unit tests for debate turn graphs."""
+
+import pytest
+
+from src.orchestrator import DebateFlow, TurnNode, get_flow
+from src.orchestrator.debate_flow import CLASSIC_FLOW, PANEL_FLOW
+
+
+def test_parallel_group_stops_at_dependency():
+    """Test consecutive independent nodes form one group."""
+    assert PANEL_FLOW.parallel_group(0) == [0]
+    assert PANEL_FLOW.parallel_group(1) == [1, 2]
+    assert PANEL_FLOW.parallel_group(3) == [3]
+    assert [CLASSIC_FLOW.parallel_group(i) for i in range(4)] == [[0], [1], [2], [3]]
+
+
+@pytest.mark.parametrize("nodes, message", [
+    ((TurnNode("a", "jamal"), TurnNode("a", "ryan")), "duplicate node id"),
+    ((TurnNode("a", "bob"),), "unknown speaker"),
+    ((TurnNode("a", "jamal", after=("b",)), TurnNode("b", "ryan")), "must be declared before"),
+    ((), "at least one node"),
+])
+def test_invalid_flows_are_rejected(nodes, message):
+    """Test flow validation errors."""
+    with pytest.raises(ValueError, match=message):
+        DebateFlow("bad", nodes)
+
+
+def test_get_flow():
+    """Test built-in flow lookup by name."""
+    assert get_flow("panel") is PANEL_FLOW
+    with pytest.raises(ValueError, match="Unknown debate flow"):
+        get_flow("nope")
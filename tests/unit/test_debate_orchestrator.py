@@ -0,0 +1,319 @@
+"""Unit tests for DebateOrchestrator."""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from src.llm.usage import TokenUsage, UsageTracker
+from src.orchestrator import CheckpointStore, DebateCheckpoint, DebateFlow, DebateOrchestrator, TurnNode
+from src.orchestrator.debate_flow import PANEL_FLOW
+from src.utils.cancellation import OperationCancelled
+
+
+def _mock_agent(name, responses=None):
+    agent = Mock()
+    agent.agent_name = name
+    if responses is None:
+        agent.generate_response.return_value = f"{name} says hi"
+    else:
+        agent.generate_response.side_effect = responses
+    return agent
+
+
+@pytest.fixture
+def clients():
+    """Create mock Slack clients for the three agents."""
+    return {name: Mock() for name in ("jamal", "ryan", "james")}
+
+
+@pytest.fixture
+def agents():
+    """Create mock agents; James ends the debate on its first check."""
+    return {
+        "jamal": _mock_agent("AgentJamal"),
+        "ryan": _mock_agent("AgentRyan"),
+        "james": _mock_agent("AgentJames", ["요약", "토론을 종료합니다. 결론"])
+    }
+
+
+def _make_orchestrator(clients, agents, **kwargs):
+    return DebateOrchestrator(
+        jamal_client=clients["jamal"],
+        ryan_client=clients["ryan"],
+        james_client=clients["james"],
+        jamal_agent=agents["jamal"],
+        ryan_agent=agents["ryan"],
+        james_agent=agents["james"],
+        **kwargs
+    )
+
+
+def test_run_debate_terminates_on_james_conclusion(clients, agents):
+    """Test one full round that James terminates."""
+    orchestrator = _make_orchestrator(clients, agents)
+
+    orchestrator._run_debate("C1", "T1", "주제", "U1")
+
+    assert agents["jamal"].generate_response.call_count == 1
+    assert agents["ryan"].generate_response.call_count == 1
+    assert agents["james"].generate_response.call_count == 2
+    assert clients["jamal"].chat_postMessage.call_count == 1
+    assert clients["ryan"].chat_postMessage.call_count == 1
+    assert clients["james"].chat_postMessage.call_count == 2
+    assert not DebateOrchestrator.is_debate_active("T1")
+
+
+def test_agent_speak_passes_channel(clients, agents):
+    """Test channel is forwarded for usage accounting."""
+    orchestrator = _make_orchestrator(clients, agents)
+
+    orchestrator._run_debate("C9", "T2", "주제", "U1")
+
+    _, kwargs = agents["jamal"].generate_response.call_args
+    assert kwargs["channel"] == "C9"
+    assert kwargs["thread_ts"] == "T2"
+
+
+def test_run_debate_stops_when_token_budget_exceeded(clients, agents):
+    """Test a debate over its token budget stops before the next round."""
+    tracker = UsageTracker()
+    tracker.record("AgentJamal", TokenUsage(5000, 100, 0, 1), thread_ts="T3")
+    orchestrator = _make_orchestrator(clients, agents, usage_tracker=tracker, token_budget=1000)
+
+    orchestrator._run_debate("C1", "T3", "주제", "U1")
+
+    agents["jamal"].generate_response.assert_not_called()
+    text = clients["james"].chat_postMessage.call_args.kwargs["text"]
+    assert "토큰 예산" in text
+
+
+def test_token_budget_is_checked_after_each_turn(clients, agents):
+    """Test a turn that crosses the budget stops the debate mid-round."""
+    tracker = UsageTracker()
+
+    def _jamal(text, **kwargs):
+        tracker.record("AgentJamal", TokenUsage(5000, 100, 0, 1), thread_ts="T3b")
+        return "찬성"
+
+    agents["jamal"].generate_response.side_effect = _jamal
+    orchestrator = _make_orchestrator(clients, agents, usage_tracker=tracker, token_budget=1000)
+
+    assert orchestrator._run_debate("C1", "T3b", "주제", "U1") == "budget"
+
+    assert agents["jamal"].generate_response.call_count == 1
+    agents["ryan"].generate_response.assert_not_called()
+    assert "토큰 예산" in clients["james"].chat_postMessage.call_args.kwargs["text"]
+
+
+def test_run_debate_checkpoints_each_turn_and_clears_on_finish(clients, agents, tmp_path):
+    """Test state is on disk mid-debate and removed once the debate ends."""
+    store = CheckpointStore(str(tmp_path))
+    seen = []
+
+    def _ryan_speaks(**kwargs):
+        seen.append(store.load("T4"))
+        return "반대합니다"
+
+    agents["ryan"].generate_response.side_effect = _ryan_speaks
+    orchestrator = _make_orchestrator(clients, agents, checkpoint_store=store)
+
+    orchestrator._run_debate("C1", "T4", "주제", "U1")
+
+    checkpoint = seen[0]
+    assert (checkpoint.round, checkpoint.step, checkpoint.next_speaker) == (1, 2, "ryan")
+    assert [u.speaker for u in checkpoint.utterances] == ["jamal", "james"]
+    assert store.load("T4") is None
+
+
+def test_run_debate_resumes_from_checkpoint(clients, tmp_path):
+    """Test a mid-round checkpoint skips turns that already ran."""
+    agents = {
+        "jamal": _mock_agent("AgentJamal"),
+        "ryan": _mock_agent("AgentRyan", ["반대 의견"]),
+        "james": _mock_agent("AgentJames", ["토론을 종료합니다. 결론"])
+    }
+    checkpoint = DebateCheckpoint(
+        channel="C1", thread_ts="T5", user_id="U1", topic="주제",
+        round=1, step=2, next_speaker="ryan",
+        utterances=[
+            {"round": 1, "speaker": "jamal", "text": "찬성 의견"},
+            {"round": 1, "speaker": "james", "text": "요약"}
+        ]
+    )
+    orchestrator = _make_orchestrator(clients, agents, checkpoint_store=CheckpointStore(str(tmp_path)))
+
+    orchestrator._run_debate("C1", "T5", "주제", "U1", checkpoint=checkpoint)
+
+    agents["jamal"].generate_response.assert_not_called()
+    ryan_prompt = agents["ryan"].generate_response.call_args.kwargs["text"]
+    assert ryan_prompt == "주제: 주제\n\nAgentJamal: 찬성 의견\n\nAgentJames: 요약"
+    assert agents["james"].generate_response.call_count == 1
+    assert clients["ryan"].chat_postMessage.call_count == 1
+
+
+def test_resume_incomplete_restarts_saved_debates(clients, agents, tmp_path):
+    """Test startup resume launches each checkpointed debate."""
+    store = CheckpointStore(str(tmp_path))
+    store.save(DebateCheckpoint(channel="C1", thread_ts="T6", user_id="U1", topic="주제"))
+    orchestrator = _make_orchestrator(clients, agents, checkpoint_store=store)
+
+    assert orchestrator.resume_incomplete() == 1
+
+    deadline = time.monotonic() + 5
+    while DebateOrchestrator.is_debate_active("T6") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    first_post = clients["james"].chat_postMessage.call_args_list[0].kwargs["text"]
+    assert "이어갑니다" in first_post
+    assert agents["jamal"].generate_response.call_count == 1
+    assert store.load("T6") is None
+
+
+def _wait_inactive(thread_ts_list, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while any(DebateOrchestrator.is_debate_active(ts) for ts in thread_ts_list):
+        if time.monotonic() > deadline:
+            raise AssertionError("debates did not finish in time")
+        time.sleep(0.01)
+
+
+def test_shutdown_drain_loses_no_debates(clients, tmp_path):
+    """Test drained debates and mentions received mid-drain all resume after restart."""
+    def _jamal(text, **kwargs):
+        time.sleep(0.2)
+        return "찬성"
+
+    def _james(text, **kwargs):
+        return "토론을 종료합니다. 결론" if "합의가 이루어졌거나" in text else "요약"
+
+    agents = {
+        "jamal": _mock_agent("AgentJamal", _jamal),
+        "ryan": _mock_agent("AgentRyan"),
+        "james": _mock_agent("AgentJames", _james)
+    }
+    store = CheckpointStore(str(tmp_path))
+    orchestrator = _make_orchestrator(clients, agents, checkpoint_store=store)
+    in_flight = ["S1", "S2", "S3"]
+    for ts in in_flight:
+        orchestrator.start_debate("C1", ts, "주제", "U1")
+    time.sleep(0.05)  # every debate is inside Jamal's first turn
+
+    result = orchestrator.shutdown(timeout=5)
+    orchestrator.start_debate("C1", "S4", "주제", "U1")  # arrives mid-drain
+
+    assert result == {"drained": 3, "unfinished": 0}
+    for ts in in_flight:
+        checkpoint = store.load(ts)
+        assert (checkpoint.round, checkpoint.step) == (1, 1)
+        assert checkpoint.utterances[0].text == "찬성"
+    assert len(store.load("S4").utterances) == 0
+    assert agents["ryan"].generate_response.call_count == 0
+
+    # Next process resumes everything from the last finished turn
+    restarted = _make_orchestrator(clients, agents, checkpoint_store=store)
+    assert restarted.resume_incomplete() == 4
+    _wait_inactive(in_flight + ["S4"])
+
+    assert store.list_incomplete() == []
+    # One Jamal turn per debate in total: no turn was lost or repeated
+    assert agents["jamal"].generate_response.call_count == 4
+    assert agents["ryan"].generate_response.call_count == 4
+    conclusions = [
+        call.kwargs["thread_ts"] for call in clients["james"].chat_postMessage.call_args_list
+        if call.kwargs["text"].startswith("토론을 종료합니다")
+    ]
+    assert sorted(conclusions) == ["S1", "S2", "S3", "S4"]
+
+
+def test_cancel_debate_via_posted_message_aborts_current_turn(clients):
+    """Test a cancel on a debate message aborts the in-flight turn and skips the rest."""
+    james_started = threading.Event()
+
+    def _james(text, cancel_token=None, **kwargs):
+        aborted = threading.Event()
+        cancel_token.add_callback(aborted.set)
+        james_started.set()
+        if aborted.wait(5):
+            raise OperationCancelled(cancel_token.reason)
+        return "요약"
+
+    agents = {
+        "jamal": _mock_agent("AgentJamal"),
+        "ryan": _mock_agent("AgentRyan"),
+        "james": _mock_agent("AgentJames", _james)
+    }
+    clients["jamal"].chat_postMessage.return_value = {"ts": "M1", "message": {}}
+    orchestrator = _make_orchestrator(clients, agents)
+    orchestrator.start_debate("C1", "T7", "주제", "U1")
+    assert james_started.wait(5)
+
+    # The user reacts to Jamal's message, not the thread root
+    assert orchestrator.cancel_debate("M1", reason="reaction by U1") is True
+    _wait_inactive(["T7"])
+
+    agents["ryan"].generate_response.assert_not_called()
+    text = clients["james"].chat_postMessage.call_args.kwargs["text"]
+    assert text.startswith("🛑")
+    assert orchestrator.cancel_debate("T7") is False
+
+
+def test_panel_flow_runs_answers_in_parallel_and_posts_in_order(clients, tmp_path):
+    """Test independent turns run concurrently but are posted in flow order."""
+    both_answering = threading.Barrier(2, timeout=2)
+    posted = []
+
+    def _answer(reply, delay):
+        def _speak(text, **kwargs):
+            both_answering.wait()  # only passes if both answers are in flight
+            time.sleep(delay)
+            return reply
+        return _speak
+
+    agents = {
+        "jamal": _mock_agent("AgentJamal", _answer("찬성 답변", 0.1)),
+        "ryan": _mock_agent("AgentRyan", _answer("반대 답변", 0)),
+        "james": _mock_agent("AgentJames", ["질문", "토론을 종료합니다. 결론"])
+    }
+    for name, client in clients.items():
+        client.chat_postMessage.side_effect = lambda name=name, **kwargs: posted.append(name) or {}
+    store = CheckpointStore(str(tmp_path))
+    orchestrator = _make_orchestrator(clients, agents, flow=PANEL_FLOW, checkpoint_store=store)
+
+    orchestrator._run_debate("C1", "T8", "주제", "U1")
+
+    assert posted == ["james", "jamal", "ryan", "james"]
+    jamal_prompt = agents["jamal"].generate_response.call_args.kwargs["text"]
+    ryan_prompt = agents["ryan"].generate_response.call_args.kwargs["text"]
+    assert jamal_prompt.startswith("주제: 주제\n\nAgentJames: 질문")
+    assert "찬성 답변" not in ryan_prompt
+    check_prompt = agents["james"].generate_response.call_args.kwargs["text"]
+    assert "AgentJamal: 찬성 답변\n\nAgentRyan: 반대 답변" in check_prompt
+
+
+def test_flow_skips_turn_when_condition_is_false(clients, tmp_path):
+    """Test a turn whose condition fails is skipped and still checkpointed."""
+    flow = DebateFlow("short", (
+        TurnNode("proposal", "jamal"),
+        TurnNode("rebuttal", "ryan", after=("proposal",), when=lambda state: state.round > 1),
+        TurnNode("check", "james", after=("rebuttal",), checks_termination=True),
+    ))
+    store = CheckpointStore(str(tmp_path))
+    seen = []
+
+    def _james(**kwargs):
+        seen.append(store.load("T9"))
+        return "토론을 종료합니다. 결론" if len(seen) == 2 else "계속합시다"
+
+    agents = {
+        "jamal": _mock_agent("AgentJamal"),
+        "ryan": _mock_agent("AgentRyan"),
+        "james": _mock_agent("AgentJames", _james)
+    }
+    orchestrator = _make_orchestrator(clients, agents, flow=flow, checkpoint_store=store)
+
+    orchestrator._run_debate("C1", "T9", "주제", "U1")
+
+    assert agents["jamal"].generate_response.call_count == 2
+    assert agents["ryan"].generate_response.call_count == 1
+    first_check = seen[0]
+    assert (first_check.flow, first_check.round, first_check.step) == ("short", 1, 2)
+    assert [u.node for u in first_check.utterances] == ["proposal"]
@@ -0,0 +1,151 @@
+"""Unit tests for per-thread mention debouncing."""
+
+import threading
+import time
+from unittest.mock import Mock, call
+
+from slack_sdk import WebClient
+
+from src.bot.debounce import MentionDebouncer
+from src.bot.slack_handler import SlackBot, combine_mention_texts
+from src.main_debate import shutdown
+from src.orchestrator import CheckpointStore, DebateOrchestrator
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def _mention(ts, text, user="U1", thread_ts=None):
+    event = {"type": "app_mention", "user": user, "text": text, "ts": ts, "channel": "C1", "event_ts": ts}
+    if thread_ts:
+        event["thread_ts"] = thread_ts
+    return event
+
+
+def _mention_handler(bot):
+    return next(listener.ack_function for listener in bot.app._listeners
+                if listener.ack_function.__name__ == "handle_mention")
+
+
+def test_burst_is_handled_once_after_the_last_mention():
+    """Test mentions within the window are handed over together, per key."""
+    batches = []
+    done = threading.Event()
+    debouncer = MentionDebouncer(50, lambda items: batches.append(items) or done.set())
+
+    assert debouncer.submit("T1", "a") is True
+    time.sleep(0.02)
+    assert debouncer.submit("T1", "b") is False
+    assert debouncer.submit("T1", "c") is False
+    assert debouncer.submit("T2", "x") is True
+    assert debouncer.discard("T2") is True
+
+    assert done.wait(1.0)
+    time.sleep(0.1)
+    assert batches == [["a", "b", "c"]]
+    assert debouncer.keys() == []
+
+
+def test_max_wait_caps_a_long_burst_and_flush_runs_pending_batches():
+    """Test a steady stream still gets handled, and flush handles what's left immediately."""
+    batches = []
+    debouncer = MentionDebouncer(60, batches.append, max_wait_ms=100)
+    for i in range(8):
+        debouncer.submit("T1", i)
+        time.sleep(0.03)
+    assert _wait_for(lambda: sum(len(b) for b in batches) == 8)
+    assert len(batches) >= 2 and batches[0][0] == 0
+
+    debouncer.submit("T2", "late")
+    assert debouncer.flush() == 1
+    assert batches[-1] == ["late"]
+
+
+def test_combined_text_drops_mentions_of_follow_ups():
+    """Test follow-ups are appended without their user mentions."""
+    events = [{"text": "<@UBOT> 원격 근무"}, {"text": "<@UBOT> 찬반으로 토론해줘"}, {"text": "<@UBOT>"}]
+    assert combine_mention_texts(events) == "<@UBOT> 원격 근무\n찬반으로 토론해줘"
+
+
+def test_rapid_mentions_start_one_debate_with_the_combined_topic():
+    """Test two quick mentions in a thread start a single debate; reactions go on the first only."""
+    app_client = WebClient(token="xoxb-test")
+    app_client.auth_test = Mock()
+    orchestrator = Mock()
+    orchestrator.is_debate_active.return_value = False
+    bot = SlackBot(message_processor=Mock(), debate_orchestrator=orchestrator, client=app_client, debounce_ms=100)
+    handle_mention, say, client = _mention_handler(bot), Mock(), Mock()
+
+    handle_mention(event=_mention("100.1", "<@UBOT> 주 4일제"), say=say, client=client)
+    handle_mention(event=_mention("100.2", "<@UBOT> 도입해야 할까?", thread_ts="100.1"), say=say, client=client)
+    handle_mention(event=_mention("100.3", "<@UBOT> 다른 질문", user="U2", thread_ts="100.1"), say=say, client=client)
+    assert not orchestrator.start_debate.called
+
+    assert _wait_for(lambda: orchestrator.start_debate.call_count == 2)
+    orchestrator.start_debate.assert_any_call(
+        channel="C1", thread_ts="100.1", initial_message="<@UBOT> 주 4일제\n도입해야 할까?", user_id="U1"
+    )
+    assert bot.reactions.flush(timeout=2.0)
+    assert sorted(c.kwargs["timestamp"] for c in client.reactions_add.call_args_list) == ["100.1", "100.3"]
+
+
+def test_cancel_word_drops_pending_mentions():
+    """Test a cancel reply before the window closes means no debate starts."""
+    app_client = WebClient(token="xoxb-test")
+    app_client.auth_test = Mock()
+    orchestrator = Mock()
+    orchestrator.is_debate_active.return_value = False
+    bot = SlackBot(message_processor=Mock(), debate_orchestrator=orchestrator, client=app_client, debounce_ms=50)
+    handle_mention = _mention_handler(bot)
+
+    handle_mention(event=_mention("200.1", "<@UBOT> 기본소득"), say=Mock(), client=Mock())
+    handle_mention(event=_mention("200.2", "<@UBOT> 그만", thread_ts="200.1"), say=Mock(), client=Mock())
+
+    time.sleep(0.2)
+    assert not orchestrator.start_debate.called
+
+
+def test_shutdown_checkpoints_pending_mentions_instead_of_running_them(tmp_path):
+    """Test a mention still in its window at shutdown becomes a deferred debate."""
+    app_client = WebClient(token="xoxb-test")
+    app_client.auth_test = Mock()
+    agents = {name: Mock(agent_name=name) for name in ("AgentJamal", "AgentRyan", "AgentJames")}
+    store = CheckpointStore(str(tmp_path))
+    orchestrator = DebateOrchestrator(
+        jamal_client=Mock(), ryan_client=Mock(), james_client=Mock(),
+        jamal_agent=agents["AgentJamal"], ryan_agent=agents["AgentRyan"], james_agent=agents["AgentJames"],
+        checkpoint_store=store
+    )
+    bot = SlackBot(message_processor=Mock(), debate_orchestrator=orchestrator, client=app_client, debounce_ms=10000)
+
+    _mention_handler(bot)(event=_mention("300.1", "<@UBOT> 기본소득"), say=Mock(), client=Mock())
+    shutdown(bot, orchestrator)
+
+    checkpoint = store.load("300.1")
+    assert checkpoint is not None and checkpoint.topic == "<@UBOT> 기본소득"
+    assert not DebateOrchestrator.is_debate_active("300.1")
+    for agent in agents.values():
+        assert not agent.generate_response.called
+
+
+def test_stop_only_unblocks_start_and_close_does_the_slack_work():
+    """Test the signal-handler path makes no Slack calls; close() flushes mentions and reactions."""
+    app_client = WebClient(token="xoxb-test")
+    app_client.auth_test = Mock()
+    orchestrator, reactions = Mock(), Mock()
+    orchestrator.is_debate_active.return_value = False
+    bot = SlackBot(message_processor=Mock(), debate_orchestrator=orchestrator, client=app_client,
+                   debounce_ms=10000, reactions=reactions)
+    _mention_handler(bot)(event=_mention("400.1", "<@UBOT> 기본소득"), say=Mock(), client=Mock())
+
+    bot.stop()
+    assert not orchestrator.start_debate.called and not reactions.close.called
+
+    bot.close()
+    assert orchestrator.mock_calls.index(call.begin_drain()) < orchestrator.mock_calls.index(
+        call.start_debate(channel="C1", thread_ts="400.1", initial_message="<@UBOT> 기본소득", user_id="U1"))
+    reactions.close.assert_called_once()
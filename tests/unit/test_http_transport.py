@@ -0,0 +1,116 @@
+"""Unit tests for the shared HTTP transport and background event loop."""
+
+import asyncio
+import inspect
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+
+from benchmarks.fakes import FakeSlackServer, LatencyModel
+from src.utils.event_loop import BackgroundLoop
+from src.utils.http_transport import HTTP_REQUESTS, HttpTransport, HttpTransportConfig, PooledWebClient
+from src.utils.tracing import InMemoryExporter, configure_tracing, get_tracer
+
+
+@pytest.fixture
+def slack():
+    server = FakeSlackServer().start()
+    yield server
+    server.stop()
+
+
+def _connections():
+    return {c: HTTP_REQUESTS.get(pool="slack", connection=c) for c in ("new", "reused")}
+
+
+def test_slack_clients_share_one_keepalive_connection(slack):
+    """Test sequential calls from two clients reuse one pooled connection."""
+    transport = HttpTransport(HttpTransportConfig(http2=False))
+    jamal = transport.slack_client(token="xoxb-jamal", base_url=slack.base_url)
+    ryan = transport.slack_client(token="xoxb-ryan", base_url=slack.base_url)
+    before = _connections()
+
+    try:
+        response = jamal.chat_postMessage(channel="C1", text="안녕하세요")
+        ryan.chat_postMessage(channel="C1", text="반갑습니다")
+        jamal.auth_test()
+    finally:
+        transport.close()
+
+    after = _connections()
+    assert response["ok"] is True
+    assert response["message"]["text"] == "안녕하세요"
+    assert slack.calls == {"chat.postMessage": 2, "auth.test": 1}
+    assert after["new"] - before["new"] == 1
+    assert after["reused"] - before["reused"] == 2
+
+
+def test_slack_api_errors_still_raise():
+    """Test ok=false responses surface as SlackApiError through the pool."""
+    server = FakeSlackServer(LatencyModel(error_rate=1.0)).start()
+    transport = HttpTransport(HttpTransportConfig(http2=False))
+    client = transport.slack_client(token="xoxb-test", base_url=server.base_url)
+
+    try:
+        with pytest.raises(SlackApiError) as exc_info:
+            client.chat_postMessage(channel="C1", text="hi")
+    finally:
+        transport.close()
+        server.stop()
+
+    assert exc_info.value.response["error"] == "internal_error"
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    """Test HTTP/2 is only enabled when the h2 package is importable."""
+    monkeypatch.setattr("src.utils.http_transport.http2_available", lambda: False)
+    assert HttpTransport(HttpTransportConfig(http2=True)).http2 is False
+
+    monkeypatch.setattr("src.utils.http_transport.http2_available", lambda: True)
+    assert HttpTransport(HttpTransportConfig(http2=True)).http2 is True
+    assert HttpTransport(HttpTransportConfig(http2=False)).http2 is False
+
+
+def test_background_loop_reuses_loop_and_propagates_spans():
+    """Test coroutines share one loop and nest under the caller's span."""
+    exporter = InMemoryExporter()
+    configure_tracing(exporter)
+    loop = BackgroundLoop(name="test-loop")
+
+    async def _work():
+        with get_tracer().start_span("child"):
+            return asyncio.get_running_loop()
+
+    try:
+        with get_tracer().start_span("parent"):
+            first = loop.run(_work())
+            second = loop.run(_work(), timeout=5)
+    finally:
+        loop.stop()
+        configure_tracing(InMemoryExporter())
+
+    assert first is second
+    parent = exporter.get_spans("parent")[0]
+    children = exporter.get_spans("child")
+    assert len(children) == 2
+    assert all(child.parent_id == parent.span_id for child in children)
+    assert not loop.is_running
+
+
+def test_pooled_client_hook_is_still_part_of_slack_sdk():
+    """Test the private WebClient method PooledWebClient overrides exists and carries every API call."""
+    hook = "_perform_urllib_http_request_internal"
+    assert list(inspect.signature(getattr(WebClient, hook)).parameters) == ["self", "url", "req"]
+    assert hook in vars(PooledWebClient)
+
+    http_client = Mock()
+    http_client.post.return_value = httpx.Response(
+        200, json={"ok": True}, request=httpx.Request("POST", "https://slack.com/api/auth.test")
+    )
+    response = PooledWebClient(token="xoxb-test", http_client=http_client).auth_test()
+
+    assert response["ok"] is True
+    assert http_client.post.call_args.args[0] == "https://slack.com/api/auth.test"
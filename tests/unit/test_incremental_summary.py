@@ -0,0 +1,69 @@
+"""Unit tests for James's incremental (running) summaries."""
+
+from unittest.mock import Mock
+
+from src.orchestrator import CheckpointStore, DebateOrchestrator
+from src.orchestrator.debate_flow import PREVIOUS_SUMMARY_HEADER, SUMMARY_INSTRUCTION, SUMMARY_UPDATE_INSTRUCTION
+
+
+def _run(tmp_path, incremental_summary):
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints"))
+    agents = {name: Mock(agent_name=name) for name in ("AgentJamal", "AgentRyan", "AgentJames")}
+    counts = {"jamal": 0, "ryan": 0}
+
+    def _reply(speaker):
+        def reply(text, **kwargs):
+            counts[speaker] += 1
+            return f"{speaker} {counts[speaker]}번째 발언"
+        return reply
+
+    def _james(text, **kwargs):
+        if text.endswith(SUMMARY_INSTRUCTION) or text.endswith(SUMMARY_UPDATE_INSTRUCTION):
+            return f"요약 {counts['jamal']}"
+        return "토론을 종료합니다. 결론" if counts["ryan"] == 3 else "계속"
+
+    agents["AgentJamal"].generate_response.side_effect = _reply("jamal")
+    agents["AgentRyan"].generate_response.side_effect = _reply("ryan")
+    agents["AgentJames"].generate_response.side_effect = _james
+    orchestrator = DebateOrchestrator(
+        jamal_client=Mock(), ryan_client=Mock(), james_client=Mock(),
+        jamal_agent=agents["AgentJamal"], ryan_agent=agents["AgentRyan"], james_agent=agents["AgentJames"],
+        checkpoint_store=checkpoints,
+        incremental_summary=incremental_summary
+    )
+    saved = []
+    orchestrator._save_checkpoint = lambda state: saved.append(state.to_dict())
+
+    orchestrator._run_debate("C1", "T1", "주 4일제", "U1")
+
+    summaries = [
+        c.kwargs["text"] for c in agents["AgentJames"].generate_response.call_args_list
+        if c.kwargs["text"].endswith((SUMMARY_INSTRUCTION, SUMMARY_UPDATE_INSTRUCTION))
+    ]
+    return summaries, saved
+
+
+def test_summary_updates_previous_summary_with_new_turns_only(tmp_path):
+    """Test later summaries see the previous summary and only the turns after it."""
+    summaries, saved = _run(tmp_path, incremental_summary=True)
+
+    assert len(summaries) == 3
+    assert summaries[0].endswith(SUMMARY_INSTRUCTION) and PREVIOUS_SUMMARY_HEADER not in summaries[0]
+    third = summaries[2]
+    assert f"{PREVIOUS_SUMMARY_HEADER}\n요약 2" in third
+    assert third.endswith(SUMMARY_UPDATE_INSTRUCTION)
+    assert "AgentRyan: ryan 2번째 발언" in third and "AgentJamal: jamal 3번째 발언" in third
+    assert "jamal 1번째 발언" not in third and "jamal 2번째 발언" not in third
+
+    # Round 3's summary is the 10th utterance and is kept in the checkpoint
+    last_summary = next(data for data in reversed(saved) if data["summary"] == "요약 3")
+    assert last_summary["summary_upto"] == 10
+
+
+def test_disabled_mode_summarizes_the_whole_transcript(tmp_path):
+    """Test every summary sees all turns when incremental summaries are off."""
+    summaries, _ = _run(tmp_path, incremental_summary=False)
+
+    assert all(prompt.endswith(SUMMARY_INSTRUCTION) for prompt in summaries)
+    assert PREVIOUS_SUMMARY_HEADER not in summaries[2]
+    assert "AgentJamal: jamal 1번째 발언" in summaries[2]
@@ -60,3 +60,92 @@ def test_logger_message_format():
     assert "%(name)s" in format_str
     assert "%(levelname)s" in format_str
     assert "%(message)s" in format_str
+
+
+def test_truncate_long_messages():
+    """Test truncate caps length and reports dropped characters."""
+    from src.utils.logger import truncate
+
+    assert truncate("short", 10) == "short"
+    assert truncate("x" * 30, 10) == "x" * 10 + "... [truncated 20 chars]"
+    assert truncate("x" * 30, 0) == "x" * 30
+
+
+def test_json_formatter_includes_extra_fields():
+    """Test JSON formatter output is parseable and carries extra fields."""
+    import json
+    from src.utils.logger import JsonFormatter
+
+    record = logging.LogRecord("test_json", logging.INFO, __file__, 1, "Turn %s done", ("jamal",), None)
+    record.thread_ts = "1234.5678"
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "Turn jamal done"
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "test_json"
+    assert payload["thread_ts"] == "1234.5678"
+
+
+def test_sampling_filter_keeps_one_in_n_per_template():
+    """Test sampling keeps every Nth INFO record but all warnings."""
+    from src.utils.logger import SamplingFilter
+
+    sampler = SamplingFilter({"noisy": 0.25})
+
+    def _record(level, msg):
+        return logging.LogRecord("noisy", level, __file__, 1, msg, (), None)
+
+    kept = [sampler.filter(_record(logging.INFO, "[POST] %s")) for _ in range(8)]
+    assert kept.count(True) == 2
+    assert kept[0] is True
+    assert sampler.filter(_record(logging.WARNING, "[POST] %s"))
+    # Other loggers are not sampled
+    other = logging.LogRecord("quiet", logging.INFO, __file__, 1, "msg", (), None)
+    assert sampler.filter(other)
+
+
+def test_sampling_filter_forgets_least_recent_templates():
+    """Test template counts stay bounded by max_keys."""
+    from src.utils.logger import SamplingFilter
+
+    sampler = SamplingFilter({"noisy": 0.5}, max_keys=2)
+
+    def _record(msg):
+        return logging.LogRecord("noisy", logging.INFO, __file__, 1, msg, (), None)
+
+    assert [sampler.filter(_record("a %s")) for _ in range(2)] == [True, False]
+    for msg in ("b %s", "c %s", "d %s"):
+        sampler.filter(_record(msg))
+    assert len(sampler._counts) == 2
+    # "a" was forgotten, so it counts as a first occurrence again
+    assert sampler.filter(_record("a %s"))
+
+
+def test_async_mode_writes_through_queue_listener(monkeypatch, capsys):
+    """Test async JSON mode delivers records via the background writer."""
+    import json
+    from logging.handlers import QueueHandler
+    from src.utils.logger import configure_logging, shutdown_logging
+
+    logger = setup_logger("test_async_mode", "INFO")
+    try:
+        configure_logging(json_format=True, async_mode=True, max_length=20)
+        assert isinstance(logger.handlers[0], QueueHandler)
+
+        logger.info("payload: %s", "y" * 100)
+        shutdown_logging()
+
+        line = capsys.readouterr().out.strip().splitlines()[-1]
+        payload = json.loads(line)
+        assert payload["message"].startswith("payload: yyyyyyyyyyy...")
+        assert "[truncated" in payload["message"]
+
+        # Records logged after shutdown go straight to stdout, not to the stopped queue
+        assert not isinstance(logger.handlers[0], QueueHandler)
+        logger.info("after shutdown")
+        assert json.loads(capsys.readouterr().out.strip().splitlines()[-1])["message"] == "after shutdown"
+    finally:
+        configure_logging()
+
+    assert not isinstance(logger.handlers[0], QueueHandler)
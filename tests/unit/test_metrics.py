@@ -0,0 +1,72 @@
+"""Unit tests for the metrics registry."""
+
+import urllib.request
+import pytest
+from src.utils.metrics import MetricsRegistry, start_metrics_server
+
+
+@pytest.fixture
+def registry():
+    """Create an isolated registry."""
+    return MetricsRegistry()
+
+
+def test_counter_and_gauge_render(registry):
+    """Test counters and gauges render in Prometheus text format."""
+    posts = registry.counter("slack_post_errors_total", "Failed posts", ["speaker"])
+    active = registry.gauge("debate_active", "Active debates")
+
+    posts.inc(speaker="jamal")
+    posts.inc(2, speaker="ryan")
+    active.inc()
+    active.inc()
+    active.dec()
+
+    text = registry.render()
+    assert "# TYPE slack_post_errors_total counter" in text
+    assert 'slack_post_errors_total{speaker="jamal"} 1' in text
+    assert 'slack_post_errors_total{speaker="ryan"} 2' in text
+    assert "debate_active 1" in text
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    """Test histogram bucket, sum and count lines."""
+    latency = registry.histogram("llm_call_duration_seconds", "LLM latency", ["role"], buckets=(0.1, 1.0))
+
+    latency.observe(0.05, role="proposer")
+    latency.observe(0.5, role="proposer")
+    latency.observe(5.0, role="proposer")
+
+    text = registry.render()
+    assert 'llm_call_duration_seconds_bucket{role="proposer",le="0.1"} 1' in text
+    assert 'llm_call_duration_seconds_bucket{role="proposer",le="1"} 2' in text
+    assert 'llm_call_duration_seconds_bucket{role="proposer",le="+Inf"} 3' in text
+    assert 'llm_call_duration_seconds_count{role="proposer"} 3' in text
+    assert latency.get_sum(role="proposer") == pytest.approx(5.55)
+
+
+def test_registry_get_or_create_and_label_validation(registry):
+    """Test re-registering returns the same metric and labels are checked."""
+    first = registry.counter("debate_started_total", "Debates")
+    assert registry.counter("debate_started_total", "Debates") is first
+
+    with pytest.raises(ValueError):
+        registry.gauge("debate_started_total", "Debates")
+    with pytest.raises(ValueError):
+        first.inc(speaker="jamal")
+
+
+def test_metrics_server_serves_text_format(registry):
+    """Test the HTTP endpoint returns the rendered registry."""
+    registry.counter("slack_mentions_total", "Mentions", ["mode"]).inc(mode="orchestrator")
+    server = start_metrics_server(0, registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.shutdown()
+
+    assert content_type.startswith("text/plain")
+    assert 'slack_mentions_total{mode="orchestrator"} 1' in body
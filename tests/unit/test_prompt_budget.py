@@ -0,0 +1,108 @@
+"""Unit tests for prompt budgets and token estimate calibration."""
+
+from unittest.mock import Mock
+
+from benchmarks.fakes import FakeLlm, build_fake_agent
+from src.llm.adk_agent import ADKAgent
+from src.llm.tokens import TokenCalibration, estimate_tokens
+from src.orchestrator import DebateOrchestrator, PromptBudget
+from src.orchestrator.prompt_budget import DROPPED_MARKER, MIN_ENTRY_TOKENS, render_entries
+
+
+def test_calibration_fits_scale_and_overhead():
+    """Test the fit recovers actual = 200 + 1.5 × estimate and waits for enough samples."""
+    calibration = TokenCalibration(min_samples=3)
+    calibration.record(100, 350)
+    assert calibration.adjust(100) == 100
+
+    calibration.record(200, 500)
+    calibration.record(400, 800)
+    scale, overhead = calibration.fit()
+    assert abs(scale - 1.5) < 1e-6 and abs(overhead - 200) < 1e-6
+    assert calibration.adjust(1000) == 1700
+
+    same_size = TokenCalibration(min_samples=2)
+    same_size.record(100, 200)
+    same_size.record(100, 220)
+    assert same_size.fit() == (2.1, 0.0)
+
+
+def test_fit_compacts_then_drops_oldest_turns():
+    """Test old turns shrink first, then disappear, while header, footer and recent turns stay."""
+    turns = [f"AgentJamal: {i}번째 발언입니다. " + "근거를 자세히 설명합니다. " * 40 for i in range(8)]
+    header, footer = "주제: 원격 근무", "위 토론을 요약하세요."
+    full = "\n\n".join([header, *turns, footer])
+
+    assert PromptBudget(10_000).fit(header, turns, footer) == full
+
+    recent = estimate_tokens("\n\n".join([header, *turns[-4:], footer]))
+    compacting = PromptBudget(recent + 4 * 45 + 10, compact_turn_tokens=40)
+    compacted = compacting.fit(header, turns, footer)
+    assert compacted.startswith(header) and compacted.endswith("\n\n".join([*turns[-4:], footer]))
+    assert "0번째 발언입니다" in compacted and DROPPED_MARKER[:6] not in compacted
+    assert estimate_tokens(compacted) <= compacting.max_tokens
+
+    small = PromptBudget(recent + 60, compact_turn_tokens=40)
+    dropped = small.fit(header, turns, footer)
+    assert "0번째 발언입니다" not in dropped
+    assert DROPPED_MARKER.format(count=3) in dropped or DROPPED_MARKER.format(count=4) in dropped
+    assert estimate_tokens(dropped) <= small.max_tokens
+
+
+def test_render_entries_truncates_the_last_entry_and_stops_at_the_budget():
+    """Test context blocks stay within budget and stop consuming entries once full."""
+    consumed = []
+
+    def _entries():
+        for i in range(5):
+            consumed.append(i)
+            yield f"- 항목 {i}: " + "근거 " * 100
+
+    budget = estimate_tokens("헤더") + 2 * MIN_ENTRY_TOKENS + 10
+    block = render_entries("헤더", _entries(), budget)
+
+    assert block.startswith("헤더\n- 항목 0")
+    assert estimate_tokens(block) <= budget
+    assert consumed == [0, 1]
+    assert render_entries("헤더", [], budget) == ""
+
+
+def test_orchestrator_enforces_budget_on_every_call():
+    """Test later prompts are trimmed to the budget and keep the instruction."""
+    long_reply = "근거가 되는 통계와 사례를 차례로 설명합니다. " * 25
+    agents = {name: Mock(agent_name=name) for name in ("AgentJamal", "AgentRyan", "AgentJames")}
+    agents["AgentJamal"].generate_response.return_value = long_reply
+    agents["AgentRyan"].generate_response.return_value = long_reply
+    agents["AgentJames"].generate_response.return_value = long_reply
+    budget = PromptBudget(2000, keep_recent=2)
+    orchestrator = DebateOrchestrator(
+        jamal_client=Mock(), ryan_client=Mock(), james_client=Mock(),
+        jamal_agent=agents["AgentJamal"], ryan_agent=agents["AgentRyan"], james_agent=agents["AgentJames"],
+        max_rounds=3,
+        prompt_budget=budget
+    )
+
+    orchestrator._run_debate("C1", "T1", "주 4일제", "U1")
+
+    prompts = [c.kwargs["text"] for agent in agents.values() for c in agent.generate_response.call_args_list]
+    assert len(prompts) == 12
+    assert all(estimate_tokens(prompt) <= budget.max_tokens for prompt in prompts)
+    assert all(prompt.startswith("주제: 주 4일제") for prompt in prompts)
+    last_check = agents["AgentJames"].generate_response.call_args_list[-1].kwargs["text"]
+    assert "토론을 종료합니다" in last_check.rsplit("\n\n", 1)[-1]
+
+
+def test_agent_records_estimated_and_reported_prompt_tokens():
+    """Test each single-call turn adds a calibration sample."""
+    calibration = TokenCalibration(min_samples=1)
+    agent = ADKAgent(
+        api_key="test-key", role="opposer",
+        root_agent=build_fake_agent("opposer", FakeLlm(model="fake-llm")),
+        token_calibration=calibration
+    )
+
+    agent.generate_response("abcd" * 400, thread_ts="T1")
+
+    assert calibration.samples == 1
+    # The fake reports chars / 4 over the whole request, which is the estimate for ASCII
+    assert calibration.adjust(400) >= 400
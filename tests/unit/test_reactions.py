@@ -0,0 +1,57 @@
+"""Unit tests for the background status reaction queue."""
+
+import threading
+from unittest.mock import Mock
+
+from slack_sdk.errors import SlackApiError
+
+from src.bot.reactions import ReactionQueue
+
+
+def _calls(client):
+    return [(name, c.kwargs["timestamp"], c.kwargs["name"])
+            for name, method in (("add", client.reactions_add), ("remove", client.reactions_remove))
+            for c in method.call_args_list]
+
+
+def test_superseded_status_is_never_sent():
+    """Test a status replaced while the worker is busy skips straight to the latest one."""
+    release = threading.Event()
+    client = Mock()
+    client.reactions_add.side_effect = lambda **kwargs: release.wait(2.0) if kwargs["timestamp"] == "0" else None
+    reactions = ReactionQueue()
+
+    reactions.set(client, "C1", "0", "speech_balloon")
+    reactions.set(client, "C1", "1", "hourglass_flowing_sand")
+    reactions.set(client, "C1", "1", "white_check_mark")
+    release.set()
+
+    assert reactions.flush(timeout=2.0)
+    assert _calls(client) == [("add", "0", "speech_balloon"), ("add", "1", "white_check_mark")]
+    reactions.close()
+
+
+def test_applied_status_is_replaced_and_errors_do_not_stop_the_worker():
+    """Test a sent status is removed before the next one, and failures are only logged."""
+    client = Mock()
+    reactions = ReactionQueue()
+
+    reactions.set(client, "C1", "1", "hourglass_flowing_sand")
+    assert reactions.flush(timeout=2.0)
+    reactions.set(client, "C1", "1", "white_check_mark")
+    reactions.set(client, "C1", "1", "white_check_mark")
+    assert reactions.flush(timeout=2.0)
+    assert _calls(client) == [
+        ("add", "1", "hourglass_flowing_sand"), ("add", "1", "white_check_mark"),
+        ("remove", "1", "hourglass_flowing_sand")
+    ]
+
+    failing = Mock()
+    failing.reactions_add.side_effect = SlackApiError("ratelimited", {"ok": False, "error": "ratelimited"})
+    reactions.set(failing, "C1", "2", "speech_balloon")
+    reactions.set(client, "C1", "3", "speech_balloon")
+    reactions.close()
+    assert ("add", "3", "speech_balloon") in _calls(client)
+
+    reactions.set(client, "C1", "4", "speech_balloon")
+    assert ("add", "4", "speech_balloon") not in _calls(client)
@@ -0,0 +1,143 @@
+"""Unit tests for the shared research step before round 1."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.llm.search_cache import SearchCache, SearchResult
+from src.llm.tokens import estimate_tokens
+from src.llm.web_search import GeminiSearch
+from src.orchestrator import CheckpointStore, DebateOrchestrator, ResearchPhase
+from src.orchestrator.research import FACT_SHEET_HEADER
+
+
+def _slow_search(query):
+    time.sleep(0.1)
+    if "비판" in query:
+        raise RuntimeError("search down")
+    return SearchResult((query,), f"공통 사실입니다. {query} 관련 수치는 12%입니다.", [("통계청", "https://kostat.go.kr")])
+
+
+def test_fact_sheet_runs_searches_concurrently_and_drops_repeated_sentences():
+    """Test searches fan out in parallel, failures are skipped and shared sentences appear once."""
+    research = ResearchPhase(_slow_search, max_queries=4)
+    assert research.queries_for("<@U1> 원격 근무") == ["원격 근무", "원격 근무 통계", "원격 근무 장점 근거", "원격 근무 문제점 비판"]
+
+    start = time.perf_counter()
+    fact_sheet = research.fact_sheet_for("<@U1> 원격 근무", "T1")
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.3
+    assert fact_sheet.startswith(FACT_SHEET_HEADER)
+    assert fact_sheet.count("공통 사실입니다.") == 1
+    assert "- 원격 근무 통계: 원격 근무 통계 관련 수치는 12%입니다. (출처: 통계청)" in fact_sheet
+    assert "비판" not in fact_sheet
+
+    small = ResearchPhase(_slow_search, max_queries=3, token_budget=estimate_tokens(FACT_SHEET_HEADER) + 60)
+    assert estimate_tokens(small.fact_sheet_for("원격 근무", "T1")) <= small.token_budget
+    assert ResearchPhase(_slow_search, timeout_s=0.01).fact_sheet_for("원격 근무", "T1") == ""
+
+
+def test_research_goes_through_the_search_cache():
+    """Test cached queries are not searched again and the agents are not re-shown them."""
+    cache = SearchCache(ttl_s=60)
+    search = Mock(side_effect=lambda query: SearchResult((query,), f"{query} 결과입니다."))
+    ResearchPhase(search, search_cache=cache, max_queries=2).fact_sheet_for("기본소득", "T1")
+    ResearchPhase(search, search_cache=cache, max_queries=2).fact_sheet_for("기본소득", "T2")
+
+    assert search.call_count == 2
+    assert cache.render_unseen("T1", "AgentRyan") == ("", [])
+
+
+def test_orchestrator_gives_every_agent_the_fact_sheet(tmp_path):
+    """Test the fact sheet is in the first prompts and kept in checkpoints."""
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints"))
+    saved = []
+    agents = {name: Mock(agent_name=name) for name in ("AgentJamal", "AgentRyan", "AgentJames")}
+    agents["AgentJamal"].generate_response.return_value = "찬성"
+    agents["AgentRyan"].generate_response.return_value = "반대"
+    agents["AgentJames"].generate_response.side_effect = lambda text, **kwargs: (
+        saved.append(checkpoints.load("T9")) or ("토론을 종료합니다. 결론" if len(saved) == 2 else "요약")
+    )
+    orchestrator = DebateOrchestrator(
+        jamal_client=Mock(), ryan_client=Mock(), james_client=Mock(),
+        jamal_agent=agents["AgentJamal"], ryan_agent=agents["AgentRyan"], james_agent=agents["AgentJames"],
+        checkpoint_store=checkpoints,
+        research=ResearchPhase(lambda query: SearchResult((query,), "주 4일제 도입 기업은 3%입니다."), max_queries=1)
+    )
+
+    orchestrator._run_debate("C1", "T9", "주 4일제", "U1")
+
+    for agent in agents.values():
+        prompt = agent.generate_response.call_args_list[0].kwargs["text"]
+        assert f"{FACT_SHEET_HEADER}\n- 주 4일제: 주 4일제 도입 기업은 3%입니다." in prompt
+    assert "도입 기업은 3%" in saved[0].fact_sheet
+
+
+def test_orchestrator_drops_the_search_cache_of_finished_debates():
+    """Test a debate's cached results are forgotten once it ends."""
+    cache = SearchCache()
+    agents = {name: Mock(agent_name=name) for name in ("AgentJamal", "AgentRyan", "AgentJames")}
+    agents["AgentJamal"].generate_response.return_value = "찬성"
+    agents["AgentRyan"].generate_response.return_value = "반대"
+    agents["AgentJames"].generate_response.return_value = "토론을 종료합니다. 결론"
+    orchestrator = DebateOrchestrator(
+        jamal_client=Mock(), ryan_client=Mock(), james_client=Mock(),
+        jamal_agent=agents["AgentJamal"], ryan_agent=agents["AgentRyan"], james_agent=agents["AgentJames"],
+        research=ResearchPhase(lambda query: SearchResult((query,), "요약"), search_cache=cache, max_queries=1),
+        search_cache=cache
+    )
+
+    orchestrator._run_debate("C1", "T10", "주 4일제", "U1")
+
+    assert cache.get("T10", "주 4일제") is None
+
+
+def test_gemini_search_builds_result_from_grounded_response(monkeypatch):
+    """Test the model summary and grounding sources become a SearchResult."""
+    response = SimpleNamespace(
+        text=" 요약입니다. ",
+        candidates=[SimpleNamespace(grounding_metadata=SimpleNamespace(
+            web_search_queries=["원격 근무"],
+            grounding_chunks=[SimpleNamespace(web=SimpleNamespace(uri="https://a.kr", title="a.kr"))],
+            grounding_supports=[]
+        ))]
+    )
+
+    async def _generate_content(**kwargs):
+        return response
+
+    search = GeminiSearch(api_key="test-key")
+    monkeypatch.setattr(search, "_client", SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=_generate_content))
+    ))
+
+    result = search("원격 근무")
+
+    assert (result.queries, result.summary, result.sources) == (("원격 근무",), "요약입니다.", [("a.kr", "https://a.kr")])
+
+
+def test_timed_out_gemini_search_is_cancelled(monkeypatch):
+    """Test a search past its timeout is cancelled on the loop, not left running."""
+    cancelled = threading.Event()
+
+    async def _generate_content(**kwargs):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    search = GeminiSearch(api_key="test-key", timeout_s=0.05)
+    monkeypatch.setattr(search, "_client", SimpleNamespace(
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=_generate_content))
+    ))
+
+    with pytest.raises(FutureTimeoutError):
+        search("원격 근무")
+    assert cancelled.wait(1.0)
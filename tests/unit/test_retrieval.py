@@ -0,0 +1,88 @@
+"""Unit tests for prior-debate retrieval and token estimates."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.llm.tokens import estimate_tokens, truncate_to_tokens
+from src.orchestrator import CheckpointStore, DebateOrchestrator, PriorDebateRetriever, TranscriptStore, Utterance
+from src.orchestrator.retrieval import BACKGROUND_HEADER
+
+
+@pytest.fixture
+def store(tmp_path):
+    transcript_store = TranscriptStore(str(tmp_path / "transcripts.db"))
+    yield transcript_store
+    transcript_store.close()
+
+
+def _finished(store, thread_ts, topic, conclusion, channel="C1"):
+    store.start_debate(thread_ts, channel, topic)
+    store.append(thread_ts, Utterance(1, "jamal", "찬성 근거입니다"))
+    store.append(thread_ts, Utterance(1, "james", conclusion))
+    store.finish_debate(thread_ts, "concluded", 1)
+
+
+def test_estimate_and_truncate_tokens():
+    """Test the estimate counts Hangul per syllable and ASCII per ~4 chars."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("원격 근무") == 5
+    text = "원격 근무는 생산성을 높인다. " * 20
+    cut = truncate_to_tokens(text, 30)
+    assert estimate_tokens(cut) <= 30 and cut.endswith("…") and text.startswith(cut[:-1])
+    assert truncate_to_tokens("짧은 글", 30) == "짧은 글"
+
+
+def test_retriever_returns_similar_finished_debates_within_budget(store):
+    """Test relevant conclusions are returned; unrelated, running and own debates are not."""
+    _finished(store, "T1", "<@U1> 원격 근무는 생산성을 높이는가?", "토론을 종료합니다. 원격 근무는 측정 지표가 있을 때 효과적입니다.")
+    _finished(store, "T2", "점심 메뉴 정하기", "토론을 종료합니다. 비빔밥으로 합의했습니다.")
+    _finished(store, "T3", "원격 근무 수당", "토론을 종료합니다. 원격 근무 수당은 필요합니다.", channel="C2")
+    store.start_debate("T4", "C1", "원격 근무 확대")  # still running
+    store.start_debate("T5", "C1", "<@U1> 원격 근무와 생산성")  # the new debate itself
+    store.flush(timeout=5)
+
+    background = PriorDebateRetriever(store).background_for("<@U1> 원격 근무와 생산성", "C1", exclude_thread="T5")
+
+    assert background.startswith(BACKGROUND_HEADER)
+    assert "원격 근무는 생산성을 높이는가? (" in background
+    assert "측정 지표가 있을 때 효과적" in background
+    assert "<@U1>" not in background
+    assert "비빔밥" not in background and "수당" not in background and "확대" not in background
+
+    small = PriorDebateRetriever(store, token_budget=estimate_tokens(BACKGROUND_HEADER) + 45, all_channels=True)
+    background = small.background_for("원격 근무", "C1")
+    assert background.count("\n- ") == 1
+    assert estimate_tokens(background) <= small.token_budget
+    assert PriorDebateRetriever(store).background_for("양자 컴퓨터", "C1") == ""
+
+
+def test_orchestrator_adds_background_before_round_one(store, tmp_path):
+    """Test the first prompt carries the background and checkpoints keep it."""
+    _finished(store, "T1", "원격 근무", "토론을 종료합니다. 주 2회 출근이 적절합니다.")
+    store.flush(timeout=5)
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints"))
+    saved = []
+
+    def _james(text, **kwargs):
+        saved.append(checkpoints.load("T9"))
+        return "토론을 종료합니다. 결론" if len(saved) == 2 else "요약"
+
+    agents = {name: Mock(agent_name=name) for name in ("AgentJamal", "AgentRyan", "AgentJames")}
+    agents["AgentJamal"].generate_response.return_value = "찬성"
+    agents["AgentRyan"].generate_response.return_value = "반대"
+    agents["AgentJames"].generate_response.side_effect = _james
+    orchestrator = DebateOrchestrator(
+        jamal_client=Mock(), ryan_client=Mock(), james_client=Mock(),
+        jamal_agent=agents["AgentJamal"], ryan_agent=agents["AgentRyan"], james_agent=agents["AgentJames"],
+        checkpoint_store=checkpoints,
+        retriever=PriorDebateRetriever(store)
+    )
+
+    orchestrator._run_debate("C1", "T9", "원격 근무 확대", "U1")
+
+    prompt = agents["AgentJamal"].generate_response.call_args.kwargs["text"]
+    assert prompt.startswith(f"주제: 원격 근무 확대\n\n{BACKGROUND_HEADER}")
+    assert "주 2회 출근이 적절합니다." in prompt
+    assert "주 2회 출근" in saved[0].background
@@ -0,0 +1,169 @@
+"""Unit tests for the shared search result cache."""
+
+import threading
+import time
+from typing import AsyncGenerator, List
+
+import pytest
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+
+from benchmarks.fakes import build_fake_agent
+from src.llm.adk_agent import ADKAgent
+from src.llm.search_cache import SEARCH_HEADER, SEARCH_QUERIES, SearchCache, SearchResult, normalize_query
+
+
+class GroundedLlm(BaseLlm):
+    """Fake model that reports a google_search run with every response."""
+
+    queries: List[str] = []
+    prompts: List[str] = []
+    failures: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self.prompts.append(llm_request.contents[-1].parts[0].text)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("fake model error")
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part.from_text(text="근거가 있습니다")]),
+            grounding_metadata=types.GroundingMetadata(
+                web_search_queries=self.queries,
+                grounding_chunks=[types.GroundingChunk(web=types.GroundingChunkWeb(uri="https://a.kr/1", title="a.kr"))],
+                grounding_supports=[types.GroundingSupport(segment=types.Segment(text="재택 근무자 생산성 13% 향상"))]
+            )
+        )
+
+
+def test_lookups_ignore_word_order_and_share_across_debates_within_ttl():
+    """Test debate-scoped hits, TTL-bound global hits and LRU eviction."""
+    assert normalize_query("원격 근무, 생산성") == normalize_query("생산성 원격  근무")
+
+    cache = SearchCache(max_debates=2)
+    cache.put("T1", SearchResult(("원격 근무 생산성",), "요약"))
+    assert cache.get("T1", "생산성 원격 근무").summary == "요약"
+    assert cache.get("T2", "원격 근무 생산성") is None
+    cache.put("T2", SearchResult(("a",), ""))
+    cache.put("T3", SearchResult(("b",), ""))
+    assert cache.get("T1", "원격 근무 생산성") is None
+
+    shared = SearchCache(ttl_s=60)
+    shared.put("T1", SearchResult(("기본소득 재원",), "요약"))
+    shared.put("T1", SearchResult(("오래된 검색",), "요약", fetched_at=time.time() - 120))
+    assert shared.get("T2", "기본소득 재원") is not None
+    assert shared.get("T2", "오래된 검색") is None
+
+
+def test_grounded_queries_are_kept_whole():
+    """Test queries containing commas are not split into separate entries."""
+    cache = SearchCache()
+    metadata = types.GroundingMetadata(web_search_queries=["서울, 부산 인구", "  ", "출산율"])
+    cache.record_grounding("T1", metadata)
+
+    result = cache.get("T1", "서울, 부산 인구")
+    assert result.queries == ("서울, 부산 인구", "출산율")
+    assert cache.get("T1", "서울") is None
+    assert cache.get("T1", "출산율") is result
+
+
+def test_get_or_search_merges_concurrent_identical_queries():
+    """Test one search runs for parallel callers and failures are not cached."""
+    cache = SearchCache()
+    calls = []
+
+    def _search(query):
+        calls.append(query)
+        time.sleep(0.05)
+        return SearchResult((query,), f"{query} 결과")
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda q=q: results.append(cache.get_or_search("T1", q, _search)))
+        for q in ("원격 근무", "근무 원격", "원격 근무", "기본소득")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == ["기본소득", "원격 근무"] or sorted(calls) == ["근무 원격", "기본소득"]
+    assert len(results) == 4
+
+    def _fail(query):
+        raise RuntimeError("search down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_search("T1", "탄소세", _fail)
+    assert cache.get_or_search("T1", "탄소세", _search).summary == "탄소세 결과"
+
+
+def test_agents_share_grounded_searches_within_a_debate():
+    """Test one agent's searches reach the others' next prompts once."""
+    cache = SearchCache()
+    jamal_model = GroundedLlm(model="fake", queries=["원격 근무 생산성 통계"], prompts=[])
+    ryan_model = GroundedLlm(model="fake", queries=["통계 생산성 원격 근무"], prompts=[])
+    jamal = ADKAgent(api_key="test-key", role="proposer",
+                     root_agent=build_fake_agent("proposer", jamal_model), search_cache=cache)
+    ryan = ADKAgent(api_key="test-key", role="opposer",
+                    root_agent=build_fake_agent("opposer", ryan_model), search_cache=cache)
+    repeats = SEARCH_QUERIES.get(result="repeat")
+
+    jamal.generate_response("주제: 원격 근무", thread_ts="T1")
+    ryan.generate_response("반론해 주세요", thread_ts="T1")
+    ryan.generate_response("다시 반론해 주세요", thread_ts="T1")
+    jamal.generate_response("다음 주장", thread_ts="T1")
+    jamal.generate_response("다른 토론", thread_ts="T2")
+
+    assert jamal_model.prompts[0] == "주제: 원격 근무"
+    assert ryan_model.prompts[0].startswith(SEARCH_HEADER)
+    assert "- 원격 근무 생산성 통계: 재택 근무자 생산성 13% 향상 (출처: a.kr)" in ryan_model.prompts[0]
+    assert ryan_model.prompts[0].endswith("\n\n반론해 주세요")
+    assert ryan_model.prompts[1] == "다시 반론해 주세요"
+    # Ryan's repeated searches neither replace Jamal's result nor reach Jamal
+    assert jamal_model.prompts[1:] == ["다음 주장", "다른 토론"]
+    assert SEARCH_QUERIES.get(result="repeat") == repeats + 3
+
+
+def test_results_are_shown_again_after_a_failed_call():
+    """Test results only count as shown once a call with them succeeded."""
+    cache = SearchCache()
+    jamal_model = GroundedLlm(model="fake", queries=["원격 근무 생산성 통계"], prompts=[])
+    ryan_model = GroundedLlm(model="fake", queries=[], prompts=[], failures=1)
+    jamal = ADKAgent(api_key="test-key", role="proposer",
+                     root_agent=build_fake_agent("proposer", jamal_model), search_cache=cache)
+    ryan = ADKAgent(api_key="test-key", role="opposer",
+                    root_agent=build_fake_agent("opposer", ryan_model), search_cache=cache)
+
+    jamal.generate_response("주제: 원격 근무", thread_ts="T1")
+    assert ryan.generate_response("반론해 주세요", thread_ts="T1").startswith("Error generating response")
+    ryan.generate_response("반론해 주세요", thread_ts="T1")
+    ryan.generate_response("다시 반론해 주세요", thread_ts="T1")
+
+    assert [prompt.startswith(SEARCH_HEADER) for prompt in ryan_model.prompts] == [True, True, False]
+
+
+def test_replayed_debate_restores_the_searches_of_earlier_turns(tmp_path):
+    """Test a replayed turn caches its recorded searches, so the next prompt matches its recording."""
+    def _debate(mode, failures=0):
+        cache = SearchCache()
+        jamal_model = GroundedLlm(model="fake", queries=["원격 근무 생산성 통계"], prompts=[], failures=failures)
+        ryan_model = GroundedLlm(model="fake", queries=[], prompts=[], failures=failures)
+        agents = [
+            ADKAgent(api_key="test-key", role=role, root_agent=build_fake_agent(role, model), search_cache=cache,
+                     cassette_mode=mode, cassette_dir=str(tmp_path))
+            for role, model in (("proposer", jamal_model), ("opposer", ryan_model))
+        ]
+        return [
+            agents[0].generate_response("주제: 원격 근무", thread_ts="T1"),
+            agents[1].generate_response("반론해 주세요", thread_ts="T1")
+        ], ryan_model
+
+    recorded, ryan_model = _debate("record")
+    assert ryan_model.prompts[0].startswith(SEARCH_HEADER)
+
+    # Live calls would fail, so both turns must come from the recordings
+    replayed, ryan_model = _debate("replay", failures=2)
+    assert replayed == recorded
+    assert ryan_model.prompts == []
@@ -0,0 +1,23 @@
+"""Unit tests for the daemon thread helper."""
+
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from src.utils.threads import submit_daemon
+
+_REQUEST = ContextVar("request", default=None)
+
+
+def test_submit_daemon_carries_context_and_reports_through_future():
+    """Test the caller's context reaches the thread and results/errors reach the future."""
+    _REQUEST.set("T1")
+
+    def _work(suffix, sep="-"):
+        return (_REQUEST.get() + sep + suffix, threading.current_thread().name, threading.current_thread().daemon)
+
+    assert submit_daemon(_work, "a", sep="/", name="worker-test").result(timeout=1) == ("T1/a", "worker-test", True)
+
+    with pytest.raises(ZeroDivisionError):
+        submit_daemon(lambda: 1 / 0).result(timeout=1)
@@ -0,0 +1,96 @@
+"""Unit tests for span tracing."""
+
+import asyncio
+import pytest
+from src.utils.tracing import (
+    InMemoryExporter,
+    JSONLFileExporter,
+    Tracer,
+    create_exporter,
+    latency_breakdown,
+    load_spans,
+)
+
+
+def test_nested_spans_share_trace_and_parent():
+    """Test that nested spans are parented within one trace."""
+    exporter = InMemoryExporter()
+    tracer = Tracer(exporter)
+
+    with tracer.start_span("debate", attributes={"thread_ts": "T1"}) as root:
+        with tracer.start_span("debate.turn", attributes={"agent": "AgentJamal"}) as child:
+            pass
+
+    assert child.trace_id == root.trace_id
+    assert child.parent_id == root.span_id
+    assert root.parent_id is None
+    # Children finish (and are exported) first
+    assert [s.name for s in exporter.spans] == ["debate.turn", "debate"]
+    assert root.duration_ms >= child.duration_ms
+
+
+def test_new_trace_ignores_active_span():
+    """Test new_trace starts an independent trace."""
+    tracer = Tracer(InMemoryExporter())
+
+    with tracer.start_span("outer") as outer:
+        with tracer.start_span("inner", new_trace=True) as inner:
+            pass
+
+    assert inner.trace_id != outer.trace_id
+    assert inner.parent_id is None
+
+
+def test_span_propagates_into_asyncio_run():
+    """Test spans opened inside asyncio.run are children of the caller span."""
+    exporter = InMemoryExporter()
+    tracer = Tracer(exporter)
+
+    async def _lookup():
+        with tracer.start_span("adk.session_lookup") as span:
+            return span
+
+    with tracer.start_span("llm.generate") as parent:
+        child = asyncio.run(_lookup())
+
+    assert child.parent_id == parent.span_id
+
+
+def test_span_records_error():
+    """Test that exceptions mark the span as failed and propagate."""
+    exporter = InMemoryExporter()
+    tracer = Tracer(exporter)
+
+    with pytest.raises(RuntimeError):
+        with tracer.start_span("slack.post_message"):
+            raise RuntimeError("boom")
+
+    span = exporter.get_spans("slack.post_message")[0]
+    assert span.status == "error"
+    assert "boom" in span.error
+
+
+def test_jsonl_exporter_round_trip(tmp_path):
+    """Test spans written to JSONL can be loaded and summarized."""
+    path = tmp_path / "traces.jsonl"
+    exporter = JSONLFileExporter(str(path))
+    tracer = Tracer(exporter)
+
+    for _ in range(3):
+        with tracer.start_span("debate.turn", attributes={"round": 1}):
+            pass
+    exporter.shutdown()
+
+    spans = load_spans(str(path))
+    assert len(spans) == 3
+    assert spans[0]["attributes"] == {"round": 1}
+
+    breakdown = latency_breakdown(spans)
+    assert breakdown["debate.turn"]["count"] == 3
+    assert breakdown["debate.turn"]["max_ms"] >= breakdown["debate.turn"]["p50_ms"]
+
+
+def test_create_exporter_rejects_unknown_kind():
+    """Test that an unknown exporter name raises ValueError."""
+    with pytest.raises(ValueError, match="Invalid trace exporter"):
+        create_exporter("zipkin")
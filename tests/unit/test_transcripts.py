@@ -0,0 +1,150 @@
+"""Unit tests for the SQLite transcript store and debate search."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.bot.slack_handler import format_search_results, parse_search_command
+from src.orchestrator import DebateOrchestrator, TranscriptStore, Utterance
+
+
+@pytest.fixture
+def store(tmp_path):
+    transcript_store = TranscriptStore(str(tmp_path / "db" / "transcripts.db"))
+    yield transcript_store
+    transcript_store.close()
+
+
+def test_transcript_round_trip_and_indexes(store):
+    """Test queued writes land in order and debates can be listed by channel/date."""
+    store.start_debate("T1", "C1", "원격 근무", user_id="U1", flow="classic")
+    store.append("T1", Utterance(1, "jamal", "찬성합니다", "proposal"))
+    store.append("T1", Utterance(1, "ryan", "반대합니다", "rebuttal"))
+    store.finish_debate("T1", "concluded", 1)
+    store.start_debate("T2", "C2", "기본소득")
+    # A resumed debate re-sends start_debate; the original row is kept
+    store.start_debate("T1", "C1", "다른 주제")
+
+    assert store.flush(timeout=5)
+
+    transcript = store.get_transcript("T1")
+    assert transcript["topic"] == "원격 근무"
+    assert (transcript["outcome"], transcript["rounds"]) == ("concluded", 1)
+    assert [(u["speaker"], u["text"]) for u in transcript["utterances"]] == [
+        ("jamal", "찬성합니다"), ("ryan", "반대합니다")
+    ]
+    assert [d["thread_ts"] for d in store.list_debates()] == ["T2", "T1"]
+    assert [d["thread_ts"] for d in store.list_debates(channel="C1")] == ["T1"]
+    assert store.list_debates(since=transcript["started_at"] + 3600) == []
+    assert store.get_transcript("missing") is None
+
+
+def test_close_writes_pending_operations(tmp_path):
+    """Test close() drains the queue before stopping the writer."""
+    path = str(tmp_path / "transcripts.db")
+    store = TranscriptStore(path)
+    store.start_debate("T1", "C1", "주제")
+    for i in range(500):
+        store.append("T1", Utterance(1, "jamal", f"발언 {i}"))
+    store.close()
+
+    assert len(TranscriptStore(path).get_transcript("T1")["utterances"]) == 500
+
+
+def test_orchestrator_records_each_utterance(store):
+    """Test a debate's turns and outcome are stored."""
+    agents = {}
+    for key, name, reply in [
+        ("jamal", "AgentJamal", "찬성"), ("ryan", "AgentRyan", "반대"), ("james", "AgentJames", None)
+    ]:
+        agents[key] = Mock(agent_name=name)
+        agents[key].generate_response.return_value = reply
+    agents["james"].generate_response.side_effect = ["요약", "토론을 종료합니다. 결론"]
+    orchestrator = DebateOrchestrator(
+        jamal_client=Mock(), ryan_client=Mock(), james_client=Mock(),
+        jamal_agent=agents["jamal"], ryan_agent=agents["ryan"], james_agent=agents["james"],
+        transcript_store=store
+    )
+
+    orchestrator._run_debate("C1", "T3", "주제", "U1")
+    store.flush(timeout=5)
+
+    transcript = store.get_transcript("T3")
+    assert [u["node"] for u in transcript["utterances"]] == ["proposal", "summary", "rebuttal", "check"]
+    assert transcript["utterances"][-1]["text"] == "토론을 종료합니다. 결론"
+    assert (transcript["outcome"], transcript["rounds"], transcript["flow"]) == ("concluded", 1, "classic")
+
+
+def _add_debate(store, thread_ts, channel, topic, utterances, outcome="concluded"):
+    store.start_debate(thread_ts, channel, topic)
+    for speaker, text in utterances:
+        store.append(thread_ts, Utterance(1, speaker, text))
+    if outcome:
+        store.finish_debate(thread_ts, outcome, 1)
+
+
+def test_search_ranks_topics_first_and_matches_korean_prefixes(store):
+    """Test topic matches outrank utterance matches and '근무' matches '근무는'."""
+    _add_debate(store, "T1", "C1", "점심 메뉴", [("jamal", "원격 근무는 점심 선택지를 늘립니다")])
+    _add_debate(store, "T2", "C1", "원격 근무의 생산성", [("ryan", "생산성 지표가 필요합니다")])
+    _add_debate(store, "T3", "C2", "원격 근무 확대", [("james", "토론을 종료합니다. 원격 근무를 확대합니다")])
+    # Still running: matched through its live utterance rows
+    _add_debate(store, "T4", "C1", "회의 문화", [("jamal", "원격 근무 회의")], outcome=None)
+    store.flush(timeout=5)
+
+    hits = store.search("원격 근무")
+    assert [hit["thread_ts"] for hit in hits][:2] in (["T2", "T3"], ["T3", "T2"])
+    assert {hit["thread_ts"] for hit in hits} == {"T1", "T2", "T3", "T4"}
+    assert "*원격*" in hits[0]["snippet"]
+
+    assert {hit["thread_ts"] for hit in store.search("원격", channel="C1")} == {"T1", "T2", "T4"}
+    assert [hit["thread_ts"] for hit in store.search("생산성 지표")] == ["T2"]
+    assert store.search("원격", limit=1)[0]["thread_ts"] in ("T2", "T3")
+    assert store.search("\"*") == []
+    assert store.get_transcript("T3")["conclusion"] == "토론을 종료합니다. 원격 근무를 확대합니다"
+
+
+def test_reopening_a_store_keeps_its_search_index(tmp_path):
+    """Test the schema is created once and a reopened store keeps indexing."""
+    path = str(tmp_path / "transcripts.db")
+    store = TranscriptStore(path)
+    store.start_debate("T1", "C1", "기본소득")
+    store.append("T1", Utterance(1, "jamal", "재원 마련이 관건입니다", "proposal"))
+    store.finish_debate("T1", "max_rounds", 10)
+    store.close()
+
+    store = TranscriptStore(path)
+    try:
+        assert [hit["thread_ts"] for hit in store.search("재원")] == ["T1"]
+        store.start_debate("T2", "C1", "기본소득 재원")
+        store.flush(timeout=5)
+        assert [hit["thread_ts"] for hit in store.search("기본소득")] == ["T2", "T1"]
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize("text, query", [
+    ("<@U1> 검색 원격 근무", "원격 근무"),
+    ("search remote work", "remote work"),
+    ("<@U1> 원격 근무에 대해 토론해요", None),
+    ("<@U1> 검색", None),
+])
+def test_parse_search_command(text, query):
+    """Test search mentions are told apart from debate topics."""
+    assert parse_search_command(text) == query
+
+
+def test_format_search_results():
+    """Test hits are rendered with a thread link and snippet."""
+    hits = [{
+        "thread_ts": "1700000000.000100", "channel": "C1", "topic": "<@U1> 원격 근무",
+        "started_at": 1700000000.0, "outcome": None, "snippet": "*원격* 근무는\n좋습니다"
+    }]
+
+    text = format_search_results("원격", hits, 3.2)
+
+    assert "검색 결과 1건 (3ms)" in text
+    assert "<https://slack.com/archives/C1/p1700000000000100|원격 근무>" in text
+    assert "진행 중" in text
+    assert "> *원격* 근무는 좋습니다" in text
+    assert "찾지 못했습니다" in format_search_results("없음", [], 1.0)
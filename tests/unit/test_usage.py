@@ -0,0 +1,80 @@
+"""Unit tests for token usage accounting."""
+
+from types import SimpleNamespace
+from src.llm.usage import TokenUsage, UsageTracker
+
+
+def test_token_usage_from_usage_metadata():
+    """Test building TokenUsage from genai usage metadata."""
+    metadata = SimpleNamespace(
+        prompt_token_count=120,
+        candidates_token_count=30,
+        cached_content_token_count=None
+    )
+
+    usage = TokenUsage.from_usage_metadata(metadata)
+
+    assert usage.prompt_tokens == 120
+    assert usage.candidate_tokens == 30
+    assert usage.cached_tokens == 0
+    assert usage.total_tokens == 150
+    assert usage.calls == 1
+
+
+def test_tracker_aggregates_per_agent_debate_channel_and_day():
+    """Test that a record lands in every aggregate bucket."""
+    tracker = UsageTracker()
+    tracker.record("AgentJamal", TokenUsage(100, 20, 0, 1), channel="C1", thread_ts="T1", day="2025-01-01")
+    tracker.record("AgentRyan", TokenUsage(200, 40, 50, 1), channel="C1", thread_ts="T1", day="2025-01-01")
+    tracker.record("AgentJamal", TokenUsage(10, 5, 0, 1), channel="C2", thread_ts="T2", day="2025-01-02")
+
+    assert tracker.get_agent_usage("AgentJamal").total_tokens == 135
+    assert tracker.get_debate_usage("T1").total_tokens == 360
+    assert tracker.get_channel_usage("C1").cached_tokens == 50
+    assert tracker.get_daily_usage("2025-01-02").calls == 1
+    assert len(tracker.get_debate_turns("T1")) == 2
+
+    snapshot = tracker.snapshot()
+    assert set(snapshot) == {"agents", "debates", "channels", "days"}
+    assert snapshot["debates"]["T2"]["total_tokens"] == 15
+
+
+def test_tracker_budget_and_finish_debate():
+    """Test budget check and per-turn cleanup."""
+    tracker = UsageTracker()
+    tracker.record("AgentJames", TokenUsage(900, 200, 0, 1), thread_ts="T1")
+
+    assert tracker.is_over_budget("T1", 1000)
+    assert not tracker.is_over_budget("T1", 0)
+    assert not tracker.is_over_budget("T_unknown", 1000)
+
+    turns = tracker.finish_debate("T1")
+    assert len(turns) == 1
+    assert tracker.get_debate_turns("T1") == []
+    # Totals survive cleanup
+    assert tracker.get_debate_usage("T1").total_tokens == 1100
+
+
+def test_tracker_keeps_only_recent_debates_channels_and_days():
+    """Test totals are bounded: least recently used debates/channels and oldest days are dropped."""
+    tracker = UsageTracker(max_debates=2, max_channels=1, max_days=2)
+    tracker.record("AgentJamal", TokenUsage(10, 0, 0, 1), channel="C1", thread_ts="T1", day="2025-01-01")
+    tracker.record("AgentJamal", TokenUsage(10, 0, 0, 1), channel="C2", thread_ts="T2", day="2025-01-02")
+    tracker.record("AgentJamal", TokenUsage(10, 0, 0, 1), channel="C2", thread_ts="T1", day="2025-01-03")
+    tracker.record("AgentJamal", TokenUsage(10, 0, 0, 1), channel="C2", thread_ts="T3", day="2025-01-03")
+
+    snapshot = tracker.snapshot()
+    assert list(snapshot["debates"]) == ["T1", "T3"]
+    assert tracker.get_debate_usage("T1").calls == 2
+    assert list(snapshot["channels"]) == ["C2"]
+    assert sorted(snapshot["days"]) == ["2025-01-02", "2025-01-03"]
+    assert tracker.get_agent_usage("AgentJamal").calls == 4
+
+
+def test_estimate_cost_separates_cached_tokens():
+    """Test cost estimate prices cached prompt tokens separately."""
+    tracker = UsageTracker(input_cost_per_mtok=1.0, output_cost_per_mtok=2.0, cached_cost_per_mtok=0.5)
+
+    cost = tracker.estimate_cost(TokenUsage(1_000_000, 1_000_000, 500_000, 1))
+
+    assert cost == 0.5 + 0.25 + 2.0
@@ -0,0 +1,55 @@
+"""Unit tests for the in-memory debate transcript."""
+
+from src.llm.tokens import estimate_tokens
+from src.orchestrator import DebateCheckpoint, PromptBudget, Transcript, Utterance
+
+
+def _transcript():
+    return Transcript([
+        Utterance(1, "jamal", "찬성합니다", "proposal"),
+        Utterance(1, "james", "요약합니다", "summary"),
+        Utterance(1, "ryan", "반대합니다", "rebuttal"),
+        Utterance(2, "jamal", "다시 찬성합니다", "proposal"),
+    ])
+
+
+def test_render_views_and_windows():
+    """Test full, per-speaker and windowed prompts."""
+    transcript = _transcript()
+
+    assert transcript.render("주제: 원격 근무", "요약하세요.") == (
+        "주제: 원격 근무\n\nAgentJamal: 찬성합니다\n\nAgentJames: 요약합니다\n\n"
+        "AgentRyan: 반대합니다\n\nAgentJamal: 다시 찬성합니다\n\n요약하세요."
+    )
+    assert transcript.render("주제", speakers=["jamal", "ryan"], last=2) == (
+        "주제\n\nAgentRyan: 반대합니다\n\nAgentJamal: 다시 찬성합니다"
+    )
+    assert transcript.render("주제", last=0) == "주제"
+    assert [u.node for u in transcript.in_round(1)] == ["proposal", "summary", "rebuttal"]
+    assert transcript.tokens == sum(estimate_tokens(u.line) for u in transcript)
+
+
+def test_render_with_budget_matches_plain_render_when_it_fits():
+    """Test the budget path uses cached sizes and only trims when needed."""
+    transcript = _transcript()
+    for i in range(20):
+        transcript.append(Utterance(3, "ryan", f"{i}번째 긴 반론입니다. " + "근거 " * 100))
+
+    plain = transcript.render("주제", "결론을 내세요.")
+    assert transcript.render("주제", "결론을 내세요.", budget=PromptBudget(100_000)) == plain
+
+    trimmed = transcript.render("주제", "결론을 내세요.", budget=PromptBudget(1500))
+    assert estimate_tokens(trimmed) <= 1500
+    assert trimmed.startswith("주제\n\n(앞선 발언") and trimmed.endswith("결론을 내세요.")
+
+
+def test_checkpoint_round_trip_keeps_utterances():
+    """Test checkpoints store plain dicts and rebuild the transcript."""
+    checkpoint = DebateCheckpoint(channel="C1", thread_ts="T1", user_id="U1", topic="주제", utterances=_transcript())
+
+    data = checkpoint.to_dict()
+    assert data["utterances"][0] == {"round": 1, "speaker": "jamal", "text": "찬성합니다", "node": "proposal"}
+
+    restored = DebateCheckpoint.from_dict(data)
+    assert restored.utterances == checkpoint.utterances
+    assert restored.utterances[-1].line == "AgentJamal: 다시 찬성합니다"
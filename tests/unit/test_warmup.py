@@ -0,0 +1,71 @@
+"""Unit tests for boot-time warm-up."""
+
+import urllib.error
+import urllib.request
+from unittest.mock import Mock
+import pytest
+from src.bot.warmup import WarmUp
+from src.utils.metrics import MetricsRegistry, start_metrics_server
+
+
+def _agent(name):
+    agent = Mock()
+    agent.agent_name = name
+    agent.warm_up.return_value = 0.1
+    agent.prime_model.return_value = True
+    return agent
+
+
+def test_warmup_resolves_bot_ids_and_primes_agents():
+    """Test warm-up calls auth.test per client and primes every agent."""
+    jamal_client = Mock()
+    jamal_client.auth_test.return_value = {"user_id": "UJAMAL"}
+    ryan_client = Mock()
+    ryan_client.auth_test.return_value = {"user_id": "URYAN"}
+    agents = [_agent("AgentJamal"), _agent("AgentRyan")]
+    warmup = WarmUp({"jamal": jamal_client, "ryan": ryan_client}, agents)
+
+    assert not warmup.is_ready()
+    timings = warmup.run()
+
+    assert warmup.is_ready()
+    assert warmup.bot_user_ids == {"jamal": "UJAMAL", "ryan": "URYAN"}
+    for agent in agents:
+        agent.warm_up.assert_called_once()
+        agent.prime_model.assert_called_once()
+    assert set(timings) == {
+        "slack.jamal", "slack.ryan",
+        "agent.AgentJamal", "model.AgentJamal",
+        "agent.AgentRyan", "model.AgentRyan"
+    }
+
+
+def test_warmup_failures_do_not_block_readiness():
+    """Test a failing step is logged and the bot still becomes ready."""
+    client = Mock()
+    client.auth_test.side_effect = RuntimeError("network down")
+    agent = _agent("AgentJames")
+    warmup = WarmUp({"james": client}, [agent], prime_model=False)
+
+    warmup.run()
+
+    assert warmup.wait_ready(timeout=1)
+    assert "james" not in warmup.bot_user_ids
+    agent.prime_model.assert_not_called()
+
+
+def test_ready_endpoint_reflects_warmup_state():
+    """Test /ready returns 503 until warm-up finishes."""
+    warmup = WarmUp({}, [])
+    server = start_metrics_server(0, registry=MetricsRegistry(), ready=warmup.ready)
+    url = f"http://127.0.0.1:{server.server_address[1]}/ready"
+    try:
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(url)
+        assert exc_info.value.code == 503
+
+        warmup.run()
+        with urllib.request.urlopen(url) as response:
+            assert response.status == 200
+    finally:
+        server.shutdown()